@@ -0,0 +1,194 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Command line interface for running the benchmarks."""
+
+import click
+
+from .compression import PAYLOAD_KINDS, compression_ratio, make_payload, run_compression_benchmark
+from .connection import CONNECTION_CASES, run_connection_benchmark
+from .plugins import DEFAULT_NUM_ENTRY_POINTS, run_plugins_benchmark
+from .shared_memory import run_shared_memory_benchmark
+from .transport import DEFAULT_MESSAGE_SIZES, format_results, run_transport_benchmark
+
+
+@click.group()
+@click.help_option("--help", "-h")
+def cli() -> None:
+    """Run benchmarks of the PyAnsys communication layers."""
+
+
+@cli.command()
+@click.option(
+    "--transport-mode",
+    "transport_modes",
+    multiple=True,
+    type=click.Choice(["insecure", "uds", "wnua", "mtls"], case_sensitive=False),
+    help="Transport mode to benchmark. Can be given multiple times. Defaults to all available modes.",
+)
+@click.option(
+    "--size",
+    "message_sizes",
+    multiple=True,
+    type=int,
+    default=DEFAULT_MESSAGE_SIZES,
+    show_default=True,
+    help="Message size in bytes. Can be given multiple times.",
+)
+@click.option("--iterations", type=int, default=100, show_default=True, help="Number of measured messages per case.")
+@click.option("--warmup", type=int, default=10, show_default=True, help="Number of warmup messages per case.")
+def transport(transport_modes: tuple[str, ...], message_sizes: tuple[int, ...], iterations: int, warmup: int) -> None:
+    """Compare the latency and throughput of the gRPC transport modes."""
+    results = run_transport_benchmark(
+        transport_modes=transport_modes or None,
+        message_sizes=message_sizes,
+        iterations=iterations,
+        warmup=warmup,
+    )
+    click.echo(format_results(results))
+
+
+@cli.command()
+@click.option(
+    "--transport-mode",
+    type=click.Choice(["insecure", "uds", "wnua", "mtls"], case_sensitive=False),
+    default="insecure",
+    show_default=True,
+    help="Transport mode of the channel.",
+)
+@click.option(
+    "--compression",
+    "compressions",
+    multiple=True,
+    type=click.Choice(["none", "gzip", "deflate"], case_sensitive=False),
+    default=("none", "gzip", "deflate"),
+    show_default=True,
+    help="Compression algorithm. Can be given multiple times.",
+)
+@click.option(
+    "--payload",
+    "payload_kinds",
+    multiple=True,
+    type=click.Choice(PAYLOAD_KINDS),
+    default=PAYLOAD_KINDS,
+    show_default=True,
+    help="Kind of payload. Can be given multiple times.",
+)
+@click.option(
+    "--size",
+    "message_sizes",
+    multiple=True,
+    type=int,
+    default=DEFAULT_MESSAGE_SIZES,
+    show_default=True,
+    help="Message size in bytes. Can be given multiple times.",
+)
+@click.option("--iterations", type=int, default=100, show_default=True, help="Number of measured messages per case.")
+@click.option("--warmup", type=int, default=10, show_default=True, help="Number of warmup messages per case.")
+def compression(
+    transport_mode: str,
+    compressions: tuple[str, ...],
+    payload_kinds: tuple[str, ...],
+    message_sizes: tuple[int, ...],
+    iterations: int,
+    warmup: int,
+) -> None:
+    """Compare the latency of calls with and without message compression."""
+    click.echo("Compression ratios (zlib):")
+    for payload_kind in payload_kinds:
+        ratio = compression_ratio(make_payload(payload_kind, max(message_sizes)))
+        click.echo(f"    {payload_kind}: {ratio:.2f}")
+    click.echo("")
+    results = run_compression_benchmark(
+        compressions,
+        payload_kinds,
+        message_sizes,
+        transport_mode=transport_mode,
+        iterations=iterations,
+        warmup=warmup,
+    )
+    click.echo(format_results(results))
+
+
+@cli.command()
+@click.option(
+    "--case",
+    "cases",
+    multiple=True,
+    type=click.Choice(CONNECTION_CASES, case_sensitive=False),
+    help="Connection case to benchmark. Can be given multiple times. Defaults to all available cases.",
+)
+@click.option("--iterations", type=int, default=100, show_default=True, help="Number of measured connections per case.")
+@click.option("--warmup", type=int, default=10, show_default=True, help="Number of warmup connections per case.")
+def connection(cases: tuple[str, ...], iterations: int, warmup: int) -> None:
+    """Compare the time taken to connect a new channel and complete a first call."""
+    results = run_connection_benchmark(cases or None, iterations=iterations, warmup=warmup)
+    click.echo(format_results(results))
+
+
+@cli.command("shared-memory")
+@click.option(
+    "--transport-mode",
+    type=click.Choice(["insecure", "uds", "wnua", "mtls"], case_sensitive=False),
+    default="uds",
+    show_default=True,
+    help="Transport mode of the channel.",
+)
+@click.option(
+    "--size",
+    "message_sizes",
+    multiple=True,
+    type=int,
+    default=DEFAULT_MESSAGE_SIZES,
+    show_default=True,
+    help="Message size in bytes. Can be given multiple times.",
+)
+@click.option("--iterations", type=int, default=100, show_default=True, help="Number of measured messages per case.")
+@click.option("--warmup", type=int, default=10, show_default=True, help="Number of warmup messages per case.")
+def shared_memory(transport_mode: str, message_sizes: tuple[int, ...], iterations: int, warmup: int) -> None:
+    """Compare sending payloads through shared memory with sending them over a stream."""
+    results = run_shared_memory_benchmark(
+        message_sizes, transport_mode=transport_mode, iterations=iterations, warmup=warmup
+    )
+    click.echo(format_results(results))
+
+
+@cli.command()
+@click.option(
+    "--entry-points",
+    "num_entry_points",
+    multiple=True,
+    type=int,
+    default=DEFAULT_NUM_ENTRY_POINTS,
+    show_default=True,
+    help="Number of synthetic entry points. Can be given multiple times.",
+)
+@click.option("--iterations", type=int, default=1000, show_default=True, help="Number of measured lookups per case.")
+@click.option("--warmup", type=int, default=10, show_default=True, help="Number of warmup lookups per case.")
+def plugins(num_entry_points: tuple[int, ...], iterations: int, warmup: int) -> None:
+    """Compare looking up launcher plugins with a linear scan and with an index."""
+    results = run_plugins_benchmark(num_entry_points, iterations=iterations, warmup=warmup)
+    click.echo(format_results(results))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,157 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of message compression for the gRPC transport modes.
+
+Unary calls are made to a local echo server, which compresses its responses
+with the same algorithm as the client. The payloads mimic the data moved by
+product RPCs: mesh coordinates and result fields, as well as random bytes
+which cannot be compressed.
+
+Note that on a local machine, the network bandwidth is rarely the bottleneck,
+so the benchmark mostly shows the CPU cost of compression. The time saved on
+a bandwidth-bound connection can be estimated from the compression ratios.
+"""
+
+from array import array
+from collections.abc import Iterable
+import math
+import os
+import zlib
+
+from .echo import ECHO_UNARY_METHOD, EchoServer
+from .transport import DEFAULT_MESSAGE_SIZES, LatencyResult, measure_latencies
+
+__all__ = ["PAYLOAD_KINDS", "compression_ratio", "make_payload", "run_compression_benchmark"]
+
+PAYLOAD_KINDS = ("mesh", "field", "random")
+"""Kinds of payloads used in the benchmark."""
+
+
+def make_payload(kind: str, size: int) -> bytes:
+    """Create a payload of the given kind and size.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of payload. Options are:
+
+        - "mesh": coordinates of the nodes of a structured hexahedral mesh, as doubles.
+        - "field": smoothly varying nodal result values, as doubles.
+        - "random": random bytes.
+    size : int
+        Size of the payload in bytes.
+
+    Returns
+    -------
+    bytes
+        Payload of the given size.
+    """
+    num_values = size // 8 + 1
+    match kind:
+        case "mesh":
+            # Nodes of an n x n x n grid, with three coordinates per node
+            n = max(2, round((num_values / 3) ** (1 / 3)) + 1)
+            values = array(
+                "d",
+                (coordinate * 0.1 for i in range(n) for j in range(n) for k in range(n) for coordinate in (i, j, k)),
+            )
+        case "field":
+            values = array("d", (math.sin(i * 1e-3) * math.exp(-i * 1e-6) for i in range(num_values)))
+        case "random":
+            return os.urandom(size)
+        case _:
+            raise ValueError(f"Unknown payload kind: {kind}. Valid options are: {', '.join(PAYLOAD_KINDS)}.")
+    return values.tobytes()[:size]
+
+
+def compression_ratio(payload: bytes) -> float:
+    """Get the ratio of the payload size to its size when compressed with zlib.
+
+    Parameters
+    ----------
+    payload : bytes
+        Payload to compress.
+
+    Returns
+    -------
+    float
+        Compression ratio. Values above one mean that compression reduces the size.
+    """
+    return len(payload) / len(zlib.compress(payload))
+
+
+def run_compression_benchmark(
+    compressions: Iterable[str] = ("none", "gzip", "deflate"),
+    payload_kinds: Iterable[str] = PAYLOAD_KINDS,
+    message_sizes: Iterable[int] = DEFAULT_MESSAGE_SIZES,
+    *,
+    transport_mode: str = "insecure",
+    iterations: int = 100,
+    warmup: int = 10,
+) -> list[LatencyResult]:
+    """Benchmark unary calls with and without compression.
+
+    Parameters
+    ----------
+    compressions : Iterable[str]
+        Compression algorithms to benchmark.
+    payload_kinds : Iterable[str]
+        Kinds of payloads to send, see :func:`make_payload`.
+    message_sizes : Iterable[int]
+        Sizes of the messages to send, in bytes.
+    transport_mode : str
+        Transport mode of the channel.
+    iterations : int
+        Number of measured messages per case.
+    warmup : int
+        Number of messages exchanged before the measurement starts.
+
+    Returns
+    -------
+    list[LatencyResult]
+        Results for each compression algorithm, payload kind and message size.
+        The name of each result is ``"<compression>/<payload_kind>"``.
+    """
+    payload_kinds = list(payload_kinds)
+    message_sizes = list(message_sizes)
+    results = []
+    for compression in compressions:
+        with EchoServer(transport_mode, compression=compression) as server:
+            channel = server.create_channel(compression=compression)
+            try:
+                echo = channel.unary_unary(ECHO_UNARY_METHOD)
+                for payload_kind in payload_kinds:
+                    for message_size in message_sizes:
+                        payload = make_payload(payload_kind, message_size)
+                        latencies = measure_latencies(lambda: echo(payload), iterations=iterations, warmup=warmup)
+                        results.append(
+                            LatencyResult.from_latencies(
+                                name=f"{compression}/{payload_kind}",
+                                rpc_type="unary",
+                                message_size=message_size,
+                                latencies=latencies,
+                            )
+                        )
+            finally:
+                channel.close()
+    return results
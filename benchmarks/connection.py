@@ -0,0 +1,107 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the connection setup for the gRPC transport modes.
+
+For each case, a local echo server is started and the time taken to create a
+channel, connect it, and complete a first unary call is measured. This is the
+cost paid by clients which connect to a product for a short interaction.
+"""
+
+from collections.abc import Iterable
+
+from ansys.tools.common import cyberchannel
+
+from .echo import ECHO_UNARY_METHOD, EchoServer, available_transport_modes
+from .transport import LatencyResult, measure_latencies
+
+__all__ = ["CONNECTION_CASES", "available_connection_cases", "run_connection_benchmark"]
+
+CONNECTION_CASES = ("insecure", "uds", "uds-abstract", "wnua", "mtls")
+"""Cases of the connection benchmark.
+
+The "uds-abstract" case uses a Linux abstract-namespace socket, the other
+cases are named after the transport mode.
+"""
+
+# Do not share connections between the channels created during the benchmark,
+# such that each channel has to connect to the server.
+_LOCAL_SUBCHANNEL_POOL_OPTIONS: list[tuple[str, object]] = [("grpc.use_local_subchannel_pool", 1)]
+
+
+def available_connection_cases() -> list[str]:
+    """Get the connection cases which can be benchmarked on this machine.
+
+    Returns
+    -------
+    list[str]
+        Cases for which both a server and a client can be created.
+    """
+    cases = available_transport_modes()
+    if "uds" in cases and cyberchannel.get_transport_capabilities().abstract_uds:
+        cases.insert(cases.index("uds") + 1, "uds-abstract")
+    return cases
+
+
+def _connect(server: EchoServer) -> None:
+    channel = server.create_channel(grpc_options=_LOCAL_SUBCHANNEL_POOL_OPTIONS)
+    try:
+        channel.unary_unary(ECHO_UNARY_METHOD)(b"", wait_for_ready=True)
+    finally:
+        channel.close()
+
+
+def run_connection_benchmark(
+    cases: Iterable[str] | None = None,
+    *,
+    iterations: int = 100,
+    warmup: int = 10,
+) -> list[LatencyResult]:
+    """Benchmark the connection setup of the given cases.
+
+    Parameters
+    ----------
+    cases : Iterable[str] | None
+        Cases to benchmark, from :data:`CONNECTION_CASES`. By default `None`
+        and thus all cases available on this machine are benchmarked.
+    iterations : int
+        Number of measured connections per case.
+    warmup : int
+        Number of connections made before the measurement starts.
+
+    Returns
+    -------
+    list[LatencyResult]
+        Results of each case, with the "connect" RPC type.
+    """
+    if cases is None:
+        cases = available_connection_cases()
+
+    results = []
+    for case in cases:
+        if case not in CONNECTION_CASES:
+            raise ValueError(f"Unknown connection case: {case}. Valid options are: {', '.join(CONNECTION_CASES)}.")
+        transport_mode, _, variant = case.partition("-")
+        with EchoServer(transport_mode, uds_abstract=variant == "abstract") as server:
+            latencies = measure_latencies(lambda: _connect(server), iterations=iterations, warmup=warmup)
+        results.append(LatencyResult.from_latencies(name=case, rpc_type="connect", message_size=0, latencies=latencies))
+    return results
@@ -0,0 +1,268 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Local gRPC echo server used by the benchmarks and the tests.
+
+The server does not depend on generated protobuf code: the messages are
+raw bytes, which are echoed back to the client unchanged.
+"""
+
+from collections.abc import Iterator
+from concurrent import futures
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+import tempfile
+from typing import Any
+import uuid
+import warnings
+
+import grpc
+
+from ansys.tools.common import cyberchannel
+from ansys.tools.common.shared_memory import SharedMemoryHandle, SharedMemoryRing
+
+__all__ = [
+    "EchoServer",
+    "ECHO_UNARY_METHOD",
+    "ECHO_STREAM_METHOD",
+    "CONCAT_STREAM_METHOD",
+    "SINK_STREAM_METHOD",
+    "SHARED_MEMORY_SINK_STREAM_METHOD",
+    "available_transport_modes",
+]
+
+_SERVICE_NAME = "benchmarks.Echo"
+ECHO_UNARY_METHOD = f"/{_SERVICE_NAME}/Unary"
+"""Full name of the unary echo method."""
+ECHO_STREAM_METHOD = f"/{_SERVICE_NAME}/Stream"
+"""Full name of the bidirectional streaming echo method."""
+CONCAT_STREAM_METHOD = f"/{_SERVICE_NAME}/Concat"
+"""Full name of the client streaming method replying with the concatenation of the requests."""
+SINK_STREAM_METHOD = f"/{_SERVICE_NAME}/Sink"
+"""Full name of the bidirectional streaming method replying with an empty message to each request."""
+SHARED_MEMORY_SINK_STREAM_METHOD = f"/{_SERVICE_NAME}/SharedMemorySink"
+"""Full name of the bidirectional streaming method reading payloads from shared memory.
+
+Each request is a serialized :class:`~ansys.tools.common.shared_memory.SharedMemoryHandle`.
+The payload is read, released, and an empty message is sent as reply.
+"""
+
+# Benchmarks may send arbitrarily large messages, so lift gRPC's size limits.
+UNLIMITED_MESSAGE_SIZE_OPTIONS: list[tuple[str, object]] = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+
+def _echo_unary(request: bytes, context: grpc.ServicerContext) -> bytes:
+    return request
+
+
+def _echo_stream(request_iterator: Iterator[bytes], context: grpc.ServicerContext) -> Iterator[bytes]:
+    yield from request_iterator
+
+
+def _concat_stream(request_iterator: Iterator[bytes], context: grpc.ServicerContext) -> bytes:
+    return b"".join(request_iterator)
+
+
+def _sink_stream(request_iterator: Iterator[bytes], context: grpc.ServicerContext) -> Iterator[bytes]:
+    for _ in request_iterator:
+        yield b""
+
+
+def _shared_memory_sink_stream(request_iterator: Iterator[bytes], context: grpc.ServicerContext) -> Iterator[bytes]:
+    rings: dict[str, SharedMemoryRing] = {}
+    try:
+        for request in request_iterator:
+            handle = SharedMemoryHandle.from_bytes(request)
+            if handle.name not in rings:
+                rings[handle.name] = SharedMemoryRing.attach(handle.name)
+            ring = rings[handle.name]
+            with ring.read(handle):
+                pass
+            ring.release(handle)
+            yield b""
+    finally:
+        for ring in rings.values():
+            ring.close()
+
+
+@dataclass
+class EchoServer:
+    """Echo server listening on a local endpoint for the given transport mode.
+
+    Use the server as a context manager. On entry, the server is started and
+    :meth:`create_channel` can be used to connect to it through
+    :func:`ansys.tools.common.cyberchannel.create_channel`.
+
+    Parameters
+    ----------
+    transport_mode : str
+        Transport mode of the server. Options are "insecure", "uds", "wnua" and "mtls".
+    max_workers : int
+        Number of threads handling requests in the server.
+    compression : str | None
+        Compression algorithm for the responses of the server.
+        Options are "gzip", "deflate" and "none". By default `None` and thus
+        responses are not compressed.
+    uds_abstract : bool
+        Whether the server listens on a Linux abstract-namespace socket
+        instead of a socket file, for the "uds" transport mode.
+    health_service : bool
+        Whether the server provides the gRPC health checking service, if the
+        ``grpcio-health-checking`` package is installed.
+    """
+
+    transport_mode: str
+    max_workers: int = 4
+    compression: str | None = None
+    uds_abstract: bool = False
+    health_service: bool = True
+    _exit_stack: ExitStack = field(default_factory=ExitStack, init=False, repr=False)
+    _channel_kwargs: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __enter__(self) -> "EchoServer":
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start the server."""
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self.max_workers),
+            options=UNLIMITED_MESSAGE_SIZE_OPTIONS,
+            compression=cyberchannel._parse_compression(self.compression),
+        )
+        server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    _SERVICE_NAME,
+                    {
+                        "Unary": grpc.unary_unary_rpc_method_handler(_echo_unary),
+                        "Stream": grpc.stream_stream_rpc_method_handler(_echo_stream),
+                        "Concat": grpc.stream_unary_rpc_method_handler(_concat_stream),
+                        "Sink": grpc.stream_stream_rpc_method_handler(_sink_stream),
+                        "SharedMemorySink": grpc.stream_stream_rpc_method_handler(_shared_memory_sink_stream),
+                    },
+                ),
+            )
+        )
+        try:
+            from grpc_health.v1 import health, health_pb2_grpc  # type: ignore[import-untyped]
+        except ImportError:
+            pass
+        else:
+            if self.health_service:
+                health_pb2_grpc.add_HealthServicer_to_server(health.HealthServicer(), server)
+
+        self._channel_kwargs = self._add_port(server)
+        server.start()
+        self._exit_stack.callback(server.stop, grace=None)
+
+    def stop(self) -> None:
+        """Stop the server and clean up the temporary files it uses."""
+        self._exit_stack.close()
+
+    def create_channel(self, **extra_kwargs: Any) -> grpc.Channel:
+        """Create a channel connected to the server.
+
+        Parameters
+        ----------
+        extra_kwargs :
+            Extra keyword arguments passed to :func:`ansys.tools.common.cyberchannel.create_channel`.
+
+        Returns
+        -------
+        grpc.Channel
+            Channel connected to the server.
+        """
+        grpc_options = UNLIMITED_MESSAGE_SIZE_OPTIONS + list(extra_kwargs.pop("grpc_options", None) or [])
+        with warnings.catch_warnings():
+            # Silence the warning emitted for insecure channels
+            warnings.simplefilter("ignore")
+            return cyberchannel.create_channel(
+                **self._channel_kwargs,
+                **extra_kwargs,
+                grpc_options=grpc_options,
+            )
+
+    def _make_tempdir(self) -> Path:
+        return Path(self._exit_stack.enter_context(tempfile.TemporaryDirectory()))
+
+    def _add_port(self, server: grpc.Server) -> dict[str, Any]:
+        match self.transport_mode.lower():
+            case "insecure" | "wnua":
+                port = server.add_insecure_port("localhost:0")
+                return {"transport_mode": self.transport_mode, "host": "localhost", "port": port}
+            case "uds" if self.uds_abstract:
+                uds_service = f"ansys-tools-common-echo-{uuid.uuid4().hex}"
+                server.add_insecure_port(f"unix-abstract:{uds_service}")
+                return {"transport_mode": "uds", "uds_service": uds_service, "uds_abstract": True}
+            case "uds":
+                uds_file = self._make_tempdir() / "echo.sock"
+                server.add_insecure_port(f"unix:{uds_file}")
+                return {"transport_mode": "uds", "uds_full_path": uds_file}
+            case "mtls":
+                from ansys.tools.common.utils.certificates import generate_test_certificates
+
+                certs_dir = self._make_tempdir()
+                generate_test_certificates(output_dir=certs_dir, key_size=2048)
+                credentials = grpc.ssl_server_credentials(
+                    [((certs_dir / "server.key").read_bytes(), (certs_dir / "server.crt").read_bytes())],
+                    root_certificates=(certs_dir / "ca.crt").read_bytes(),
+                    require_client_auth=True,
+                )
+                port = server.add_secure_port("localhost:0", credentials)
+                return {"transport_mode": "mtls", "host": "localhost", "port": port, "certs_dir": certs_dir}
+            case _:
+                raise ValueError(
+                    f"Unknown transport mode: {self.transport_mode}. "
+                    "Valid options are: 'insecure', 'uds', 'wnua', 'mtls'."
+                )
+
+
+def available_transport_modes() -> list[str]:
+    """Get the transport modes which can be benchmarked on this machine.
+
+    Returns
+    -------
+    list[str]
+        Transport modes for which both a server and a client can be created.
+    """
+    modes = ["insecure"]
+    if cyberchannel.is_uds_supported():
+        modes.append("uds")
+    if cyberchannel._IS_WINDOWS:
+        modes.append("wnua")
+    try:
+        import cryptography  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        modes.append("mtls")
+    return modes
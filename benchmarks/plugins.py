@@ -0,0 +1,113 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the launcher plugin lookup.
+
+Synthetic entry points are created for many products, and the time taken to
+get the launcher class of the last one is measured, both with a linear scan
+over the entry points, and with the index used by the local product launcher.
+The linear scan loads the entry point on each lookup, as the launcher did
+before the index was introduced.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import importlib.metadata
+
+from ansys.tools.common.launcher import _plugins
+from ansys.tools.common.launcher.interface import LauncherProtocol
+
+from .transport import LatencyResult, measure_latencies
+
+__all__ = ["DEFAULT_NUM_ENTRY_POINTS", "run_plugins_benchmark"]
+
+DEFAULT_NUM_ENTRY_POINTS = (10, 100, 1000)
+"""Default numbers of synthetic entry points."""
+
+
+@dataclass
+class _SyntheticConfig:
+    pass
+
+
+class _SyntheticLauncher(LauncherProtocol[_SyntheticConfig]):
+    CONFIG_MODEL = _SyntheticConfig
+
+
+def _make_entry_points(num_entry_points: int) -> tuple[importlib.metadata.EntryPoint, ...]:
+    return tuple(
+        importlib.metadata.EntryPoint(
+            name=f"product{i}.direct",
+            value=f"{__name__}:_SyntheticLauncher",
+            group=_plugins.LAUNCHER_ENTRY_POINT,
+        )
+        for i in range(num_entry_points)
+    )
+
+
+def _linear_lookup(entry_points: Iterable[importlib.metadata.EntryPoint], name: str) -> object:
+    for entry_point in entry_points:
+        if entry_point.name == name:
+            return entry_point.load()
+    raise KeyError(name)
+
+
+def run_plugins_benchmark(
+    num_entry_points: Iterable[int] = DEFAULT_NUM_ENTRY_POINTS,
+    *,
+    iterations: int = 1000,
+    warmup: int = 10,
+) -> list[LatencyResult]:
+    """Benchmark the launcher plugin lookup for the given numbers of entry points.
+
+    Parameters
+    ----------
+    num_entry_points : Iterable[int]
+        Numbers of synthetic entry points.
+    iterations : int
+        Number of measured lookups per case.
+    warmup : int
+        Number of lookups made before the measurement starts.
+
+    Returns
+    -------
+    list[LatencyResult]
+        Results of each case, named "linear/<N>" and "index/<N>" for ``N``
+        entry points, with the "lookup" RPC type.
+    """
+    results = []
+    for count in num_entry_points:
+        entry_points = _make_entry_points(count)
+        name = entry_points[-1].name
+        index = _plugins._EntryPointIndex(entry_points)
+        cases = {
+            "linear": lambda: _linear_lookup(entry_points, name),
+            "index": lambda: index.load_by_name(name),
+        }
+        for case, lookup in cases.items():
+            latencies = measure_latencies(lookup, iterations=iterations, warmup=warmup)
+            results.append(
+                LatencyResult.from_latencies(
+                    name=f"{case}/{count}", rpc_type="lookup", message_size=0, latencies=latencies
+                )
+            )
+    return results
@@ -0,0 +1,98 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the shared-memory side channel against plain gRPC streaming.
+
+Payloads are sent one at a time over a stream to a local server, which
+replies with an empty message once it has access to the payload. In the
+"stream" case, the payload is sent in the gRPC messages. In the
+"shared-memory" case, the payload is written to a
+:class:`~ansys.tools.common.shared_memory.SharedMemoryRing`, and only its
+handle is sent in the gRPC messages.
+"""
+
+from collections.abc import Iterable
+import os
+
+from ansys.tools.common.shared_memory import SharedMemoryRing
+
+from .echo import SHARED_MEMORY_SINK_STREAM_METHOD, SINK_STREAM_METHOD, EchoServer
+from .transport import DEFAULT_MESSAGE_SIZES, LatencyResult, measure_ping_pong
+
+__all__ = ["run_shared_memory_benchmark"]
+
+
+def run_shared_memory_benchmark(
+    message_sizes: Iterable[int] = DEFAULT_MESSAGE_SIZES,
+    *,
+    transport_mode: str = "uds",
+    iterations: int = 100,
+    warmup: int = 10,
+) -> list[LatencyResult]:
+    """Benchmark sending payloads through shared memory rather than in gRPC messages.
+
+    Parameters
+    ----------
+    message_sizes : Iterable[int]
+        Sizes of the payloads to send, in bytes.
+    transport_mode : str
+        Transport mode of the gRPC channel. The server always runs on the
+        local machine.
+    iterations : int
+        Number of measured payloads per case.
+    warmup : int
+        Number of payloads sent before the measurement starts.
+
+    Returns
+    -------
+    list[LatencyResult]
+        Results named "<transport_mode>/stream" and "<transport_mode>/shared-memory"
+        for each message size.
+    """
+    message_sizes = list(message_sizes)
+
+    results = []
+    with (
+        EchoServer(transport_mode) as server,
+        SharedMemoryRing(max(2 * max(message_sizes), 1024**2)) as ring,
+    ):
+        channel = server.create_channel()
+        try:
+            for message_size in message_sizes:
+                payload = os.urandom(message_size)
+                cases = (
+                    ("stream", SINK_STREAM_METHOD, lambda: payload),
+                    ("shared-memory", SHARED_MEMORY_SINK_STREAM_METHOD, lambda: ring.write(payload).to_bytes()),
+                )
+                for case, method, make_request in cases:
+                    latencies = measure_ping_pong(channel, method, make_request, iterations=iterations, warmup=warmup)
+                    results.append(
+                        LatencyResult.from_latencies(
+                            name=f"{transport_mode}/{case}",
+                            rpc_type="stream",
+                            message_size=message_size,
+                            latencies=latencies,
+                        )
+                    )
+        finally:
+            channel.close()
+    return results
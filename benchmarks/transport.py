@@ -0,0 +1,281 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the gRPC transport modes supported by ``cyberchannel``.
+
+For each transport mode and message size, a local echo server is started
+and the round-trip latency of unary calls and of messages exchanged over
+a bidirectional stream is measured.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+import os
+import queue
+import statistics
+import time
+
+import grpc
+
+from .echo import ECHO_STREAM_METHOD, ECHO_UNARY_METHOD, EchoServer, available_transport_modes
+
+__all__ = [
+    "DEFAULT_MESSAGE_SIZES",
+    "LatencyResult",
+    "format_results",
+    "measure_latencies",
+    "measure_ping_pong",
+    "run_transport_benchmark",
+]
+
+DEFAULT_MESSAGE_SIZES = (64, 4 * 1024, 256 * 1024, 4 * 1024**2)
+"""Default message sizes in bytes."""
+
+
+@dataclass(frozen=True)
+class LatencyResult:
+    """Latency and throughput measured for one benchmark case.
+
+    All latencies are given in seconds, throughputs are given per second.
+    """
+
+    name: str
+    rpc_type: str
+    message_size: int
+    iterations: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    messages_per_second: float
+    bytes_per_second: float
+
+    @classmethod
+    def from_latencies(
+        cls, *, name: str, rpc_type: str, message_size: int, latencies: Sequence[float]
+    ) -> "LatencyResult":
+        """Compute the statistics from a sequence of latencies.
+
+        Parameters
+        ----------
+        name :
+            Name of the benchmark case, for instance the transport mode.
+        rpc_type :
+            Type of RPC that was measured.
+        message_size :
+            Size of the payload of each message, in bytes.
+        latencies :
+            Round-trip latency of each message, in seconds.
+        """
+        if len(latencies) > 1:
+            percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            p50, p90, p99 = percentiles[49], percentiles[89], percentiles[98]
+        else:
+            p50 = p90 = p99 = latencies[0]
+        total_time = sum(latencies)
+        messages_per_second = len(latencies) / total_time if total_time > 0 else float("inf")
+        return cls(
+            name=name,
+            rpc_type=rpc_type,
+            message_size=message_size,
+            iterations=len(latencies),
+            mean=statistics.fmean(latencies),
+            p50=p50,
+            p90=p90,
+            p99=p99,
+            messages_per_second=messages_per_second,
+            bytes_per_second=messages_per_second * message_size,
+        )
+
+
+def measure_latencies(call: Callable[[], object], *, iterations: int, warmup: int = 0) -> list[float]:
+    """Measure the time taken by repeated invocations of a function.
+
+    Parameters
+    ----------
+    call :
+        Function to measure.
+    iterations :
+        Number of measured invocations.
+    warmup :
+        Number of invocations performed before the measurement starts.
+
+    Returns
+    -------
+    list[float]
+        Time in seconds taken by each measured invocation.
+    """
+    for _ in range(warmup):
+        call()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _measure_unary(channel: grpc.Channel, payload: bytes, *, iterations: int, warmup: int) -> list[float]:
+    echo = channel.unary_unary(ECHO_UNARY_METHOD)
+    return measure_latencies(lambda: echo(payload), iterations=iterations, warmup=warmup)
+
+
+def _measure_stream(channel: grpc.Channel, payload: bytes, *, iterations: int, warmup: int) -> list[float]:
+    return measure_ping_pong(channel, ECHO_STREAM_METHOD, lambda: payload, iterations=iterations, warmup=warmup)
+
+
+def measure_ping_pong(
+    channel: grpc.Channel, method: str, make_request: Callable[[], bytes], *, iterations: int, warmup: int = 0
+) -> list[float]:
+    """Measure the round-trip latency of messages exchanged one at a time over a stream.
+
+    Parameters
+    ----------
+    channel :
+        Channel connected to the server.
+    method :
+        Full name of the bidirectional streaming method.
+    make_request :
+        Function creating each request message. Its run time is included in the latency.
+    iterations :
+        Number of measured messages.
+    warmup :
+        Number of messages exchanged before the measurement starts.
+
+    Returns
+    -------
+    list[float]
+        Round-trip latency in seconds of each measured message.
+    """
+    # Exchange messages one at a time over a single stream, such that the
+    # latency of each message can be measured.
+    requests: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+
+    def request_iterator() -> Iterator[bytes]:
+        while (request := requests.get()) is not None:
+            yield request
+
+    responses = channel.stream_stream(method)(request_iterator())
+
+    def ping_pong() -> None:
+        requests.put(make_request())
+        next(responses)
+
+    try:
+        return measure_latencies(ping_pong, iterations=iterations, warmup=warmup)
+    finally:
+        requests.put(None)
+        responses.cancel()
+
+
+def run_transport_benchmark(
+    transport_modes: Iterable[str] | None = None,
+    message_sizes: Iterable[int] = DEFAULT_MESSAGE_SIZES,
+    *,
+    iterations: int = 100,
+    warmup: int = 10,
+) -> list[LatencyResult]:
+    """Benchmark unary and streaming RPCs over the given transport modes.
+
+    Parameters
+    ----------
+    transport_modes : Iterable[str] | None
+        Transport modes to benchmark. By default `None` and thus all
+        transport modes available on this machine are benchmarked.
+        The "mtls" mode requires the ``cryptography`` package to generate
+        the test certificates.
+    message_sizes : Iterable[int]
+        Sizes of the messages to send, in bytes.
+    iterations : int
+        Number of measured messages per case.
+    warmup : int
+        Number of messages exchanged before the measurement starts.
+
+    Returns
+    -------
+    list[LatencyResult]
+        Results of each transport mode, RPC type and message size.
+    """
+    if transport_modes is None:
+        transport_modes = available_transport_modes()
+    message_sizes = list(message_sizes)
+
+    results = []
+    for transport_mode in transport_modes:
+        with EchoServer(transport_mode) as server:
+            channel = server.create_channel()
+            try:
+                for message_size in message_sizes:
+                    payload = os.urandom(message_size)
+                    for rpc_type, measure in (("unary", _measure_unary), ("stream", _measure_stream)):
+                        latencies = measure(channel, payload, iterations=iterations, warmup=warmup)
+                        results.append(
+                            LatencyResult.from_latencies(
+                                name=transport_mode,
+                                rpc_type=rpc_type,
+                                message_size=message_size,
+                                latencies=latencies,
+                            )
+                        )
+            finally:
+                channel.close()
+    return results
+
+
+def _format_size(num_bytes: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.0f} GiB"
+
+
+def format_results(results: Iterable[LatencyResult]) -> str:
+    """Format benchmark results as a plain-text table.
+
+    Parameters
+    ----------
+    results :
+        Results to format.
+
+    Returns
+    -------
+    str
+        Table with one row per result. Latencies are given in microseconds.
+    """
+    header = ("case", "rpc", "size", "p50 [us]", "p90 [us]", "p99 [us]", "msg/s", "throughput/s")
+    rows = [header]
+    for result in results:
+        rows.append(
+            (
+                result.name,
+                result.rpc_type,
+                _format_size(result.message_size),
+                f"{result.p50 * 1e6:.1f}",
+                f"{result.p90 * 1e6:.1f}",
+                f"{result.p99 * 1e6:.1f}",
+                f"{result.messages_per_second:.0f}",
+                _format_size(result.bytes_per_second),
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
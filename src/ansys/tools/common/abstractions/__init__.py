@@ -22,5 +22,5 @@
 
 """Initialization module for abstractions."""
 
-from .connection import AbstractGRPCConnection  # noqa F401
+from .connection import AbstractAsyncGRPCConnection, AbstractGRPCConnection  # noqa F401
 from .launcher import LauncherProtocol  # noqa F401
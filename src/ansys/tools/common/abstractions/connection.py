@@ -23,6 +23,9 @@
 """Module for abstract connection class."""
 
 from abc import ABC, abstractmethod
+import asyncio
+import threading
+from typing import Any, Protocol
 
 try:
     import grpc
@@ -33,10 +36,42 @@ except ImportError:  # pragma: no cover
         "grpc module is not available - reach out to the library maintainers to include it into their dependencies"
     )
 
+# Default interval and timeout, in seconds, of the checks made by the health monitor
+_HEALTH_CHECK_INTERVAL = 5.0
+_HEALTH_CHECK_TIMEOUT = 1.0
+# Bounds of the delay, in seconds, before reconnecting to an unhealthy server
+_RECONNECT_MIN_BACKOFF = 0.1
+_RECONNECT_MAX_BACKOFF = 10.0
+# Default delay, in seconds, before a replaced or closed channel is closed
+_CHANNEL_CLOSE_GRACE = 1.0
+
+
+class _TransportOptions(Protocol):
+    """Options which create a gRPC channel, such as the launcher transport options."""
+
+    def create_channel(self, **extra_kwargs: Any) -> Any:
+        """Create a gRPC channel."""
+        ...  # pragma: no cover
+
 
 class AbstractGRPCConnection(ABC):
     """Abstract class for managing gRPC connections.
 
+    The gRPC channel is created on first access of ``_channel`` and reused
+    afterwards. Its connectivity state is tracked to implement ``is_closed``.
+    The channel is created through :mod:`ansys.tools.common.cyberchannel`
+    with the ``_transport_options`` of the connection, or with an insecure
+    connection to ``_host`` and ``_port`` if they are not set. In the latter
+    case, if ``_uds_service`` is set and ``_host`` is local, a UDS socket
+    of this service on which the server is listening is preferred.
+    Implementations typically call ``_start_health_monitor`` in ``connect``,
+    to check the health of the server in the background and reconnect with
+    backoff when it is unhealthy, and ``_close_channel`` in ``close``.
+
+    When the channel is replaced or closed, calls which are in progress on it
+    are given ``_channel_close_grace`` seconds to complete. The channel is then
+    closed in the background, which cancels the calls which are still running.
+
     Parameters
     ----------
     host : str
@@ -45,6 +80,33 @@ class AbstractGRPCConnection(ABC):
         Port where the gRPC server is listening.
     """
 
+    _channel_options: list[tuple[str, object]] | None = None
+    """gRPC channel options used by the default ``_create_channel`` implementation."""
+
+    _transport_options: _TransportOptions | None = None
+    """Transport options used by the default ``_create_channel`` implementation.
+
+    Any object with a ``create_channel(grpc_options=..., aio=...)`` method can be used,
+    such as the transport options of :mod:`ansys.tools.common.launcher.grpc_transport`.
+    """
+
+    _uds_service: str | None = None
+    """UDS service name of the server, to prefer UDS for local connections."""
+
+    _uds_dir: str | None = None
+    """Directory of the UDS socket, by default the "~/.conn" folder."""
+
+    _uds_id: str | None = None
+    """Optional ID of the UDS socket."""
+
+    _channel_close_grace: float = _CHANNEL_CLOSE_GRACE
+    """Time in seconds given to the calls on a replaced or closed channel to complete."""
+
+    __channel: grpc.Channel | None = None
+    __connectivity_state: grpc.ChannelConnectivity | None = None
+    __health_monitor: tuple[threading.Thread, threading.Event] | None = None
+    __is_healthy: bool | None = None
+
     @abstractmethod
     def __init__(self, host: str, port: str) -> None:
         """Initialize the gRPC connection with host and port."""
@@ -87,9 +149,188 @@ class AbstractGRPCConnection(ABC):
         self.__port = value
 
     @property
-    def _channel(self, options: list = None) -> grpc.Channel:
-        """Return the gRPC channel."""
-        return grpc.insecure_channel(f"{self._host}:{self._port}", options=options)
+    def _lock(self) -> threading.RLock:
+        """Lock protecting the channel and the health monitor."""
+        # Implementations do not call the base class constructor, so the
+        # lock is created on first use. 'setdefault' is atomic.
+        return self.__dict__.setdefault("_AbstractGRPCConnection__lock", threading.RLock())
+
+    def _create_channel(self) -> grpc.Channel:
+        """Create the gRPC channel.
+
+        Override this method to customize how the channel is created.
+
+        Returns
+        -------
+        grpc.Channel
+            A new gRPC channel to the server.
+        """
+        return _create_default_channel(self, aio=False)
+
+    @property
+    def _channel(self) -> grpc.Channel:
+        """Return the gRPC channel, creating it on first access."""
+        with self._lock:
+            if self.__channel is None:
+                channel = self._create_channel()
+                self.__channel = channel
+                self.__connectivity_state = None
+                channel.subscribe(self.__on_connectivity_change, try_to_connect=True)
+            return self.__channel
+
+    def __on_connectivity_change(self, state: grpc.ChannelConnectivity) -> None:
+        self.__connectivity_state = state
+
+    def _close_channel(self) -> None:
+        """Stop the health monitor, and close the gRPC channel if it was created.
+
+        The channel is closed in the background once the ``_channel_close_grace``
+        period has elapsed.
+        """
+        self._stop_health_monitor()
+        self.__discard_channel()
+
+    def __discard_channel(self) -> None:
+        with self._lock:
+            channel, self.__channel = self.__channel, None
+            self.__connectivity_state = None
+        if channel is not None:
+            channel.unsubscribe(self.__on_connectivity_change)
+            _close_channel_later(channel, self._channel_close_grace)
+
+    def _reconnect(self) -> None:
+        """Replace the gRPC channel by a new one, and call ``_on_reconnect``.
+
+        Calls in progress on the previous channel are cancelled once the
+        ``_channel_close_grace`` period has elapsed.
+        """
+        with self._lock:
+            self.__discard_channel()
+            self._channel
+        self._on_reconnect()
+
+    def _on_reconnect(self) -> None:
+        """Handle the replacement of the gRPC channel after a reconnection.
+
+        Override this method to recreate the stubs bound to the previous channel.
+        """
+
+    def _check_health(self, timeout: float | None = None) -> bool:
+        """Check that the server is healthy.
+
+        The gRPC health checking service of the server is queried if the
+        ``grpcio-health-checking`` package is installed. Otherwise, or if the
+        server does not implement the health checking service, the server
+        is considered healthy if the channel can connect to it.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Timeout in seconds of the check.
+
+        Returns
+        -------
+        bool
+            ``True`` if the server is healthy, ``False`` otherwise.
+        """
+        try:
+            from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse
+            from grpc_health.v1.health_pb2_grpc import HealthStub
+        except ImportError:
+            return self._check_connectivity(timeout)
+        try:
+            response = HealthStub(self._channel).Check(HealthCheckRequest(), timeout=timeout)
+        except grpc.RpcError as exc:
+            if exc.code() == grpc.StatusCode.UNIMPLEMENTED:
+                # The server does not register the health checking service.
+                return self._check_connectivity(timeout)
+            return False
+        return response.status == HealthCheckResponse.ServingStatus.SERVING
+
+    def _check_connectivity(self, timeout: float | None = None) -> bool:
+        """Check that the channel can connect to the server.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Timeout in seconds of the check.
+
+        Returns
+        -------
+        bool
+            ``True`` if the channel is connected, ``False`` otherwise.
+        """
+        try:
+            grpc.channel_ready_future(self._channel).result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            return False
+        return True
+
+    def _start_health_monitor(
+        self, interval: float = _HEALTH_CHECK_INTERVAL, timeout: float = _HEALTH_CHECK_TIMEOUT
+    ) -> None:
+        """Start checking the health of the server in a background thread.
+
+        While the server is unhealthy, it is checked again with an
+        exponentially increasing delay between attempts. If the channel
+        cannot connect to the server, it is replaced by a new one before
+        each attempt. Servers which can be reached but report that they
+        are not serving keep their channel.
+        Does nothing if the health monitor is already running.
+
+        Parameters
+        ----------
+        interval : float
+            Time in seconds between the health checks of a healthy server.
+        timeout : float
+            Timeout in seconds of each health check.
+        """
+        with self._lock:
+            if self.__health_monitor is not None:
+                return
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self.__monitor_health,
+                args=(stop, interval, timeout),
+                name=f"{type(self).__name__}-health-monitor",
+                daemon=True,
+            )
+            self.__health_monitor = (thread, stop)
+            thread.start()
+
+    def _stop_health_monitor(self) -> None:
+        """Stop the health monitor, if it is running."""
+        with self._lock:
+            health_monitor, self.__health_monitor = self.__health_monitor, None
+            self.__is_healthy = None
+        if health_monitor is not None:
+            thread, stop = health_monitor
+            stop.set()
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def __monitor_health(self, stop: threading.Event, interval: float, timeout: float) -> None:
+        backoff = _RECONNECT_MIN_BACKOFF
+        while not stop.is_set():
+            if self._check_health(timeout):
+                self.__is_healthy = True
+                backoff = _RECONNECT_MIN_BACKOFF
+                stop.wait(interval)
+                continue
+            self.__is_healthy = False
+            # Replacing the channel cancels the calls in progress on it, so
+            # only do it if the server cannot be reached.
+            reconnect = not self._check_connectivity(timeout)
+            if stop.wait(backoff):
+                break
+            backoff = min(2 * backoff, _RECONNECT_MAX_BACKOFF)
+            if reconnect:
+                self._reconnect()
+
+    @property
+    def _is_healthy(self) -> bool | None:
+        """Result of the last health check, or ``None`` if the health monitor has not checked the server yet."""
+        return self.__is_healthy
 
     @property
     def is_closed(self) -> bool:
@@ -100,7 +341,205 @@ class AbstractGRPCConnection(ABC):
         bool
             ``True`` if the connection is closed, ``False`` otherwise.
         """
+        with self._lock:
+            return self.__channel is None or self.__connectivity_state != grpc.ChannelConnectivity.READY
+
+
+def _close_channel_later(channel: grpc.Channel, delay: float) -> None:
+    """Close a channel after a delay, without blocking.
+
+    This lets calls in progress on the channel complete. It also gives gRPC
+    the time to stop watching the connectivity state of the channel after
+    it was unsubscribed from, which fails if the channel is closed meanwhile.
+    """
+    timer = threading.Timer(delay, channel.close)
+    timer.daemon = True
+    timer.start()
+
+
+class AbstractAsyncGRPCConnection(ABC):
+    """Abstract class for managing asynchronous gRPC connections.
+
+    This is the ``asyncio`` counterpart of :class:`AbstractGRPCConnection`.
+    The ``grpc.aio`` channel is created through
+    :func:`ansys.tools.common.cyberchannel.create_channel` on first access of
+    ``_channel`` and reused afterwards. The transport options are selected
+    as for :class:`AbstractGRPCConnection`. Implementations typically close it
+    with ``_close_channel`` in ``close``. The connection can be used as an
+    asynchronous context manager, which connects on entry and closes on exit.
+
+    Parameters
+    ----------
+    host : str
+        Host where the gRPC server is running.
+    port : str
+        Port where the gRPC server is listening.
+    """
+
+    _channel_options: list[tuple[str, object]] | None = None
+    """gRPC channel options used by the default ``_create_channel`` implementation."""
+
+    _transport_options: _TransportOptions | None = None
+    """Transport options used by the default ``_create_channel`` implementation.
+
+    Any object with a ``create_channel(grpc_options=..., aio=...)`` method can be used,
+    such as the transport options of :mod:`ansys.tools.common.launcher.grpc_transport`.
+    """
+
+    _uds_service: str | None = None
+    """UDS service name of the server, to prefer UDS for local connections."""
+
+    _uds_dir: str | None = None
+    """Directory of the UDS socket, by default the "~/.conn" folder."""
+
+    _uds_id: str | None = None
+    """Optional ID of the UDS socket."""
+
+    __channel: grpc.aio.Channel | None = None
+
+    @abstractmethod
+    def __init__(self, host: str, port: str) -> None:
+        """Initialize the gRPC connection with host and port."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Establish a connection to the gRPC server."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Disconnect from the gRPC server."""
+        pass  # pragma: no cover
+
+    @property
+    @abstractmethod
+    def service(self):
+        """GRPC stub for making requests."""
+        pass  # pragma: no cover
+
+    async def __aenter__(self) -> "AbstractAsyncGRPCConnection":
+        """Connect to the gRPC server."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        """Disconnect from the gRPC server."""
+        await self.close()
+
+    @property
+    def _host(self) -> str:
+        """Host for the gRPC connection."""
+        return self.__host
+
+    @_host.setter
+    def _host(self, value: str) -> None:
+        """Set the host for the gRPC connection."""
+        self.__host = value
+
+    @property
+    def _port(self) -> str:
+        """Return the port for the gRPC connection."""
+        return self.__port
+
+    @_port.setter
+    def _port(self, value: str) -> None:
+        """Set the port for the gRPC connection."""
+        self.__port = value
+
+    def _create_channel(self) -> grpc.aio.Channel:
+        """Create the ``grpc.aio`` channel.
+
+        Override this method to customize how the channel is created.
+
+        Returns
+        -------
+        grpc.aio.Channel
+            A new ``grpc.aio`` channel to the server.
+        """
+        return _create_default_channel(self, aio=True)
+
+    @property
+    def _channel(self) -> grpc.aio.Channel:
+        """Return the ``grpc.aio`` channel, creating it on first access."""
+        if self.__channel is None:
+            self.__channel = self._create_channel()
+        return self.__channel
+
+    async def _wait_for_channel_ready(self, timeout: float | None = None) -> None:
+        """Wait until the channel is connected to the server.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time in seconds to wait. By default `None` and thus wait indefinitely.
+
+        Raises
+        ------
+        TimeoutError
+            If the channel is not connected before the timeout.
+        """
         try:
-            return self._channel._connectivity_state != grpc.ChannelConnectivity.READY
-        except grpc.RpcError:
-            return True
+            await asyncio.wait_for(self._channel.channel_ready(), timeout)
+        except asyncio.TimeoutError as err:
+            raise TimeoutError(f"Could not connect to {self._host}:{self._port} within {timeout} seconds.") from err
+
+    async def _close_channel(self, grace: float | None = None) -> None:
+        """Close the ``grpc.aio`` channel if it was created.
+
+        The channel is closed even if the calling task is cancelled while
+        waiting for active calls to finish.
+
+        Parameters
+        ----------
+        grace : float | None
+            Time in seconds given to active calls to finish before they are
+            cancelled. By default `None` and thus they are cancelled immediately.
+        """
+        channel, self.__channel = self.__channel, None
+        if channel is not None:
+            await asyncio.shield(channel.close(grace))
+
+    @property
+    def is_closed(self) -> bool:
+        """Flag indicating if the connection is closed.
+
+        Returns
+        -------
+        bool
+            ``True`` if the connection is closed, ``False`` otherwise.
+        """
+        return self.__channel is None or self.__channel.get_state() != grpc.ChannelConnectivity.READY
+
+
+def _create_default_channel(
+    connection: AbstractGRPCConnection | AbstractAsyncGRPCConnection, *, aio: bool
+) -> grpc.Channel | grpc.aio.Channel:
+    """Create the channel of a connection from its transport options, preferring UDS for local servers."""
+    from ansys.tools.common import cyberchannel
+
+    if connection._transport_options is not None:
+        return connection._transport_options.create_channel(grpc_options=connection._channel_options, aio=aio)
+
+    if (
+        connection._uds_service is not None
+        and connection._host in cyberchannel.LOOPBACK_HOSTS
+        and cyberchannel.is_uds_supported()
+        and cyberchannel.verify_uds_socket(
+            connection._uds_service, connection._uds_dir, connection._uds_id, check_listening=True
+        )
+    ):
+        return cyberchannel.create_channel(
+            "uds",
+            uds_service=connection._uds_service,
+            uds_dir=connection._uds_dir,
+            uds_id=connection._uds_id,
+            grpc_options=connection._channel_options,
+            aio=aio,
+        )
+    # The implicit default is an insecure connection, as it has always been,
+    # so it is created without the warning of an explicit insecure transport.
+    target = f"{connection._host}:{connection._port}"
+    if aio:
+        return grpc.aio.insecure_channel(target, options=connection._channel_options)
+    return grpc.insecure_channel(target, options=connection._channel_options)
@@ -43,14 +43,34 @@ Example
 """
 
 # Only the create_channel function is exposed for external use
-__all__ = ["create_channel", "verify_transport_mode", "verify_uds_socket"]
-
+__all__ = [
+    "create_channel",
+    "verify_transport_mode",
+    "verify_uds_socket",
+    "wait_for_uds_socket",
+    "wait_for_uds_socket_async",
+    "TransportCapabilities",
+    "get_transport_capabilities",
+]
+
+import asyncio
+from collections import namedtuple
+from collections.abc import Sequence
+import ctypes
+import ctypes.util
 from dataclasses import dataclass
+import functools
+import ipaddress
+import json
 import logging
 import os
 from pathlib import Path
 import re
-from typing import cast
+import select
+import socket
+import sys
+import time
+from typing import Any, cast
 from warnings import warn
 
 try:
@@ -60,8 +80,19 @@ except ImportError:  # pragma: no cover
 
 
 _IS_WINDOWS = os.name == "nt"
+_IS_LINUX = sys.platform.startswith("linux")
 LOOPBACK_HOSTS = ("localhost", "127.0.0.1")
 
+# Bounds of the polling interval used while waiting for a UDS socket
+# when inotify is not available, or when the socket file already exists
+# but the server is not yet accepting connections.
+_UDS_POLL_MIN_INTERVAL = 0.005
+_UDS_POLL_MAX_INTERVAL = 0.25
+
+# Numeric part of a version string, before any pre-release identifier
+_VERSION_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)")
+_MIN_GRPC_VERSION = "1.63.0"
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,16 +106,21 @@ class CertificateFiles:
 def create_channel(
     transport_mode: str,
     host: str | None = None,
-    port: int | str | None = None,
+    port: int | str | Sequence[int | str] | None = None,
     uds_service: str | None = None,
     uds_dir: str | Path | None = None,
-    uds_id: str | None = None,
+    uds_id: str | Sequence[str] | None = None,
     uds_fullpath: str | Path | None = None,
-    uds_full_path: str | Path | None = None,
+    uds_full_path: str | Path | Sequence[str | Path] | None = None,
     certs_dir: str | Path | None = None,
     cert_files: CertificateFiles | None = None,
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    interceptors: Sequence[Any] | None = None,
+    compression: str | grpc.Compression | None = None,
+    compression_threshold: int | None = None,
+    uds_abstract: bool = False,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel based on the transport mode.
 
     Parameters
@@ -96,10 +132,12 @@ def create_channel(
         Hostname or IP address of the server.
         By default `None` - however, if not using UDS transport mode,
         it will be requested.
-    port : int | str | None
+    port : int | str | Sequence[int | str] | None
         Port in which the server is running.
         By default `None` - however, if not using UDS transport mode,
         it will be requested.
+        If a sequence of ports is given, the calls are balanced across
+        the servers listening on these ports (see the notes below).
     uds_service : str | None
         Optional service name for the UDS socket.
         By default `None` - however, if UDS is selected, it will
@@ -107,17 +145,21 @@ def create_channel(
     uds_dir : str | Path | None
         Directory to use for Unix Domain Sockets (UDS) transport mode.
         By default `None` and thus it will use the "~/.conn" folder.
-    uds_id : str | None
+    uds_id : str | Sequence[str] | None
         Optional ID to use for the UDS socket filename.
         By default `None` and thus it will use "<uds_service>.sock".
         Otherwise, the socket filename will be "<uds_service>-<uds_id>.sock".
+        If a sequence of IDs is given, the calls are balanced across
+        the servers listening on the corresponding sockets.
     uds_fullpath : str | Path | None
         **[DEPRECATED]** Use ``uds_full_path`` instead.
         Full path to the UDS socket file.
         By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
-    uds_full_path : str | Path | None
+    uds_full_path : str | Path | Sequence[str | Path] | None
         Full path to the UDS socket file.
         By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
+        If a sequence of paths is given, the calls are balanced across
+        the servers listening on these sockets.
     certs_dir : str | Path | None
         Directory to use for TLS certificates.
         By default `None` and thus search for the "ANSYS_GRPC_CERTIFICATES" environment variable.
@@ -131,12 +173,43 @@ def create_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus no extra options are added.
+    interceptors: Sequence[Any] | None
+        Client interceptors applied to the channel, for instance the
+        :class:`~ansys.tools.common.grpc_metrics.MetricsInterceptor`.
+        By default `None` and thus the channel is not intercepted.
+    compression: str | grpc.Compression | None
+        Compression algorithm for the messages sent to the server.
+        Options are: "gzip", "deflate", "none".
+        By default `None` and thus messages are not compressed.
+    compression_threshold: int | None
+        Minimum size in bytes of a request message for it to be compressed.
+        Smaller messages are sent uncompressed, since compressing them costs
+        more time than it saves. The requests of client-streaming calls are
+        always compressed.
+        By default `None` and thus all messages are compressed.
+    uds_abstract: bool
+        Whether to connect to a Linux abstract-namespace UDS socket named
+        "<uds_service>" or "<uds_service>-<uds_id>" instead of a socket file.
+        By default `False`.
+    aio: bool
+        Whether to create a ``grpc.aio`` channel for use with ``asyncio``.
+        The interceptors must then be ``grpc.aio`` interceptors, and
+        `compression_threshold` is not supported.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
+    Notes
+    -----
+    When several ports or UDS sockets are given, a single channel is
+    created which connects to all of the servers. The calls are
+    distributed with gRPC's ``round_robin`` load balancing policy. Servers
+    that are not reachable, or whose gRPC health service does not report
+    them as serving, are skipped until they recover.
+
     """
     if uds_fullpath is not None:
         warn(
@@ -154,18 +227,41 @@ def create_channel(
             raise ValueError(f"When using {transport_mode.lower()} transport mode, 'port' must be provided.")
         return transport_mode, host, port
 
+    compression_algorithm = _parse_compression(compression)
+    interceptors = list(interceptors or [])
+    if compression_algorithm is not None:
+        if compression_threshold is None:
+            grpc_options = [*(grpc_options or []), ("grpc.default_compression_algorithm", int(compression_algorithm))]
+        elif aio:
+            raise ValueError("A 'compression_threshold' is not supported for grpc.aio channels.")
+        else:
+            interceptors.append(_CompressionThresholdInterceptor(compression_algorithm, compression_threshold))
+    elif compression_threshold is not None:
+        raise ValueError("A 'compression_threshold' is given, but no 'compression' algorithm.")
+
     match transport_mode.lower():
         case "insecure":
             transport_mode, host, port = check_host_port(transport_mode, host, port)
-            return create_insecure_channel(host, port, grpc_options)
+            return create_insecure_channel(host, port, grpc_options, interceptors=interceptors, aio=aio)
         case "uds":
-            return create_uds_channel(uds_service, uds_dir, uds_id, grpc_options, uds_full_path=uds_full_path)
+            return create_uds_channel(
+                uds_service,
+                uds_dir,
+                uds_id,
+                grpc_options,
+                uds_full_path=uds_full_path,
+                uds_abstract=uds_abstract,
+                interceptors=interceptors,
+                aio=aio,
+            )
         case "wnua":
             transport_mode, host, port = check_host_port(transport_mode, host, port)
-            return create_wnua_channel(host, port, grpc_options)
+            return create_wnua_channel(host, port, grpc_options, interceptors=interceptors, aio=aio)
         case "mtls":
             transport_mode, host, port = check_host_port(transport_mode, host, port)
-            return create_mtls_channel(host, port, certs_dir, cert_files, grpc_options)
+            return create_mtls_channel(
+                host, port, certs_dir, cert_files, grpc_options, interceptors=interceptors, aio=aio
+            )
         case _:
             raise ValueError(
                 f"Unknown transport mode: {transport_mode}. Valid options are: 'insecure', 'uds', 'wnua', 'mtls'."
@@ -176,41 +272,57 @@ def create_channel(
 
 
 def create_insecure_channel(
-    host: str, port: int | str, grpc_options: list[tuple[str, object]] | None = None
-) -> grpc.Channel:
+    host: str,
+    port: int | str | Sequence[int | str],
+    grpc_options: list[tuple[str, object]] | None = None,
+    interceptors: Sequence[Any] | None = None,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create an insecure gRPC channel without TLS.
 
     Parameters
     ----------
     host : str
         Hostname or IP address of the server.
-    port : int | str
+    port : int | str | Sequence[int | str]
         Port in which the server is running.
+        If a sequence of ports is given, the calls are balanced across the servers.
     grpc_options: list[tuple[str, object]] | None
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus no extra options are added.
+    interceptors: Sequence[Any] | None
+        Client interceptors applied to the channel.
+        By default `None` and thus the channel is not intercepted.
+    aio: bool
+        Whether to create a ``grpc.aio`` channel for use with ``asyncio``.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
-    target = f"{host}:{port}"
+    target, options = _get_tcp_target(host, port)
     warn(f"Starting gRPC client without TLS on {target}. This is INSECURE. Consider using a secure connection.")
+    if grpc_options:
+        options.extend(grpc_options)
     logger.info(f"Connecting using INSECURE -> {target}")
-    return grpc.insecure_channel(target, options=grpc_options)
+    return _make_channel(target, options, interceptors=interceptors, aio=aio)
 
 
 def create_uds_channel(
     uds_service: str | None = None,
     uds_dir: str | Path | None = None,
-    uds_id: str | None = None,
+    uds_id: str | Sequence[str] | None = None,
     grpc_options: list[tuple[str, object]] | None = None,
     uds_fullpath: str | Path | None = None,
-    uds_full_path: str | Path | None = None,
-) -> grpc.Channel:
+    uds_full_path: str | Path | Sequence[str | Path] | None = None,
+    uds_abstract: bool = False,
+    interceptors: Sequence[Any] | None = None,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel using Unix Domain Sockets (UDS).
 
     Parameters
@@ -220,10 +332,11 @@ def create_uds_channel(
     uds_dir : str | Path | None
         Directory to use for Unix Domain Sockets (UDS) transport mode.
         By default `None` and thus it will use the "~/.conn" folder.
-    uds_id : str | None
+    uds_id : str | Sequence[str] | None
         Optional ID to use for the UDS socket filename.
         By default `None` and thus it will use "<uds_service>.sock".
         Otherwise, the socket filename will be "<uds_service>-<uds_id>.sock".
+        If a sequence of IDs is given, the calls are balanced across the servers.
     grpc_options: list[tuple[str, object]] | None
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
@@ -232,13 +345,27 @@ def create_uds_channel(
         **[DEPRECATED]** Use ``uds_full_path`` instead.
         Full path to the UDS socket file.
         By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
-    uds_full_path : str | Path | None
+    uds_full_path : str | Path | Sequence[str | Path] | None
         Full path to the UDS socket file.
         By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
+        If a sequence of paths is given, the calls are balanced across the servers.
+    uds_abstract : bool
+        Whether to connect to a socket in the Linux abstract namespace instead of a socket file.
+        The socket name is "<uds_service>" or "<uds_service>-<uds_id>", and `uds_dir` is ignored.
+        Abstract sockets need no file system operations and leave no stale files behind, but
+        they are not protected by file permissions: any process of the same network namespace
+        can connect to them.
+        By default `False`.
+    interceptors: Sequence[Any] | None
+        Client interceptors applied to the channel.
+        By default `None` and thus the channel is not intercepted.
+    aio: bool
+        Whether to create a ``grpc.aio`` channel for use with ``asyncio``.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -254,10 +381,21 @@ def create_uds_channel(
     if not is_uds_supported():
         raise RuntimeError("Unix Domain Sockets are not supported on this platform or gRPC version.")
 
-    if uds_full_path:
-        # Ensure the parent directory exists
-        Path(uds_full_path).parent.mkdir(parents=True, exist_ok=True)
-        target = f"unix:{uds_full_path}"
+    if uds_abstract:
+        if not get_transport_capabilities().abstract_uds:
+            raise RuntimeError("Abstract-namespace Unix Domain Sockets are only supported on Linux.")
+        if uds_full_path:
+            raise ValueError("'uds_full_path' cannot be used with abstract-namespace sockets.")
+        if uds_service is None:
+            raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
+        socket_names = [_get_uds_socket_name(uds_service, single_uds_id) for single_uds_id in _as_list(uds_id)]
+        target = "unix-abstract:" + ",".join(socket_names)
+        socket_count = len(socket_names)
+    elif uds_full_path:
+        socket_paths = [Path(path) for path in _as_list(uds_full_path)]
+        # Ensure the parent directories exist
+        for socket_path in socket_paths:
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
     else:
         if uds_service is None:
             raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
@@ -268,9 +406,15 @@ def create_uds_channel(
         # Make sure the folder exists
         uds_folder.mkdir(parents=True, exist_ok=True)
 
-        # Generate socket filename with optional ID
-        socket_filename = f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
-        target = f"unix:{uds_folder / socket_filename}"
+        # Generate socket filenames with optional ID
+        socket_paths = [
+            uds_folder / f"{_get_uds_socket_name(uds_service, single_uds_id)}.sock"
+            for single_uds_id in _as_list(uds_id)
+        ]
+    if not uds_abstract:
+        # gRPC accepts a comma-separated list of socket paths
+        target = "unix:" + ",".join(str(socket_path) for socket_path in socket_paths)
+        socket_count = len(socket_paths)
 
     # Set default authority to "localhost" for UDS connection
     # This is needed to avoid issues with some gRPC implementations,
@@ -278,33 +422,44 @@ def create_uds_channel(
     options: list[tuple[str, object]] = [
         ("grpc.default_authority", "localhost"),
     ]
+    if socket_count > 1:
+        options.extend(_LOAD_BALANCING_OPTIONS)
     if grpc_options:
         options.extend(grpc_options)
     logger.info(f"Connecting using UDS -> {target}")
-    return grpc.insecure_channel(target, options=options)
+    return _make_channel(target, options, interceptors=interceptors, aio=aio)
 
 
 def create_wnua_channel(
     host: str,
-    port: int | str,
+    port: int | str | Sequence[int | str],
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    interceptors: Sequence[Any] | None = None,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel using Windows Named User Authentication (WNUA).
 
     Parameters
     ----------
     host : str
         Hostname or IP address of the server.
-    port : int | str
+    port : int | str | Sequence[int | str]
         Port in which the server is running.
+        If a sequence of ports is given, the calls are balanced across the servers.
     grpc_options: list[tuple[str, object]] | None
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus only the default authority option is added.
+    interceptors: Sequence[Any] | None
+        Client interceptors applied to the channel.
+        By default `None` and thus the channel is not intercepted.
+    aio: bool
+        Whether to create a ``grpc.aio`` channel for use with ``asyncio``.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -313,34 +468,38 @@ def create_wnua_channel(
     if host not in LOOPBACK_HOSTS:
         raise ValueError("Remote host connections are not supported with WNUA.")
 
-    target = f"{host}:{port}"
+    target, load_balancing_options = _get_tcp_target(host, port)
     # Set default authority to "localhost" for WNUA connection
     # This is needed to avoid issues with some gRPC implementations,
     # see https://github.com/grpc/grpc/issues/34305
     options: list[tuple[str, object]] = [
         ("grpc.default_authority", "localhost"),
     ]
+    options.extend(option for option in load_balancing_options if option[0] != "grpc.default_authority")
     if grpc_options:
         options.extend(grpc_options)
     logger.info(f"Connecting using WNUA -> {target}")
-    return grpc.insecure_channel(target, options=options)
+    return _make_channel(target, options, interceptors=interceptors, aio=aio)
 
 
 def create_mtls_channel(
     host: str,
-    port: int | str,
+    port: int | str | Sequence[int | str],
     certs_dir: str | Path | None = None,
     cert_files: CertificateFiles | None = None,
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    interceptors: Sequence[Any] | None = None,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel using Mutual TLS (mTLS).
 
     Parameters
     ----------
     host : str
         Hostname or IP address of the server.
-    port : int | str
+    port : int | str | Sequence[int | str]
         Port in which the server is running.
+        If a sequence of ports is given, the calls are balanced across the servers.
     certs_dir : str | Path | None
         Directory to use for TLS certificates.
         By default `None` and thus search for the "ANSYS_GRPC_CERTIFICATES" environment variable.
@@ -354,10 +513,16 @@ def create_mtls_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus no extra options are added.
+    interceptors: Sequence[Any] | None
+        Client interceptors applied to the channel.
+        By default `None` and thus the channel is not intercepted.
+    aio: bool
+        Whether to create a ``grpc.aio`` channel for use with ``asyncio``.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -405,14 +570,90 @@ def create_mtls_channel(
         root_certificates=trusted_certs, private_key=client_key, certificate_chain=client_cert
     )
 
-    target = f"{host}:{port}"
+    target, options = _get_tcp_target(host, port)
+    if grpc_options:
+        options.extend(grpc_options)
     logger.info(f"Connecting using mTLS -> {target}")
-    return grpc.secure_channel(target, credentials, options=grpc_options)
+    return _make_channel(target, options, credentials=credentials, interceptors=interceptors, aio=aio)
 
 
 ######################################## HELPER FUNCTIONS ########################################
 
 
+def _make_channel(
+    target: str,
+    options: list[tuple[str, object]],
+    *,
+    credentials: grpc.ChannelCredentials | None = None,
+    interceptors: Sequence[Any] | None = None,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
+    """Create a synchronous or ``grpc.aio`` channel, secured if credentials are given."""
+    if aio:
+        if credentials is None:
+            return grpc.aio.insecure_channel(target, options=options or None, interceptors=interceptors or None)
+        return grpc.aio.secure_channel(target, credentials, options=options or None, interceptors=interceptors or None)
+
+    if credentials is None:
+        channel = grpc.insecure_channel(target, options=options or None)
+    else:
+        channel = grpc.secure_channel(target, credentials, options=options or None)
+    if interceptors:
+        channel = grpc.intercept_channel(channel, *interceptors)
+    return channel
+
+
+# Channel options for distributing calls across several servers. Servers are
+# skipped while they are disconnected, or while their health service does not
+# report them as serving.
+_LOAD_BALANCING_OPTIONS: list[tuple[str, object]] = [
+    (
+        "grpc.service_config",
+        json.dumps({"loadBalancingConfig": [{"round_robin": {}}], "healthCheckConfig": {"serviceName": ""}}),
+    ),
+]
+
+
+def _as_list(value: Any) -> list[Any]:
+    """Wrap a single value into a list, or convert a sequence of values into a list."""
+    if value is None or isinstance(value, (str, bytes, Path, int)):
+        return [value]
+    return list(value)
+
+
+def _get_tcp_target(host: str, port: int | str | Sequence[int | str]) -> tuple[str, list[tuple[str, object]]]:
+    """Get the gRPC target and the channel options for one or several ports on a host.
+
+    A single port results in a regular "host:port" target. For several ports, the
+    host is resolved to an IP address, and an "ipv4:" or "ipv6:" target listing
+    all addresses is returned together with the load balancing options.
+    """
+    ports = _as_list(port)
+    if not ports:
+        raise ValueError("At least one port must be provided.")
+    if len(ports) == 1:
+        return f"{host}:{ports[0]}", []
+
+    address = _resolve_host(host)
+    if ipaddress.ip_address(address).version == 6:
+        target = "ipv6:" + ",".join(f"[{address}]:{single_port}" for single_port in ports)
+    else:
+        target = "ipv4:" + ",".join(f"{address}:{single_port}" for single_port in ports)
+    # Keep the host name as authority, such that it is used to verify the server certificates
+    return target, [("grpc.default_authority", host), *_LOAD_BALANCING_OPTIONS]
+
+
+def _resolve_host(host: str) -> str:
+    """Resolve a host name to an IP address."""
+    if host == "localhost":
+        return "127.0.0.1"
+    try:
+        return str(ipaddress.ip_address(host.strip("[]")))
+    except ValueError:
+        return str(socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0][4][0])
+
+
+@functools.lru_cache(maxsize=32)
 def version_tuple(version_str: str) -> tuple[int, ...]:
     """Convert a version string into a tuple of integers for comparison.
 
@@ -443,7 +684,7 @@ def version_tuple(version_str: str) -> tuple[int, ...]:
     """
     # Extract the numeric version part before any pre-release identifier
     # Matches: start of string, digits, optionally followed by dot and more digits
-    match = re.match(r"^(\d+(?:\.\d+)*)", version_str)
+    match = _VERSION_PATTERN.match(version_str)
     if match:
         version_part = match.group(1)
         return tuple(int(x) for x in version_part.split("."))
@@ -461,14 +702,7 @@ def check_grpc_version():
         True if the gRPC version is sufficient, False otherwise.
 
     """
-    min_version = "1.63.0"
-    current_version = grpc.__version__
-
-    try:
-        return version_tuple(current_version) >= version_tuple(min_version)
-    except ValueError:
-        logger.warning("Unable to parse gRPC version.")
-        return False
+    return get_transport_capabilities().grpc_version_ok
 
 
 def is_uds_supported():
@@ -480,8 +714,150 @@ def is_uds_supported():
         True if UDS is supported, False otherwise.
 
     """
-    is_grpc_version_ok = check_grpc_version()
-    return is_grpc_version_ok if _IS_WINDOWS else True
+    return get_transport_capabilities().uds
+
+
+@dataclass(frozen=True)
+class TransportCapabilities:
+    """Transport capabilities of the current platform and gRPC installation."""
+
+    grpc_version: tuple[int, ...] | None
+    """Installed gRPC version, or ``None`` if it cannot be parsed."""
+
+    grpc_version_ok: bool
+    """Whether the installed gRPC version meets the minimum requirement."""
+
+    uds: bool
+    """Whether Unix Domain Sockets (UDS) are supported."""
+
+    abstract_uds: bool
+    """Whether Linux abstract-namespace Unix Domain Sockets are supported."""
+
+    wnua: bool
+    """Whether Windows Named User Authentication (WNUA) is supported."""
+
+    aio: bool
+    """Whether the ``grpc.aio`` asynchronous API is available."""
+
+
+@functools.cache
+def get_transport_capabilities() -> TransportCapabilities:
+    """Get the transport capabilities of the current platform and gRPC installation.
+
+    The capabilities cannot change within a process, so they are only
+    determined once.
+
+    Returns
+    -------
+    TransportCapabilities
+        The transport capabilities.
+
+    """
+    try:
+        grpc_version: tuple[int, ...] | None = version_tuple(grpc.__version__)
+    except ValueError:
+        logger.warning("Unable to parse gRPC version.")
+        grpc_version = None
+    grpc_version_ok = grpc_version is not None and grpc_version >= version_tuple(_MIN_GRPC_VERSION)
+
+    try:
+        from grpc import aio  # noqa: F401
+    except ImportError:  # pragma: no cover
+        is_aio_available = False
+    else:
+        is_aio_available = True
+
+    return TransportCapabilities(
+        grpc_version=grpc_version,
+        grpc_version_ok=grpc_version_ok,
+        uds=grpc_version_ok if _IS_WINDOWS else True,
+        abstract_uds=_IS_LINUX,
+        wnua=_IS_WINDOWS,
+        aio=is_aio_available,
+    )
+
+
+def _parse_compression(compression: str | grpc.Compression | None) -> grpc.Compression | None:
+    """Convert the compression argument into a gRPC compression algorithm.
+
+    Returns None if the messages should not be compressed.
+    """
+    if compression is None:
+        return None
+    if not isinstance(compression, grpc.Compression):
+        try:
+            compression = {
+                "none": grpc.Compression.NoCompression,
+                "deflate": grpc.Compression.Deflate,
+                "gzip": grpc.Compression.Gzip,
+            }[compression.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown compression: {compression}. Valid options are: 'gzip', 'deflate', 'none'."
+            ) from None
+    return None if compression == grpc.Compression.NoCompression else compression
+
+
+def _message_size(message: Any) -> int | None:
+    """Get the size in bytes of a protobuf message or raw bytes, or None if unknown."""
+    byte_size = getattr(message, "ByteSize", None)
+    if byte_size is not None:
+        return byte_size()
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return memoryview(message).nbytes
+    return None
+
+
+class _ClientCallDetails(
+    namedtuple(
+        "_ClientCallDetails",
+        ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression"),
+    ),
+    grpc.ClientCallDetails,
+):
+    """Concrete client call details, used to override the call compression."""
+
+
+class _CompressionThresholdInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Compress only the requests which are larger than a threshold."""
+
+    def __init__(self, compression: grpc.Compression, threshold: int) -> None:
+        self._compression = compression
+        self._threshold = threshold
+
+    def _with_compression(self, client_call_details: Any, request_size: int | None) -> Any:
+        if client_call_details.compression is not None:
+            # Compression explicitly set for this call
+            return client_call_details
+        if request_size is not None and request_size < self._threshold:
+            compression = grpc.Compression.NoCompression
+        else:
+            compression = self._compression
+        return _ClientCallDetails(
+            client_call_details.method,
+            client_call_details.timeout,
+            client_call_details.metadata,
+            client_call_details.credentials,
+            client_call_details.wait_for_ready,
+            compression,
+        )
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self._with_compression(client_call_details, _message_size(request)), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self._with_compression(client_call_details, _message_size(request)), request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return continuation(self._with_compression(client_call_details, None), request_iterator)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return continuation(self._with_compression(client_call_details, None), request_iterator)
 
 
 def determine_uds_folder(uds_dir: str | Path | None = None) -> Path:
@@ -546,6 +922,8 @@ def verify_uds_socket(
     uds_id: str | None = None,
     uds_fullpath: str | Path | None = None,
     uds_full_path: str | Path | None = None,
+    check_listening: bool = False,
+    uds_abstract: bool = False,
 ) -> bool:
     """Verify that the UDS socket file has been created.
 
@@ -567,6 +945,16 @@ def verify_uds_socket(
     uds_full_path : str | Path | None
         Full path to the UDS socket file.
         By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
+    check_listening : bool
+        Whether to also check that a server is accepting connections on the socket.
+        By default `False` and thus only the existence of the socket file is checked.
+        A socket file left behind by a server that is no longer running is reported
+        as missing when this is `True`.
+    uds_abstract : bool
+        Whether the socket is in the Linux abstract namespace, with the name
+        "<uds_service>" or "<uds_service>-<uds_id>". Abstract sockets have no
+        file, so a server must be accepting connections on them to be found.
+        By default `False`.
 
     Returns
     -------
@@ -582,17 +970,306 @@ def verify_uds_socket(
         if uds_full_path is None:
             uds_full_path = uds_fullpath
 
-    if uds_full_path:
-        return Path(uds_full_path).exists()
-    else:
+    if uds_abstract:
         if uds_service is None:
             raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
+        return _is_uds_socket_listening("\0" + _get_uds_socket_name(uds_service, uds_id))
+
+    uds_socket_path = _get_uds_socket_path(uds_service, uds_dir, uds_id, uds_full_path)
+    if check_listening:
+        return _is_uds_socket_listening(uds_socket_path)
+    # Check if the UDS socket file exists
+    return uds_socket_path.exists()
+
+
+def wait_for_uds_socket(
+    uds_service: str | None = None,
+    uds_dir: str | Path | None = None,
+    uds_id: str | None = None,
+    timeout: float | None = None,
+    uds_full_path: str | Path | None = None,
+    uds_abstract: bool = False,
+) -> bool:
+    """Wait until a server is listening on the UDS socket.
 
-        # Generate socket filename with optional ID
-        uds_filename = f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
+    On Linux, the socket directory is watched with inotify, so that the
+    function returns as soon as the server has created the socket. On other
+    platforms, or if inotify is not available, the socket is polled instead.
 
-        # Full path to the UDS socket file
-        uds_socket_path = determine_uds_folder(uds_dir) / uds_filename
+    Socket files which exist but on which no server is listening (for
+    instance, left behind by a server that crashed) are not considered ready.
+
+    Parameters
+    ----------
+    uds_service : str | None
+        Service name for the UDS socket.
+    uds_dir : str | Path | None
+        Directory where the UDS socket file is expected to be (optional).
+        By default `None` and thus it will use the "~/.conn" folder.
+    uds_id : str | None
+        Unique identifier for the UDS socket (optional).
+        By default `None` and thus it will use "<uds_service>.sock".
+        Otherwise, the socket filename will be "<uds_service>-<uds_id>.sock".
+    timeout : float | None
+        Maximum time in seconds to wait for the socket.
+        By default `None` and thus wait indefinitely.
+    uds_full_path : str | Path | None
+        Full path to the UDS socket file.
+        By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
+    uds_abstract : bool
+        Whether the socket is in the Linux abstract namespace, with the name
+        "<uds_service>" or "<uds_service>-<uds_id>". Abstract sockets have no
+        file to watch, so they are always polled. By default `False`.
+
+    Returns
+    -------
+    bool
+        True if a server is listening on the socket, False if the timeout expired.
+    """
+    uds_address, uds_socket_path = _get_uds_wait_address(uds_service, uds_dir, uds_id, uds_full_path, uds_abstract)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    watcher = None if uds_socket_path is None else _InotifyWatcher.create(uds_socket_path.parent)
+    try:
+        poll_interval = _UDS_POLL_MIN_INTERVAL
+        while True:
+            if _is_uds_socket_listening(uds_address):
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            if watcher is not None and uds_socket_path is not None and not uds_socket_path.exists():
+                # Nothing to connect to yet, sleep until the directory changes.
+                watcher.wait(remaining)
+                continue
+            # Either inotify is not available, or the socket file exists but
+            # the server is not accepting connections (yet).
+            wait_time = poll_interval if remaining is None else min(poll_interval, remaining)
+            if watcher is not None:
+                watcher.wait(wait_time)
+            else:
+                time.sleep(wait_time)
+            poll_interval = min(2 * poll_interval, _UDS_POLL_MAX_INTERVAL)
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+async def wait_for_uds_socket_async(
+    uds_service: str | None = None,
+    uds_dir: str | Path | None = None,
+    uds_id: str | None = None,
+    timeout: float | None = None,
+    uds_full_path: str | Path | None = None,
+    uds_abstract: bool = False,
+) -> bool:
+    """Wait until a server is listening on the UDS socket, without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`wait_for_uds_socket`, and
+    accepts the same parameters. Cancelling the coroutine stops the wait.
+
+    Parameters
+    ----------
+    uds_service : str | None
+        Service name for the UDS socket.
+    uds_dir : str | Path | None
+        Directory where the UDS socket file is expected to be (optional).
+        By default `None` and thus it will use the "~/.conn" folder.
+    uds_id : str | None
+        Unique identifier for the UDS socket (optional).
+        By default `None` and thus it will use "<uds_service>.sock".
+        Otherwise, the socket filename will be "<uds_service>-<uds_id>.sock".
+    timeout : float | None
+        Maximum time in seconds to wait for the socket.
+        By default `None` and thus wait indefinitely.
+    uds_full_path : str | Path | None
+        Full path to the UDS socket file.
+        By default `None` and thus it will use the `uds_service`, `uds_dir` and `uds_id` parameters.
+    uds_abstract : bool
+        Whether the socket is in the Linux abstract namespace, with the name
+        "<uds_service>" or "<uds_service>-<uds_id>". Abstract sockets have no
+        file to watch, so they are always polled. By default `False`.
+
+    Returns
+    -------
+    bool
+        True if a server is listening on the socket, False if the timeout expired.
+    """
+    uds_address, uds_socket_path = _get_uds_wait_address(uds_service, uds_dir, uds_id, uds_full_path, uds_abstract)
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    changed = asyncio.Event()
+
+    watcher = None if uds_socket_path is None else _InotifyWatcher.create(uds_socket_path.parent)
+    if watcher is not None:
+        # Bound separately, since 'watcher' is reset to None below.
+        readable_watcher = watcher
+
+        def _on_readable() -> None:
+            readable_watcher.drain()
+            changed.set()
+
+        try:
+            loop.add_reader(watcher.fileno(), _on_readable)
+        except NotImplementedError:
+            # Event loops without 'add_reader' support (e.g. the Windows proactor)
+            watcher.close()
+            watcher = None
+    try:
+        poll_interval = _UDS_POLL_MIN_INTERVAL
+        while True:
+            if _is_uds_socket_listening(uds_address):
+                return True
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            if watcher is not None and uds_socket_path is not None and not uds_socket_path.exists():
+                wait_time = remaining
+            else:
+                wait_time = poll_interval if remaining is None else min(poll_interval, remaining)
+                poll_interval = min(2 * poll_interval, _UDS_POLL_MAX_INTERVAL)
+            try:
+                await asyncio.wait_for(changed.wait(), wait_time)
+            except asyncio.TimeoutError:
+                pass
+            changed.clear()
+    finally:
+        if watcher is not None:
+            loop.remove_reader(watcher.fileno())
+            watcher.close()
+
+
+def _get_uds_socket_path(
+    uds_service: str | None,
+    uds_dir: str | Path | None,
+    uds_id: str | None,
+    uds_full_path: str | Path | None,
+) -> Path:
+    """Get the path of the UDS socket file from the UDS parameters."""
+    if uds_full_path:
+        return Path(uds_full_path)
+    if uds_service is None:
+        raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
+
+    return determine_uds_folder(uds_dir) / f"{_get_uds_socket_name(uds_service, uds_id)}.sock"
+
+
+def _get_uds_wait_address(
+    uds_service: str | None,
+    uds_dir: str | Path | None,
+    uds_id: str | None,
+    uds_full_path: str | Path | None,
+    uds_abstract: bool,
+) -> tuple[str | Path, Path | None]:
+    """Get the address to connect to, and the socket file to watch for.
+
+    Abstract-namespace sockets have no file, so None is returned for it.
+    """
+    if not uds_abstract:
+        uds_socket_path = _get_uds_socket_path(uds_service, uds_dir, uds_id, uds_full_path)
+        return uds_socket_path, uds_socket_path
+    if not get_transport_capabilities().abstract_uds:
+        raise RuntimeError("Abstract-namespace Unix Domain Sockets are only supported on Linux.")
+    if uds_full_path:
+        raise ValueError("'uds_full_path' cannot be used with abstract-namespace sockets.")
+    if uds_service is None:
+        raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
+    return "\0" + _get_uds_socket_name(uds_service, uds_id), None
+
+
+def _get_uds_socket_name(uds_service: str, uds_id: str | None) -> str:
+    """Get the name of the UDS socket, with the optional ID."""
+    return f"{uds_service}-{uds_id}" if uds_id else uds_service
+
+
+def _is_uds_socket_listening(uds_socket_path: str | Path) -> bool:
+    """Check if a server is accepting connections on the UDS socket.
+
+    Addresses starting with a null byte refer to Linux abstract-namespace sockets.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        # The socket module cannot connect to UDS sockets on this platform,
+        # fall back to checking that the socket file exists.
+        return Path(uds_socket_path).exists()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(uds_socket_path))
+        except OSError:
+            return False
+    return True
+
+
+@functools.cache
+def _get_libc() -> ctypes.CDLL | None:
+    """Load the C library if it provides the inotify API, otherwise return None."""
+    if not _IS_LINUX:
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+    if not (hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch")):
+        return None
+    return libc
+
+
+class _InotifyWatcher:
+    """Minimal inotify wrapper notifying about new entries in a directory."""
+
+    # Constants from <sys/inotify.h>
+    _IN_ATTRIB = 0x00000004
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    @classmethod
+    def create(cls, directory: Path) -> "_InotifyWatcher | None":
+        """Start watching the directory, or return None if inotify is not available."""
+        libc = _get_libc()
+        if libc is None:
+            return None
+        try:
+            # The directory needs to exist to be watched. It is also
+            # created by 'create_uds_channel'.
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        fd = libc.inotify_init1(cls._IN_NONBLOCK | cls._IN_CLOEXEC)
+        if fd < 0:
+            logger.debug(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return None
+        watch_descriptor = libc.inotify_add_watch(
+            fd, os.fsencode(directory), cls._IN_CREATE | cls._IN_MOVED_TO | cls._IN_ATTRIB
+        )
+        if watch_descriptor < 0:
+            logger.debug(f"inotify_add_watch on '{directory}' failed: {os.strerror(ctypes.get_errno())}")
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def fileno(self) -> int:
+        """Return the inotify file descriptor."""
+        return self._fd
+
+    def wait(self, timeout: float | None) -> bool:
+        """Wait until the directory changes, returning False on timeout."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if readable:
+            self.drain()
+            return True
+        return False
 
-        # Check if the UDS socket file exists
-        return uds_socket_path.exists()
+    def drain(self) -> None:
+        """Discard all pending events."""
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """Stop watching the directory."""
+        os.close(self._fd)
@@ -0,0 +1,616 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Client-side metrics for gRPC channels.
+
+This module provides interceptors which record, for each RPC method, the
+number of calls, the latency distribution, the size of the request and
+response messages, and the returned status codes. The metrics are collected
+in a :class:`MetricsRegistry`, which can be queried with
+:meth:`MetricsRegistry.snapshot` or exported in the OpenMetrics text format
+with :meth:`MetricsRegistry.to_openmetrics`.
+
+Example
+-------
+
+.. code-block:: python
+
+    from ansys.tools.common.cyberchannel import create_channel
+    from ansys.tools.common.grpc_metrics import MetricsInterceptor, MetricsRegistry
+
+    registry = MetricsRegistry()
+    channel = create_channel(
+        transport_mode="uds",
+        uds_service="my_service",
+        interceptors=[MetricsInterceptor(registry)],
+    )
+    ...
+    for method, metrics in registry.snapshot().items():
+        print(method, metrics.calls, metrics.latency_sum / metrics.calls)
+
+For ``grpc.aio`` channels, pass the interceptors returned by
+:func:`create_aio_metrics_interceptors` in the ``interceptors`` argument
+of ``create_channel(..., aio=True)`` instead.
+"""
+
+import asyncio
+import bisect
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any
+
+import grpc
+
+from ansys.tools.common.cyberchannel import _message_size
+
+__all__ = [
+    "AioStreamStreamMetricsInterceptor",
+    "AioStreamUnaryMetricsInterceptor",
+    "AioUnaryStreamMetricsInterceptor",
+    "AioUnaryUnaryMetricsInterceptor",
+    "DEFAULT_LATENCY_BUCKETS",
+    "MethodMetrics",
+    "MetricsInterceptor",
+    "MetricsRegistry",
+    "create_aio_metrics_interceptors",
+    "get_default_registry",
+    "instrument_channel",
+]
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default upper bounds, in seconds, of the latency histogram buckets."""
+
+
+@dataclass(frozen=True)
+class MethodMetrics:
+    """Snapshot of the metrics recorded for one RPC method."""
+
+    method: str
+    """Full name of the RPC method, for example ``"/grpc.health.v1.Health/Check"``."""
+    calls: int
+    """Number of completed calls."""
+    status_codes: Mapping[str, int]
+    """Number of calls per returned status code name."""
+    latency_buckets: tuple[tuple[float, int], ...]
+    """Cumulative latency histogram, as ``(upper_bound, count)`` pairs.
+
+    The last bucket has the upper bound ``inf``, and its count is equal to
+    the number of calls.
+    """
+    latency_sum: float
+    """Total latency of all calls, in seconds."""
+    request_bytes: int
+    """Total size of the request messages, in bytes."""
+    response_bytes: int
+    """Total size of the response messages, in bytes."""
+
+
+class _MethodRecord:
+    """Mutable metrics of one method, protected by the registry lock."""
+
+    def __init__(self, num_buckets: int) -> None:
+        self.status_codes: dict[str, int] = {}
+        self.bucket_counts = [0] * num_buckets
+        self.latency_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class MetricsRegistry:
+    """Thread-safe collection of per-method RPC metrics.
+
+    Parameters
+    ----------
+    latency_buckets : Sequence[float]
+        Upper bounds of the latency histogram buckets, in seconds.
+        An additional bucket with an infinite upper bound is always added.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._bounds = tuple(sorted(latency_buckets)) + (float("inf"),)
+        self._lock = threading.Lock()
+        self._records: dict[str, _MethodRecord] = {}
+
+    def record(
+        self,
+        method: str,
+        *,
+        latency: float,
+        status_code: grpc.StatusCode,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """Record a completed call.
+
+        Parameters
+        ----------
+        method :
+            Full name of the RPC method.
+        latency :
+            Duration of the call, in seconds.
+        status_code :
+            Status code returned by the call.
+        request_bytes :
+            Total size of the request messages, in bytes.
+        response_bytes :
+            Total size of the response messages, in bytes.
+        """
+        bucket_index = bisect.bisect_left(self._bounds, latency)
+        with self._lock:
+            record = self._records.get(method)
+            if record is None:
+                record = self._records[method] = _MethodRecord(len(self._bounds))
+            record.status_codes[status_code.name] = record.status_codes.get(status_code.name, 0) + 1
+            record.bucket_counts[bucket_index] += 1
+            record.latency_sum += latency
+            record.request_bytes += request_bytes
+            record.response_bytes += response_bytes
+
+    def snapshot(self) -> dict[str, MethodMetrics]:
+        """Get the metrics recorded so far.
+
+        Returns
+        -------
+        dict[str, MethodMetrics]
+            Mapping of RPC method names to their metrics.
+        """
+        with self._lock:
+            return {method: self._to_metrics(method, record) for method, record in self._records.items()}
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._records.clear()
+
+    def to_openmetrics(self, prefix: str = "grpc_client") -> str:
+        """Export the metrics in the OpenMetrics text format.
+
+        Parameters
+        ----------
+        prefix :
+            Prefix of the metric family names.
+
+        Returns
+        -------
+        str
+            Metrics in the OpenMetrics text exposition format.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_calls counter",
+            f"# HELP {prefix}_calls Number of completed RPCs.",
+        ]
+        for method, metrics in snapshot.items():
+            for code, count in sorted(metrics.status_codes.items()):
+                lines.append(f'{prefix}_calls_total{{method="{_escape(method)}",code="{code}"}} {count}')
+
+        lines += [
+            f"# TYPE {prefix}_latency_seconds histogram",
+            f"# UNIT {prefix}_latency_seconds seconds",
+            f"# HELP {prefix}_latency_seconds Latency of completed RPCs.",
+        ]
+        for method, metrics in snapshot.items():
+            labels = f'method="{_escape(method)}"'
+            for bound, count in metrics.latency_buckets:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_latency_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{prefix}_latency_seconds_count{{{labels}}} {metrics.calls}")
+            lines.append(f"{prefix}_latency_seconds_sum{{{labels}}} {metrics.latency_sum!r}")
+
+        for direction in ("request", "response"):
+            lines += [
+                f"# TYPE {prefix}_{direction}_bytes counter",
+                f"# UNIT {prefix}_{direction}_bytes bytes",
+                f"# HELP {prefix}_{direction}_bytes Total size of the {direction} messages.",
+            ]
+            for method, metrics in snapshot.items():
+                value = metrics.request_bytes if direction == "request" else metrics.response_bytes
+                lines.append(f'{prefix}_{direction}_bytes_total{{method="{_escape(method)}"}} {value}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _to_metrics(self, method: str, record: _MethodRecord) -> MethodMetrics:
+        cumulative_buckets = []
+        count = 0
+        for bound, bucket_count in zip(self._bounds, record.bucket_counts):
+            count += bucket_count
+            cumulative_buckets.append((bound, count))
+        return MethodMetrics(
+            method=method,
+            calls=count,
+            status_codes=dict(record.status_codes),
+            latency_buckets=tuple(cumulative_buckets),
+            latency_sum=record.latency_sum,
+            request_bytes=record.request_bytes,
+            response_bytes=record.response_bytes,
+        )
+
+
+_DEFAULT_REGISTRY = MetricsRegistry()
+
+
+def get_default_registry() -> MetricsRegistry:
+    """Get the registry used by interceptors created without an explicit registry."""
+    return _DEFAULT_REGISTRY
+
+
+def instrument_channel(channel: grpc.Channel, registry: MetricsRegistry | None = None) -> grpc.Channel:
+    """Wrap a channel such that the metrics of all its calls are recorded.
+
+    Parameters
+    ----------
+    channel :
+        Channel to instrument.
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+
+    Returns
+    -------
+    grpc.Channel
+        Channel intercepting all calls.
+    """
+    return grpc.intercept_channel(channel, MetricsInterceptor(registry))
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _method_name(client_call_details: Any) -> str:
+    method = client_call_details.method
+    return method.decode() if isinstance(method, bytes) else method
+
+
+class _CallTracker:
+    """Accumulate the metrics of one call, and record them exactly once."""
+
+    def __init__(self, registry: MetricsRegistry, method: str) -> None:
+        self._registry = registry
+        self._method = method
+        self._start = time.perf_counter()
+        self._recorded = False
+        self._lock = threading.Lock()
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def count_requests(self, request_iterator: Iterable[Any]) -> Iterator[Any]:
+        for request in request_iterator:
+            self.request_bytes += _message_size(request) or 0
+            yield request
+
+    async def count_requests_async(self, request_iterator: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        async for request in request_iterator:
+            self.request_bytes += _message_size(request) or 0
+            yield request
+
+    def finish(self, status_code: grpc.StatusCode) -> None:
+        latency = time.perf_counter() - self._start
+        with self._lock:
+            if self._recorded:
+                return
+            self._recorded = True
+        self._registry.record(
+            self._method,
+            latency=latency,
+            status_code=status_code,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+        )
+
+
+class _StreamingResponse:
+    """Proxy of a streaming call which counts the response messages."""
+
+    def __init__(self, call: Any, tracker: _CallTracker) -> None:
+        self._call = call
+        self._tracker = tracker
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._call, name)
+
+    def __iter__(self) -> "_StreamingResponse":
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._tracker.finish(grpc.StatusCode.OK)
+            raise
+        except grpc.RpcError as exc:
+            self._tracker.finish(exc.code())  # type: ignore[attr-defined]
+            raise
+        self._tracker.response_bytes += _message_size(response) or 0
+        return response
+
+    def __del__(self) -> None:
+        if self._call.done():
+            # Successful calls are only recorded by the done callback once
+            # all responses have been consumed.
+            self._tracker.finish(self._call.code())
+        else:
+            # gRPC cancels calls which are garbage collected while in flight,
+            # without running the done callbacks.
+            self._tracker.finish(grpc.StatusCode.CANCELLED)
+
+
+class MetricsInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Interceptor recording the metrics of the calls made through a channel.
+
+    Parameters
+    ----------
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry if registry is not None else _DEFAULT_REGISTRY
+
+    def intercept_unary_unary(self, continuation: Callable[..., Any], client_call_details: Any, request: Any) -> Any:
+        """Intercept a unary-unary call."""
+        tracker = _CallTracker(self.registry, _method_name(client_call_details))
+        tracker.request_bytes = _message_size(request) or 0
+        call = continuation(client_call_details, request)
+        call.add_done_callback(lambda future: self._finish_unary_response(tracker, future))
+        return call
+
+    def intercept_unary_stream(self, continuation: Callable[..., Any], client_call_details: Any, request: Any) -> Any:
+        """Intercept a unary-stream call."""
+        tracker = _CallTracker(self.registry, _method_name(client_call_details))
+        tracker.request_bytes = _message_size(request) or 0
+        return self._track_streaming_response(tracker, continuation(client_call_details, request))
+
+    def intercept_stream_unary(
+        self, continuation: Callable[..., Any], client_call_details: Any, request_iterator: Iterator[Any]
+    ) -> Any:
+        """Intercept a stream-unary call."""
+        tracker = _CallTracker(self.registry, _method_name(client_call_details))
+        call = continuation(client_call_details, tracker.count_requests(request_iterator))
+        call.add_done_callback(lambda future: self._finish_unary_response(tracker, future))
+        return call
+
+    def intercept_stream_stream(
+        self, continuation: Callable[..., Any], client_call_details: Any, request_iterator: Iterator[Any]
+    ) -> Any:
+        """Intercept a stream-stream call."""
+        tracker = _CallTracker(self.registry, _method_name(client_call_details))
+        call = continuation(client_call_details, tracker.count_requests(request_iterator))
+        return self._track_streaming_response(tracker, call)
+
+    @staticmethod
+    def _finish_unary_response(tracker: _CallTracker, future: Any) -> None:
+        status_code = future.code()
+        if status_code == grpc.StatusCode.OK:
+            tracker.response_bytes = _message_size(future.result()) or 0
+        tracker.finish(status_code)
+
+    @staticmethod
+    def _track_streaming_response(tracker: _CallTracker, call: Any) -> _StreamingResponse:
+        def _on_done(future: Any) -> None:
+            # Successful calls are recorded once all responses have been
+            # consumed; this records calls which are cancelled or fail early.
+            status_code = future.code()
+            if status_code != grpc.StatusCode.OK:
+                tracker.finish(status_code)
+
+        call.add_done_callback(_on_done)
+        return _StreamingResponse(call, tracker)
+
+
+# Tasks recording the metrics of finished ``grpc.aio`` calls, referenced
+# until they complete so that they are not garbage collected.
+_PENDING_TASKS: set[asyncio.Future[None]] = set()
+
+
+class _AioMetricsInterceptorBase:
+    """Common implementation of the ``grpc.aio`` metrics interceptors.
+
+    ``grpc.aio`` channels register each interceptor for a single RPC type,
+    so a separate interceptor class is needed for each type.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry if registry is not None else _DEFAULT_REGISTRY
+
+    def _tracker(self, client_call_details: Any) -> _CallTracker:
+        return _CallTracker(self.registry, _method_name(client_call_details))
+
+    @staticmethod
+    def _count_requests(tracker: _CallTracker, request_iterator: Any) -> Any:
+        if hasattr(request_iterator, "__aiter__"):
+            return tracker.count_requests_async(request_iterator)
+        return tracker.count_requests(request_iterator)
+
+    @classmethod
+    def _track_unary_response(cls, tracker: _CallTracker, call: Any) -> None:
+        # The call is returned without waiting for the response: the request
+        # stream of the call is written through the interceptor, and
+        # 'initial_metadata' is only available once the interceptor returns.
+        def _on_done(done_call: Any) -> None:
+            task = asyncio.ensure_future(cls._finish_unary_response(tracker, done_call))
+            _PENDING_TASKS.add(task)
+            task.add_done_callback(_PENDING_TASKS.discard)
+
+        call.add_done_callback(_on_done)
+
+    @staticmethod
+    async def _finish_unary_response(tracker: _CallTracker, call: Any) -> None:
+        # The call is done, so neither 'code' nor the response wait.
+        status_code = await call.code()
+        if status_code == grpc.StatusCode.OK:
+            tracker.response_bytes = _message_size(await call) or 0
+        tracker.finish(status_code)
+
+    @classmethod
+    def _track_streaming_response(cls, tracker: _CallTracker, call: Any) -> AsyncIterator[Any]:
+        def _on_done(done_call: Any) -> None:
+            # Records calls cancelled while the responses are not being consumed.
+            if done_call.cancelled():
+                tracker.finish(grpc.StatusCode.CANCELLED)
+
+        call.add_done_callback(_on_done)
+        return cls._iterate_streaming_response(tracker, call)
+
+    @staticmethod
+    async def _iterate_streaming_response(tracker: _CallTracker, call: Any) -> AsyncIterator[Any]:
+        status_code = grpc.StatusCode.CANCELLED
+        try:
+            async for response in call:
+                tracker.response_bytes += _message_size(response) or 0
+                yield response
+            status_code = grpc.StatusCode.OK
+        except grpc.aio.AioRpcError as exc:
+            status_code = exc.code()
+            raise
+        finally:
+            # Also reached when the iteration is stopped early, or when the
+            # iterator is closed or garbage collected.
+            tracker.finish(status_code)
+
+
+class AioUnaryUnaryMetricsInterceptor(_AioMetricsInterceptorBase, grpc.aio.UnaryUnaryClientInterceptor):
+    """Interceptor recording the metrics of unary-unary calls on a ``grpc.aio`` channel.
+
+    Parameters
+    ----------
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+    """
+
+    async def intercept_unary_unary(
+        self, continuation: Callable[..., Any], client_call_details: Any, request: Any
+    ) -> Any:
+        """Intercept a unary-unary call."""
+        tracker = self._tracker(client_call_details)
+        tracker.request_bytes = _message_size(request) or 0
+        call = await continuation(client_call_details, request)
+        self._track_unary_response(tracker, call)
+        return call
+
+
+class AioUnaryStreamMetricsInterceptor(_AioMetricsInterceptorBase, grpc.aio.UnaryStreamClientInterceptor):
+    """Interceptor recording the metrics of unary-stream calls on a ``grpc.aio`` channel.
+
+    Parameters
+    ----------
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+    """
+
+    async def intercept_unary_stream(
+        self, continuation: Callable[..., Any], client_call_details: Any, request: Any
+    ) -> Any:
+        """Intercept a unary-stream call."""
+        tracker = self._tracker(client_call_details)
+        tracker.request_bytes = _message_size(request) or 0
+        call = await continuation(client_call_details, request)
+        return self._track_streaming_response(tracker, call)
+
+
+class AioStreamUnaryMetricsInterceptor(_AioMetricsInterceptorBase, grpc.aio.StreamUnaryClientInterceptor):
+    """Interceptor recording the metrics of stream-unary calls on a ``grpc.aio`` channel.
+
+    Parameters
+    ----------
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+    """
+
+    async def intercept_stream_unary(
+        self, continuation: Callable[..., Any], client_call_details: Any, request_iterator: Any
+    ) -> Any:
+        """Intercept a stream-unary call."""
+        tracker = self._tracker(client_call_details)
+        call = await continuation(client_call_details, self._count_requests(tracker, request_iterator))
+        self._track_unary_response(tracker, call)
+        return call
+
+
+class AioStreamStreamMetricsInterceptor(_AioMetricsInterceptorBase, grpc.aio.StreamStreamClientInterceptor):
+    """Interceptor recording the metrics of stream-stream calls on a ``grpc.aio`` channel.
+
+    Parameters
+    ----------
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+    """
+
+    async def intercept_stream_stream(
+        self, continuation: Callable[..., Any], client_call_details: Any, request_iterator: Any
+    ) -> Any:
+        """Intercept a stream-stream call."""
+        tracker = self._tracker(client_call_details)
+        call = await continuation(client_call_details, self._count_requests(tracker, request_iterator))
+        return self._track_streaming_response(tracker, call)
+
+
+def create_aio_metrics_interceptors(registry: MetricsRegistry | None = None) -> list[Any]:
+    """Create the interceptors recording the metrics of all calls on a ``grpc.aio`` channel.
+
+    Parameters
+    ----------
+    registry :
+        Registry in which the metrics are recorded. By default `None` and
+        thus the default registry is used.
+
+    Returns
+    -------
+    list
+        One interceptor for each RPC type, to pass in the ``interceptors``
+        argument of the ``grpc.aio`` channel.
+    """
+    return [
+        AioUnaryUnaryMetricsInterceptor(registry),
+        AioUnaryStreamMetricsInterceptor(registry),
+        AioStreamUnaryMetricsInterceptor(registry),
+        AioStreamStreamMetricsInterceptor(registry),
+    ]
@@ -22,14 +22,18 @@
 
 """Local product launcher."""
 
-from . import config, grpc_transport, helpers, interface, product_instance
-from .launch import launch_product
+from . import async_product_instance, config, grpc_transport, helpers, interface, pool, product_instance
+from .launch import alaunch_product, launch_product, launch_products
 
 __all__ = [
+    "alaunch_product",
+    "async_product_instance",
     "config",
     "grpc_transport",
     "helpers",
     "interface",
     "launch_product",
+    "launch_products",
+    "pool",
     "product_instance",
 ]
@@ -20,15 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 import dataclasses
 import json
 import textwrap
 from typing import Any, cast
+import warnings
 
 import click
 
-from ._plugins import get_all_plugins
+from ._plugins import PluginDescriptor, get_plugin_descriptors
 from .config import (
     _get_config_path,
     get_config_for,
@@ -37,7 +38,7 @@ from .config import (
     save_config,
     set_config_for,
 )
-from .interface import LAUNCHER_CONFIG_T, METADATA_KEY_DOC, METADATA_KEY_NOPROMPT, LauncherProtocol
+from .interface import LAUNCHER_CONFIG_T, METADATA_KEY_DOC, METADATA_KEY_NOPROMPT, DataclassProtocol, LauncherProtocol
 
 
 def format_prompt(*, field_name: str, description: str | None) -> str:
@@ -54,45 +55,147 @@ _DEFAULT_STR = "default"
 
 
 def get_subcommands_from_plugins(
-    *, plugins: dict[str, dict[str, type[LauncherProtocol[LAUNCHER_CONFIG_T]]]]
+    *, plugins: Mapping[str, Mapping[str, type[LauncherProtocol[LAUNCHER_CONFIG_T]] | PluginDescriptor]]
 ) -> Sequence[click.Command]:
-    """Construct ``configure`` subcommands from the plugins."""
-    all_product_commands: list[click.Group] = []
-    for product_name, launch_mode_configs in plugins.items():
-        product_command = click.Group(product_name)
-        all_product_commands.append(product_command)
-        for launch_mode, launcher_kls in launch_mode_configs.items():
-            launcher_config_kls = launcher_kls.CONFIG_MODEL
-
-            _config_writer_callback = config_writer_callback_factory(launcher_config_kls, product_name, launch_mode)
-            launch_mode_command = click.Command(launch_mode, callback=_config_writer_callback)
-            for field in dataclasses.fields(launcher_config_kls):
-                option = get_option_from_field(field)
-                launch_mode_command.params.append(option)
-
-            extra_kwargs_overwrite_option = dict()
-            if is_configured(product_name=product_name):
-                current_launch_mode = get_launch_mode_for(product_name=product_name)
-                if current_launch_mode != launch_mode:
-                    extra_kwargs_overwrite_option = dict(
-                        prompt=(
-                            f"\nOverwrite default launch mode for {product_name} "
-                            f"(currently set to '{current_launch_mode}')?"
-                        ),
-                        show_default=True,
-                    )
-
-            launch_mode_command.params.append(
-                click.Option(
-                    [f"--{_OVERWRITE_DEFAULT_FLAG_NAME}"],
-                    is_flag=True,
-                    **extra_kwargs_overwrite_option,  # type: ignore
+    """Construct ``configure`` subcommands from the plugins.
+
+    The plugins can be given as launcher classes, or as plugin descriptors.
+    In the latter case, a plugin is only imported when its subcommand is
+    invoked or its help is shown.
+    """
+    return [
+        _get_product_command(product_name, launch_mode_configs) for product_name, launch_mode_configs in plugins.items()
+    ]
+
+
+def _get_product_command(
+    product_name: str,
+    launch_mode_configs: Mapping[str, type[LauncherProtocol[LAUNCHER_CONFIG_T]] | PluginDescriptor],
+) -> click.Group:
+    """Construct the ``configure`` subcommand for a single product."""
+    product_command = click.Group(product_name)
+    for launch_mode, launcher_kls in launch_mode_configs.items():
+        extra_kwargs_overwrite_option = dict()
+        if is_configured(product_name=product_name):
+            current_launch_mode = get_launch_mode_for(product_name=product_name)
+            if current_launch_mode != launch_mode:
+                extra_kwargs_overwrite_option = dict(
+                    prompt=(
+                        f"\nOverwrite default launch mode for {product_name} "
+                        f"(currently set to '{current_launch_mode}')?"
+                    ),
+                    show_default=True,
                 )
+
+        overwrite_option = click.Option(
+            [f"--{_OVERWRITE_DEFAULT_FLAG_NAME}"],
+            is_flag=True,
+            **extra_kwargs_overwrite_option,  # type: ignore
+        )
+        product_command.add_command(
+            _ConfigureLaunchModeCommand(
+                launcher_kls, product_name=product_name, launch_mode=launch_mode, extra_params=[overwrite_option]
             )
+        )
+    return product_command
+
+
+class _ConfigureGroup(click.Group):
+    """Group of the ``configure`` subcommands, which are created on first use.
+
+    Only the subcommand of the product that is invoked, or whose help is
+    shown, is created. Listing the subcommands requires the names of the
+    products only.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        plugins: Mapping[str, Mapping[str, type[LauncherProtocol[LAUNCHER_CONFIG_T]] | PluginDescriptor]],
+        **kwargs: Any,
+    ):
+        self._plugins = plugins
+        super().__init__(*args, **kwargs)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Get the names of the products."""
+        return sorted(set(self.commands) | set(self._plugins))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get the subcommand of a product, creating it if necessary."""
+        if cmd_name not in self.commands and cmd_name in self._plugins:
+            self.add_command(_get_product_command(cmd_name, self._plugins[cmd_name]))
+        return self.commands.get(cmd_name)
+
+
+class _DiscoveredPlugins(Mapping[str, Mapping[str, PluginDescriptor]]):
+    """Descriptors of the installed plugins, which are discovered on first access."""
+
+    def __init__(self) -> None:
+        self._plugins: Mapping[str, Mapping[str, PluginDescriptor]] | None = None
 
-            product_command.add_command(launch_mode_command)
+    @property
+    def _descriptors(self) -> Mapping[str, Mapping[str, PluginDescriptor]]:
+        if self._plugins is None:
+            self._plugins = get_plugin_descriptors()
+        return self._plugins
 
-    return all_product_commands
+    def __getitem__(self, key: str) -> Mapping[str, PluginDescriptor]:
+        return self._descriptors[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._descriptors)
+
+    def __len__(self) -> int:
+        return len(self._descriptors)
+
+
+class _ConfigureLaunchModeCommand(click.Command):
+    """Command for configuring a launch mode, whose options are created on first use.
+
+    Creating the options for the fields of the configuration model requires
+    importing the launcher plugin, which is deferred until the command is
+    invoked or its help is shown.
+    """
+
+    def __init__(
+        self,
+        launcher_kls: type[LauncherProtocol[LAUNCHER_CONFIG_T]] | PluginDescriptor,
+        *,
+        product_name: str,
+        launch_mode: str,
+        extra_params: list[click.Parameter],
+    ):
+        self._launcher_kls = launcher_kls
+        self._product_name = product_name
+        self._launch_mode = launch_mode
+        self._has_field_params = False
+        super().__init__(launch_mode, callback=self._write_config, params=extra_params)
+
+    @property
+    def params(self) -> list[click.Parameter]:
+        """Options for the fields of the configuration model, followed by the extra parameters."""
+        # Click modifies this list in place, so the same list is always returned.
+        if not self._has_field_params:
+            self._params[:0] = [get_option_from_field(field) for field in dataclasses.fields(self._config_model)]
+            self._has_field_params = True
+        return self._params
+
+    @params.setter
+    def params(self, value: list[click.Parameter]) -> None:
+        self._params = value
+
+    @property
+    def _config_model(self) -> type[DataclassProtocol]:
+        try:
+            return self._launcher_kls.CONFIG_MODEL
+        except Exception as exc:
+            raise click.ClickException(
+                f"Cannot load the plugin for launch mode '{self._launch_mode}' of '{self._product_name}': {exc}"
+            ) from exc
+
+    def _write_config(self, **kwargs: Any) -> None:
+        config_writer_callback_factory(self._config_model, self._product_name, self._launch_mode)(**kwargs)
 
 
 class JSONParamType(click.ParamType):
@@ -180,13 +283,17 @@ def config_writer_callback_factory(
     return _config_writer_callback
 
 
-def build_cli(plugins: dict[str, dict[str, type[LauncherProtocol[LAUNCHER_CONFIG_T]]]]) -> click.Group:
-    """Build the CLI from the plugins."""
-    _cli = click.Group()
+def build_cli(
+    plugins: Mapping[str, Mapping[str, type[LauncherProtocol[LAUNCHER_CONFIG_T]] | PluginDescriptor]],
+) -> click.Group:
+    """Build the CLI from the plugins, given as launcher classes or plugin descriptors.
 
-    all_subcommands = get_subcommands_from_plugins(plugins=plugins)
+    The ``configure`` subcommands are created when they are first used, so the
+    plugins are not accessed while building the CLI.
+    """
+    _cli = click.Group()
 
-    @_cli.group(invoke_without_command=True)
+    @_cli.group(cls=_ConfigureGroup, invoke_without_command=True, plugins=plugins)
     @click.pass_context
     def configure(ctx: click.Context) -> None:
         """
@@ -220,9 +327,6 @@ def build_cli(plugins: dict[str, dict[str, type[LauncherProtocol[LAUNCHER_CONFIG
             else:
                 click.echo(ctx.get_help())
 
-    for subcommand in all_subcommands:
-        configure.add_command(subcommand)
-
     @_cli.command()
     # @click.pass_context
     def list_plugins() -> None:
@@ -244,6 +348,11 @@ def build_cli(plugins: dict[str, dict[str, type[LauncherProtocol[LAUNCHER_CONFIG
             try:
                 default_launch_mode = get_launch_mode_for(product_name=product_name)
                 for launch_mode in sorted(launch_mode_configs.keys()):
+                    try:
+                        launch_mode_configs[launch_mode].CONFIG_MODEL
+                    except Exception as exception:
+                        warnings.warn(f"Skipping broken plugin '{product_name}.{launch_mode}': {exception}")
+                        continue
                     if launch_mode == default_launch_mode:
                         click.echo(f"    {launch_mode} (default)")
                     else:
@@ -275,8 +384,9 @@ def build_cli(plugins: dict[str, dict[str, type[LauncherProtocol[LAUNCHER_CONFIG
 
 
 # Needs to be defined at the module level, since this is what the [tool.poetry.scripts]
-# entrypoint refers to.
-cli = build_cli(plugins=get_all_plugins())
+# entrypoint refers to. The plugins are discovered when the CLI is invoked, not
+# when this module is imported.
+cli = build_cli(plugins=_DiscoveredPlugins())
 
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Exclusive file locks which are shared across processes."""
+
+from collections.abc import Iterator
+import contextlib
+import os
+import pathlib
+import sys
+import time
+from typing import BinaryIO
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+__all__ = ["file_lock", "try_lock_file", "unlock_file"]
+
+_POLL_INTERVAL = 0.01
+
+
+@contextlib.contextmanager
+def file_lock(path: pathlib.Path) -> Iterator[None]:
+    """Hold an exclusive lock on a file, waiting until it is available.
+
+    The lock file is created if it does not exist, and is left in place when
+    the lock is released. The lock is held by the open file, so it is released
+    when the process exits, even if it is not released explicitly. It is not
+    reentrant: locking the same file again from the same process blocks.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path of the lock file.
+    """
+    with path.open("a+b") as lock_file:
+        _lock(lock_file.fileno(), blocking=True)
+        try:
+            yield
+        finally:
+            _unlock(lock_file.fileno())
+
+
+def try_lock_file(path: pathlib.Path) -> BinaryIO | None:
+    """Acquire an exclusive lock on a file, if it is available.
+
+    Unlike :func:`file_lock`, the lock is held until it is released with
+    :func:`unlock_file`, or until the returned file is closed. Since each
+    call opens the file separately, the lock is also exclusive between
+    threads of the same process. If the lock file is deleted by its
+    previous holder while this call is waiting to lock it, the lock is
+    acquired on the file which replaces it.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path of the lock file.
+
+    Returns
+    -------
+    BinaryIO or None
+        Open lock file, or ``None`` if the file is locked by someone else.
+    """
+    while True:
+        lock_file = path.open("a+b")
+        try:
+            acquired = _lock(lock_file.fileno(), blocking=False)
+            # The previous holder may have deleted the file between opening
+            # and locking it. Locking the deleted file excludes no one.
+            if acquired and _is_same_file(lock_file, path):
+                return lock_file
+        except BaseException:
+            lock_file.close()
+            raise
+        lock_file.close()
+        if not acquired:
+            return None
+
+
+def unlock_file(lock_file: BinaryIO, *, delete: bool = False) -> None:
+    """Release a lock acquired with :func:`try_lock_file`, and close the file.
+
+    Parameters
+    ----------
+    lock_file : BinaryIO
+        Open lock file returned by :func:`try_lock_file`.
+    delete : bool, default: False
+        Whether to delete the lock file. The file is not deleted if it
+        is opened by someone else on Windows.
+    """
+    if lock_file.closed:
+        return
+    path = pathlib.Path(lock_file.name)
+    try:
+        # While the lock is held, deleting the file cannot race with someone
+        # else locking it: they detect that the file they locked was deleted.
+        if delete and sys.platform != "win32":
+            path.unlink(missing_ok=True)
+        _unlock(lock_file.fileno())
+    finally:
+        lock_file.close()
+    # Open files cannot be deleted on Windows, so the file is deleted once it
+    # is closed, unless someone else opened it in the meantime.
+    if delete and sys.platform == "win32":
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+
+
+def _is_same_file(lock_file: BinaryIO, path: pathlib.Path) -> bool:
+    """Check that the open lock file is still the file at ``path``."""
+    try:
+        return os.path.samestat(os.fstat(lock_file.fileno()), path.stat())
+    except FileNotFoundError:
+        return False
+
+
+if sys.platform == "win32":
+
+    def _lock(fd: int, *, blocking: bool) -> bool:
+        # The first byte of the file is locked. ``LK_LOCK`` gives up after ten
+        # attempts, so keep retrying until the lock is acquired.
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(_POLL_INTERVAL)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+
+    def _lock(fd: int, *, blocking: bool) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -22,25 +22,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from functools import lru_cache
+import hashlib
 import importlib.metadata
 from importlib.metadata import entry_points
-from typing import Any
+import json
+import os
+import pathlib
+import sys
+from typing import Any, cast
 import warnings
 
-from .interface import FALLBACK_LAUNCH_MODE_NAME, DataclassProtocol, LauncherProtocol
+import platformdirs
+
+from .interface import FALLBACK_LAUNCH_MODE_NAME, DataclassProtocol, LauncherProtocol, ServerType
 
 LAUNCHER_ENTRY_POINT = "ansys.tools.common.launcher"
 DEPRECATED_LAUNCHER_ENTRY_POINT = "ansys.tools.local_product_launcher.launcher"
 
+# Path of the file caching the discovered entry points across processes. If
+# the environment variable is set to an empty string, the cache is disabled.
+_PLUGIN_CACHE_PATH_ENV_VAR_NAME = "ANSYS_LAUNCHER_PLUGIN_CACHE_PATH"
+
 
 def get_launcher(*, product_name: str, launch_mode: str) -> type[LauncherProtocol[DataclassProtocol]]:
     """Get the launcher plugin class for a given product and launch mode."""
-    ep_name = f"{product_name}.{launch_mode}"
-    for entrypoint in _get_entry_points():
-        if entrypoint.name == ep_name:
-            return entrypoint.load()  # type: ignore
-    raise KeyError(f"No plugin found for '{ep_name}'.")
+    return _get_index().load_by_name(f"{product_name}.{launch_mode}")
 
 
 def get_config_model(*, product_name: str, launch_mode: str) -> type[DataclassProtocol]:
@@ -51,6 +59,9 @@ def get_config_model(*, product_name: str, launch_mode: str) -> type[DataclassPr
 def get_all_plugins(hide_fallback: bool = True) -> dict[str, dict[str, type[LauncherProtocol[Any]]]]:
     """Get mapping {"<product_name>": {"<launch_mode>": LauncherClass}} containing all launcher plugins.
 
+    This function imports all plugins. Use :func:`get_plugin_descriptors` to
+    list the plugins without importing them.
+
     Parameters
     ----------
     hide_fallback : bool, default=True
@@ -62,7 +73,39 @@ def get_all_plugins(hide_fallback: bool = True) -> dict[str, dict[str, type[Laun
         Mapping of product names to launch mode to launcher classes.
     """
     res: dict[str, dict[str, type[LauncherProtocol[Any]]]] = dict()
-    for entry_point in _get_entry_points():
+    for product_name, descriptors in get_plugin_descriptors(hide_fallback=hide_fallback).items():
+        for launch_mode, descriptor in descriptors.items():
+            try:
+                launcher_class = descriptor.load()
+            except Exception as exception:
+                message = f"Skipping broken plugin '{descriptor.name}': {exception}"
+                warnings.warn(message)
+                continue
+
+            res.setdefault(product_name, dict())
+            res[product_name][launch_mode] = launcher_class
+
+    return res
+
+
+def get_plugin_descriptors(hide_fallback: bool = True) -> dict[str, dict[str, PluginDescriptor]]:
+    """Get mapping {"<product_name>": {"<launch_mode>": PluginDescriptor}} containing all launcher plugins.
+
+    Unlike :func:`get_all_plugins`, this function does not import the plugins.
+
+    Parameters
+    ----------
+    hide_fallback : bool, default=True
+        If True, skip launch modes marked as fallback.
+
+    Returns
+    -------
+    dict[str, dict[str, PluginDescriptor]]
+        Mapping of product names to launch mode to plugin descriptors.
+    """
+    index = _get_index()
+    res: dict[str, dict[str, PluginDescriptor]] = dict()
+    for entry_point in index.entry_points:
         try:
             product_name, launch_mode = entry_point.name.split(".")
         except ValueError:
@@ -73,44 +116,276 @@ def get_all_plugins(hide_fallback: bool = True) -> dict[str, dict[str, type[Laun
         if hide_fallback and launch_mode == FALLBACK_LAUNCH_MODE_NAME:
             continue
 
-        try:
-            launcher_class = entry_point.load()
-        except Exception as exception:
-            message = f"Skipping broken plugin '{entry_point.name}': {exception}"
-            warnings.warn(message)
-            continue
-
         res.setdefault(product_name, dict())
-        res[product_name][launch_mode] = launcher_class
+        res[product_name][launch_mode] = PluginDescriptor(
+            product_name=product_name, launch_mode=launch_mode, entry_point=entry_point
+        )
 
     return res
 
 
+class PluginDescriptor:
+    """Describes a launcher plugin, without importing it.
+
+    The launcher class is only imported when it, or one of its
+    ``CONFIG_MODEL`` and ``SERVER_SPEC`` attributes, is accessed.
+
+    Parameters
+    ----------
+    product_name :
+        Name of the product launched by the plugin.
+    launch_mode :
+        Launch mode implemented by the plugin.
+    entry_point :
+        Entry point which registers the plugin.
+    """
+
+    def __init__(self, *, product_name: str, launch_mode: str, entry_point: importlib.metadata.EntryPoint):
+        self.product_name = product_name
+        self.launch_mode = launch_mode
+        self.entry_point = entry_point
+
+    def __repr__(self) -> str:
+        """Get the representation of the descriptor."""
+        return f"<{type(self).__name__} {self.name!r} -> {self.entry_point.value!r}>"
+
+    @property
+    def name(self) -> str:
+        """Name of the entry point, ``<product_name>.<launch_mode>``."""
+        return self.entry_point.name
+
+    @property
+    def distribution_name(self) -> str | None:
+        """Name of the distribution which provides the plugin, if known."""
+        dist = getattr(self.entry_point, "dist", None)
+        if dist is not None:
+            return cast(str, dist.name)
+        # Entry points read from the discovery cache have no distribution.
+        return _CACHED_DISTRIBUTION_NAMES.get(_entry_point_key(self.entry_point))
+
+    @property
+    def distribution_version(self) -> str | None:
+        """Version of the distribution which provides the plugin, if known."""
+        dist = getattr(self.entry_point, "dist", None)
+        if dist is not None:
+            return cast(str, dist.version)
+        dist_name = self.distribution_name
+        if dist_name is None:
+            return None
+        try:
+            return importlib.metadata.version(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            return None
+
+    @property
+    def CONFIG_MODEL(self) -> type[DataclassProtocol]:  # noqa: N802
+        """Configuration model of the launcher, which imports the plugin."""
+        return self.load().CONFIG_MODEL
+
+    @property
+    def SERVER_SPEC(self) -> Mapping[str, ServerType]:  # noqa: N802
+        """Server specification of the launcher, which imports the plugin."""
+        return self.load().SERVER_SPEC
+
+    def load(self) -> type[LauncherProtocol[Any]]:
+        """Import the plugin and get its launcher class."""
+        return _get_index().load(self.entry_point)
+
+
 def has_fallback(product_name: str) -> bool:
     """Return True if the given product has a fallback launcher."""
-    for entry_point in _get_entry_points():
-        try:
-            ep_product_name, ep_launch_mode = entry_point.name.split(".")
-        except ValueError:
-            continue
-        if product_name == ep_product_name and ep_launch_mode == FALLBACK_LAUNCH_MODE_NAME:
-            return True
-    return False
+    return FALLBACK_LAUNCH_MODE_NAME in _get_index().launch_modes.get(product_name, ())
 
 
 def get_fallback_launcher(product_name: str) -> type[LauncherProtocol[DataclassProtocol]]:
     """Get the fallback launcher plugin class for a given product."""
-    ep_name = f"{product_name}.{FALLBACK_LAUNCH_MODE_NAME}"
-    for entrypoint in _get_entry_points():
-        if entrypoint.name == ep_name:
-            return entrypoint.load()  # type: ignore
-    raise KeyError(f"No plugin found for '{ep_name}'.")
+    return _get_index().load_by_name(f"{product_name}.{FALLBACK_LAUNCH_MODE_NAME}")
+
+
+class _EntryPointIndex:
+    """Index of the launcher plugin entry points, which memoizes the loaded classes.
+
+    Parameters
+    ----------
+    entry_points :
+        Entry points to index, as returned by :func:`_get_entry_points`.
+    """
+
+    def __init__(self, entry_points: Sequence[importlib.metadata.EntryPoint]):
+        self.entry_points = entry_points
+        # When several entry points have the same name, the first one is used.
+        self.by_name: dict[str, importlib.metadata.EntryPoint] = dict()
+        self.launch_modes: dict[str, set[str]] = dict()
+        for entry_point in entry_points:
+            self.by_name.setdefault(entry_point.name, entry_point)
+            try:
+                product_name, launch_mode = entry_point.name.split(".")
+            except ValueError:
+                continue
+            self.launch_modes.setdefault(product_name, set()).add(launch_mode)
+        self._classes: dict[int, type[LauncherProtocol[Any]]] = dict()
+
+    def load(self, entry_point: importlib.metadata.EntryPoint) -> type[LauncherProtocol[Any]]:
+        """Load the launcher class of an entry point, only importing it the first time."""
+        # Entry points are keyed by identity, since they are kept alive by
+        # 'self.entry_points'.
+        try:
+            return self._classes[id(entry_point)]
+        except KeyError:
+            launcher_class: type[LauncherProtocol[Any]] = entry_point.load()
+            self._classes[id(entry_point)] = launcher_class
+            return launcher_class
+
+    def load_by_name(self, name: str) -> type[LauncherProtocol[DataclassProtocol]]:
+        """Load the launcher class of the entry point with the given name."""
+        try:
+            entry_point = self.by_name[name]
+        except KeyError:
+            raise KeyError(f"No plugin found for '{name}'.") from None
+        return self.load(entry_point)
+
+
+_index: _EntryPointIndex | None = None
+
+
+def _get_index() -> _EntryPointIndex:
+    """Get the index of the launcher plugin entry points.
+
+    The index is rebuilt whenever :func:`_get_entry_points` returns a
+    different object, for instance after its cache is cleared.
+    """
+    global _index
+    entry_points = _get_entry_points()
+    index = _index
+    if index is None or index.entry_points is not entry_points:
+        index = _index = _EntryPointIndex(entry_points)
+    return index
 
 
 @lru_cache
 def _get_entry_points() -> tuple[importlib.metadata.EntryPoint, ...]:
-    """Get all Local Product Launcher plugin entrypoints for launchers."""
+    """Get all Local Product Launcher plugin entrypoints for launchers.
+
+    The entry points are read from the discovery cache file if the installed
+    distributions have not changed since it was written. Otherwise, they are
+    read from the metadata of the installed distributions, and the cache
+    file is updated.
+    """
+    cache_path = _get_plugin_cache_path()
+    if cache_path is None:
+        return _scan_entry_points()
+    fingerprint = _get_distributions_fingerprint()
+    cached_entry_points = _read_plugin_cache(cache_path, fingerprint)
+    if cached_entry_points is not None:
+        return cached_entry_points
+    res = _scan_entry_points()
+    _write_plugin_cache(cache_path, fingerprint, res)
+    return res
+
+
+def _scan_entry_points() -> tuple[importlib.metadata.EntryPoint, ...]:
+    """Get the launcher plugin entry points from the metadata of the installed distributions."""
     try:
-        return entry_points(group=LAUNCHER_ENTRY_POINT) + entry_points(group=DEPRECATED_LAUNCHER_ENTRY_POINT)  # type: ignore
+        return (*entry_points(group=LAUNCHER_ENTRY_POINT), *entry_points(group=DEPRECATED_LAUNCHER_ENTRY_POINT))
     except KeyError:
         return tuple()
+
+
+def _get_plugin_cache_path() -> pathlib.Path | None:
+    """Get the path of the discovery cache file, or ``None`` if the cache is disabled."""
+    if _PLUGIN_CACHE_PATH_ENV_VAR_NAME in os.environ:
+        path = os.environ[_PLUGIN_CACHE_PATH_ENV_VAR_NAME]
+        return pathlib.Path(path) if path else None
+    # Each Python environment has its own cache file, so environments used in
+    # alternation do not overwrite each other's cache.
+    environment_key = hashlib.sha256(f"{sys.prefix}\0{sys.executable}".encode()).hexdigest()[:16]
+    return (
+        pathlib.Path(platformdirs.user_cache_dir("ansys_tools_local_product_launcher"))
+        / f"entry_points-{environment_key}.json"
+    )
+
+
+def _get_distributions_fingerprint() -> str:
+    """Get a fingerprint of the distributions installed on ``sys.path``.
+
+    The fingerprint changes when a distribution is installed, removed or
+    updated, since this changes the modification time of its metadata
+    directory, or of the directory containing it. The current working
+    directory is not taken into account, s.t. the fingerprint does not
+    depend on where the interpreter is started.
+    """
+    digest = hashlib.sha256(f"{sys.executable}\0{sys.version}".encode())
+    for path_entry in sys.path:
+        if not path_entry:
+            continue
+        path = pathlib.Path(path_entry).absolute()
+        try:
+            digest.update(f"\0{path}\0{path.stat().st_mtime_ns}".encode())
+            if not path.is_dir():
+                continue
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".dist-info", ".egg-info")):
+                        digest.update(f"\0{entry.name}\0{entry.stat().st_mtime_ns}".encode())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def _entry_point_key(entry_point: importlib.metadata.EntryPoint) -> tuple[str, str, str]:
+    return entry_point.name, entry_point.value, entry_point.group
+
+
+# Names of the distributions of the entry points read from the discovery cache
+_CACHED_DISTRIBUTION_NAMES: dict[tuple[str, str, str], str] = {}
+
+
+def _read_plugin_cache(path: pathlib.Path, fingerprint: str) -> tuple[importlib.metadata.EntryPoint, ...] | None:
+    """Read the entry points from the discovery cache file, if it matches the fingerprint."""
+    try:
+        with path.open(encoding="utf-8") as in_f:
+            content = json.load(in_f)
+        if content["fingerprint"] != fingerprint:
+            return None
+        res = []
+        distribution_names = {}
+        for item in content["entry_points"]:
+            entry_point = importlib.metadata.EntryPoint(name=item["name"], value=item["value"], group=item["group"])
+            if item["dist"] is not None:
+                if not isinstance(item["dist"], str):
+                    raise TypeError("Invalid distribution name.")
+                distribution_names[_entry_point_key(entry_point)] = item["dist"]
+            res.append(entry_point)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # The cache is missing, corrupted or was written by an incompatible
+        # version; it is rewritten after scanning the entry points.
+        return None
+    _CACHED_DISTRIBUTION_NAMES.update(distribution_names)
+    return tuple(res)
+
+
+def _write_plugin_cache(
+    path: pathlib.Path, fingerprint: str, entry_points: Sequence[importlib.metadata.EntryPoint]
+) -> None:
+    """Write the entry points to the discovery cache file, ignoring failures."""
+    items = []
+    for entry_point in entry_points:
+        dist = getattr(entry_point, "dist", None)
+        items.append(
+            {
+                "name": entry_point.name,
+                "value": entry_point.value,
+                "group": entry_point.group,
+                "dist": None if dist is None else dist.name,
+            }
+        )
+    content = json.dumps({"fingerprint": fingerprint, "entry_points": items}, indent=2)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, s.t. concurrent readers never
+        # see a partially written cache.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
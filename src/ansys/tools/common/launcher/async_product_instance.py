@@ -0,0 +1,254 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides an asynchronous wrapper for interacting with launched product instances."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+import weakref
+
+import grpc
+
+from ansys.tools.common.exceptions import ProductInstanceError
+
+from .helpers.health import wait_for_servers_async
+from .helpers.ports import PortLeases, collect_port_leases
+from .interface import LAUNCHER_CONFIG_T, LauncherProtocol, ServerType
+from .product_instance import _GRPC_OPTIONS, _MAX_POLL_INTERVAL, _MIN_POLL_INTERVAL
+
+__all__ = ["AsyncProductInstance"]
+
+
+class AsyncProductInstance:
+    """Provides an asynchronous wrapper for interacting with the launched product instance.
+
+    This class is the ``asyncio`` counterpart of :class:`.ProductInstance`.
+    Its methods do not block the event loop, so that many instances can be
+    started, waited for, and stopped concurrently from a single event loop.
+    Unlike :class:`.ProductInstance`, the instance is not started on
+    construction. Use :func:`.alaunch_product` or await :meth:`start`.
+
+    The launcher methods are run in the default executor of the event loop.
+    Launcher plugins can instead provide coroutine methods ``start_async``,
+    ``stop_async`` and ``check_async``, with the same signatures as
+    ``start``, ``stop`` and ``check``, which are awaited directly.
+
+    The gRPC channels of the instance are ``grpc.aio`` channels, bound to
+    the event loop in which the instance is started.
+
+    The :class:`AsyncProductInstance` class can be used as an asynchronous
+    context manager, stopping the instance when exiting the context.
+    """
+
+    def __init__(self, *, launcher: LauncherProtocol[LAUNCHER_CONFIG_T]):
+        self._launcher = launcher
+        self._finalizer: weakref.finalize[Any, AsyncProductInstance]
+        self._port_leases: PortLeases
+        self._channels: dict[str, grpc.aio.Channel] = dict()
+
+    async def __aenter__(self) -> AsyncProductInstance:
+        """Enter the context manager defined by the product instance."""
+        if self.stopped:
+            raise ProductInstanceError("The product instance is stopped. Cannot enter context.")
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        """Stop the product instance when exiting a context manager."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the product instance.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance is already started or the URLs do not match
+            the launcher's SERVER_SPEC.
+        """
+        if not self.stopped:
+            raise ProductInstanceError("Cannot start the server. It has already been started.")
+
+        self._finalizer = weakref.finalize(self, self._launcher.stop, timeout=None)
+        # The ports handed out to the launcher are leased until the instance is stopped.
+        with collect_port_leases() as self._port_leases:
+            try:
+                await self._call_launcher("start")
+            except BaseException:
+                self._port_leases.release()
+                raise
+        self._channels = dict()
+        urls = self.urls
+
+        transport_options_map = self._launcher.transport_options
+        for key, server_type in self._launcher.SERVER_SPEC.items():
+            if server_type == ServerType.GRPC:
+                self._channels[key] = transport_options_map[key].create_channel(grpc_options=_GRPC_OPTIONS, aio=True)
+            elif server_type == ServerType.GENERIC:
+                if key not in urls:
+                    raise ProductInstanceError(
+                        f"The URL for the generic server with key '{key}' was not provided by the launcher."
+                    )
+            else:
+                raise ProductInstanceError(f"Unsupported server type: {server_type}")
+
+    async def stop(self, *, timeout: float | None = None) -> None:
+        """Stop the product instance.
+
+        The gRPC channels of the instance are closed before the product is
+        stopped.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds after which the instance is forcefully stopped.
+            Not all launch methods implement this parameter. If the parameter
+            is not implemented, it is ignored.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance is already stopped.
+        """
+        if self.stopped:
+            raise ProductInstanceError("Cannot stop the server. It has already been stopped.")
+        await asyncio.gather(*(channel.close() for channel in self._channels.values()))
+        await self._call_launcher("stop", timeout=timeout)
+        self._finalizer.detach()
+        self._port_leases.release()
+
+    async def restart(self, stop_timeout: float | None = None) -> None:
+        """Stop and then start the product instance.
+
+        Parameters
+        ----------
+        stop_timeout : float, default: None
+            Time in seconds after which the instance is forcefully stopped.
+            Not all launch methods implement this parameter. If the parameter
+            is not implemented, it is ignored.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance is already stopped or URL keys mismatch.
+        """
+        await self.stop(timeout=stop_timeout)
+        await self.start()
+
+    async def check(self, timeout: float | None = None) -> bool:
+        """Check if all servers are responding to requests.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for the servers to respond. There
+            is no guarantee that the ``check()`` method returns within this time.
+            Instead, this parameter is used as a hint to the launcher implementation.
+        """
+        return bool(await self._call_launcher("check", timeout=timeout))
+
+    async def wait(self, timeout: float) -> None:
+        """Wait for all servers to respond.
+
+        This method waits for the servers in the same way as
+        :meth:`.ProductInstance.wait`, without blocking the event loop.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Wait time in seconds before raising an exception.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the server still has not responded after ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        delay = _MIN_POLL_INTERVAL
+        while True:
+            if await self.check(timeout=timeout / 3):
+                if await self._wait_for_channels(deadline):
+                    return
+                raise ProductInstanceError(f"The channels to the product are not connected after {timeout}s.")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ProductInstanceError(f"The product is not running after {timeout}s.")
+            interval = min(delay, remaining)
+            interval_end = time.monotonic() + interval
+            ready = await wait_for_servers_async(channels=self.channels, urls=self._generic_urls, timeout=interval)
+            if not all(ready.values()):
+                await asyncio.sleep(max(interval_end - time.monotonic(), 0))
+            delay = min(2 * delay, _MAX_POLL_INTERVAL)
+
+    @property
+    def urls(self) -> dict[str, str]:
+        """Read-only mapping of server keys to their URLs.
+
+        Only generic server types are listed, gRPC servers should be accessed
+        via the :attr:`.channels` property.
+        """
+        return self._launcher.urls
+
+    @property
+    def stopped(self) -> bool:
+        """Flag indicating if the product instance is currently stopped."""
+        try:
+            return not self._finalizer.alive
+        # If the server has never been started, the '_finalizer' attribute
+        # may not be defined.
+        except AttributeError:
+            return True
+
+    @property
+    def channels(self) -> dict[str, grpc.aio.Channel]:
+        """Read-only mapping of server keys to asynchronous gRPC channels."""
+        return self._channels
+
+    @property
+    def _generic_urls(self) -> dict[str, str]:
+        """Mapping of server keys to the URLs of the generic servers."""
+        urls = self.urls
+        return {
+            key: urls[key]
+            for key, server_type in self._launcher.SERVER_SPEC.items()
+            if server_type == ServerType.GENERIC
+        }
+
+    async def _wait_for_channels(self, deadline: float) -> bool:
+        """Wait until the gRPC channels are connected, or until the deadline."""
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(channel.channel_ready() for channel in self._channels.values())),
+                max(deadline - time.monotonic(), _MIN_POLL_INTERVAL),
+            )
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _call_launcher(self, name: str, **kwargs: Any) -> Any:
+        """Call a launcher method, preferring its ``<name>_async`` coroutine variant if it exists."""
+        async_method = getattr(self._launcher, f"{name}_async", None)
+        if async_method is not None:
+            return await async_method(**kwargs)
+        return await asyncio.to_thread(getattr(self._launcher, name), **kwargs)
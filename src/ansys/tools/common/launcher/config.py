@@ -27,16 +27,31 @@ for launching products. The configuration is loaded from and stored to a
 ``config.json`` file. By default, this file is located in the user configuration
 directory (platform-dependent). Its location can be specified explicitly
 with the ``ANSYS_LAUNCHER_CONFIG_PATH`` environment variable.
+
+The configuration file is reloaded when it is changed on disk, for example by
+the ``ansys-launcher`` CLI or another process. Changes which are made in-memory
+with the ``set_config_for()`` method take precedence over the file until they
+are saved.
+
+Saving the configuration merges the products changed in-memory into the current
+contents of the file, while holding a lock that is shared across processes. To
+read and modify the configuration without interference from other processes,
+use the ``transaction()`` context manager.
 """
 
+from collections.abc import Iterator
+import contextlib
 import dataclasses
+import functools
 import json
 import os
 import pathlib
+import threading
 from typing import Any, cast
 
 import platformdirs
 
+from ._file_lock import file_lock
 from ._plugins import get_config_model, get_fallback_launcher, has_fallback
 from .interface import FALLBACK_LAUNCH_MODE_NAME, LAUNCHER_CONFIG_T, DataclassProtocol
 
@@ -46,6 +61,7 @@ __all__ = [
     "is_configured",
     "get_launch_mode_for",
     "save_config",
+    "transaction",
 ]
 
 
@@ -64,6 +80,25 @@ class _LauncherConfiguration:
 
 
 _CONFIG: _LauncherConfiguration | None = None
+# Path, inode, modification time, and size of the file that ``_CONFIG`` was
+# loaded from, or ``None`` if the file did not exist. Since the file is
+# replaced when it is saved, the inode changes on every save.
+_CONFIG_FILE_STATE: tuple[pathlib.Path, int, int, int] | None = None
+# Contents of the configuration file, by product. This is used to reload only
+# the products whose configuration has changed.
+_CONFIG_FILE_CONTENTS: dict[str, Any] = {}
+# Products whose in-memory configuration has been changed, but not saved.
+_MODIFIED_PRODUCTS: set[str] = set()
+_CONFIG_LOCK = threading.RLock()
+# Configuration objects returned by ``get_config_for()``, by product name and
+# requested launch mode. This is cleared whenever the configuration changes.
+_CONFIG_OBJECT_CACHE: dict[tuple[str, str | None], DataclassProtocol] = {}
+# Number of nested ``_locked_config_file()`` contexts in this process.
+_CONFIG_FILE_LOCK_DEPTH = 0
+# Whether the configuration file has been checked for changes in the current
+# ``_checked_config_file()`` context. Only read and written with the
+# ``_CONFIG_LOCK`` held, so it is only set for the thread holding the lock.
+_CONFIG_FILE_CHECKED = False
 
 
 def get_launch_mode_for(*, product_name: str, launch_mode: str | None = None) -> str:
@@ -84,12 +119,13 @@ def get_launch_mode_for(*, product_name: str, launch_mode: str | None = None) ->
     """
     if launch_mode is not None:
         return launch_mode
-    try:
-        return _get_config()[product_name].launch_mode
-    except KeyError as exc:
-        if has_fallback(product_name=product_name):
-            return FALLBACK_LAUNCH_MODE_NAME
-        raise KeyError(f"No configuration is defined for product name '{product_name}'.") from exc
+    with _checked_config_file():
+        try:
+            return _get_config()[product_name].launch_mode
+        except KeyError as exc:
+            if has_fallback(product_name=product_name):
+                return FALLBACK_LAUNCH_MODE_NAME
+            raise KeyError(f"No configuration is defined for product name '{product_name}'.") from exc
 
 
 def get_config_for(*, product_name: str, launch_mode: str | None) -> DataclassProtocol:
@@ -110,7 +146,8 @@ def get_config_for(*, product_name: str, launch_mode: str | None) -> DataclassPr
     Returns
     -------
     DataclassProtocol
-        Configuration object.
+        Configuration object. Each call returns a new shallow copy, whose
+        fields can be set without affecting the stored configuration.
 
     Raises
     ------
@@ -120,6 +157,18 @@ def get_config_for(*, product_name: str, launch_mode: str | None) -> DataclassPr
         If the configuration type does not match the type specified by
         the launcher plugin.
     """
+    # Reload the configuration file if it has changed, which invalidates
+    # the cached configuration objects.
+    with _checked_config_file():
+        key = (product_name, launch_mode)
+        if key not in _CONFIG_OBJECT_CACHE:
+            _CONFIG_OBJECT_CACHE[key] = _get_config_for_uncached(product_name=product_name, launch_mode=launch_mode)
+        # A shallow copy is enough to let callers set the fields of the
+        # returned object, and is much cheaper than a deep copy.
+        return dataclasses.replace(_CONFIG_OBJECT_CACHE[key])
+
+
+def _get_config_for_uncached(*, product_name: str, launch_mode: str | None) -> DataclassProtocol:
     launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
 
     # Handle the case where the fallback launcher is used
@@ -138,13 +187,15 @@ def get_config_for(*, product_name: str, launch_mode: str | None) -> DataclassPr
         return config_entry
 
     # Handle the regular (configured) case
-    config_entry = _get_config()[product_name].configs[launch_mode]
-    if isinstance(config_entry, dict):
-        _get_config()[product_name].configs[launch_mode] = config_class(**config_entry)
-    else:
-        if not isinstance(config_entry, config_class):
-            raise TypeError(f"Configuration is wrong type '{type(config_entry)}'. Should be '{config_class}'.")
-    return cast(DataclassProtocol, _get_config()[product_name].configs[launch_mode])
+    with _CONFIG_LOCK:
+        product_configs = _get_config()[product_name].configs
+        config_entry = product_configs[launch_mode]
+        if isinstance(config_entry, dict):
+            config_entry = product_configs[launch_mode] = config_class(**config_entry)
+        else:
+            if not isinstance(config_entry, config_class):
+                raise TypeError(f"Configuration is wrong type '{type(config_entry)}'. Should be '{config_class}'.")
+        return config_entry
 
 
 def is_configured(*, product_name: str, launch_mode: str | None = None) -> bool:
@@ -161,14 +212,15 @@ def is_configured(*, product_name: str, launch_mode: str | None = None) -> bool:
         default is ``None``, in which case the default
         launch mode is used.
     """
-    try:
-        launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
-        if launch_mode == FALLBACK_LAUNCH_MODE_NAME:
+    with _checked_config_file():
+        try:
+            launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
+            if launch_mode == FALLBACK_LAUNCH_MODE_NAME:
+                return False
+            _get_config()[product_name].configs[launch_mode]
+            return True
+        except KeyError:
             return False
-        _get_config()[product_name].configs[launch_mode]
-        return True
-    except KeyError:
-        return False
 
 
 def set_config_for(
@@ -198,52 +250,215 @@ def set_config_for(
         Whether to change the default launch mode for the product
         to the value specified for the ``launch_mode`` parameter.
     """
-    if is_configured(product_name=product_name):
-        product_config = _get_config()[product_name]
-        product_config.configs[launch_mode] = config
-        if overwrite_default:
-            product_config.launch_mode = launch_mode
-    else:
-        _get_config()[product_name] = _ProductConfig(launch_mode=launch_mode, configs={launch_mode: config})
+    with _checked_config_file():
+        if is_configured(product_name=product_name):
+            product_config = _get_config()[product_name]
+            product_config.configs[launch_mode] = config
+            if overwrite_default:
+                product_config.launch_mode = launch_mode
+        else:
+            _get_config()[product_name] = _ProductConfig(launch_mode=launch_mode, configs={launch_mode: config})
+        _MODIFIED_PRODUCTS.add(product_name)
+        _CONFIG_OBJECT_CACHE.clear()
 
 
 def save_config() -> None:
     """Save the configuration to a file on disk.
 
     This method saves the current in-memory configuration to the ``config.json`` file.
+    The configuration of products which were changed with the ``set_config_for()``
+    method is merged into the current contents of the file, so changes that other
+    processes made to other products are kept.
+
+    The file is replaced atomically, so concurrent readers never see a partially
+    written file.
     """
-    if _CONFIG is not None:
+    global _CONFIG_FILE_STATE, _CONFIG_FILE_CONTENTS
+    with _locked_config_file():
+        if _CONFIG is None:
+            return
         file_path = _get_config_path()
+        # Reload the products which were changed by other processes, keeping
+        # the products which were changed in-memory.
+        _get_config()
         # Convert to JSON before saving; in this way, errors during
         # JSON encoding will not clobber the config file.
-        config_json = json.dumps(dataclasses.asdict(_CONFIG)["__root__"], indent=2)
-        with file_path.open("w") as out_f:
-            out_f.write(config_json)
+        config_dict = dataclasses.asdict(_CONFIG)["__root__"]
+        config_json = json.dumps(config_dict, indent=2)
+        _write_file_atomic(file_path, config_json)
+        # The file now matches the in-memory configuration, so it does
+        # not need to be reloaded.
+        _CONFIG_FILE_STATE = _get_config_file_state(file_path)
+        _CONFIG_FILE_CONTENTS = config_dict
+        _MODIFIED_PRODUCTS.clear()
+
+
+@contextlib.contextmanager
+def transaction() -> Iterator[None]:
+    """Read, modify, and save the configuration without interference from other processes.
+
+    Within the context, other processes and threads cannot save the configuration,
+    and the configuration reflects the latest contents of the ``config.json`` file.
+    When the context exits without an exception, the configuration is saved if it
+    was changed. Otherwise, changes made within the context are kept in-memory, but
+    not saved.
+
+    Examples
+    --------
+    Change the default launch mode of a product, based on its current value.
+
+    >>> from ansys.tools.common.launcher import config
+    >>> with config.transaction():
+    ...     if config.get_launch_mode_for(product_name="MAPDL") != "direct":
+    ...         config.set_config_for(
+    ...             product_name="MAPDL",
+    ...             launch_mode="direct",
+    ...             config=config.get_config_for(product_name="MAPDL", launch_mode="direct"),
+    ...             overwrite_default=True,
+    ...         )
+    """
+    with _locked_config_file():
+        yield
+        if _MODIFIED_PRODUCTS:
+            save_config()
+
+
+@contextlib.contextmanager
+def _locked_config_file() -> Iterator[None]:
+    """Hold the configuration lock, and the lock on the configuration file.
+
+    The file lock is only acquired by the outermost context, since it is not
+    reentrant.
+    """
+    global _CONFIG_FILE_LOCK_DEPTH
+    with _CONFIG_LOCK:
+        if _CONFIG_FILE_LOCK_DEPTH:
+            lock: contextlib.AbstractContextManager[None] = contextlib.nullcontext()
+        else:
+            config_path = _get_config_path()
+            lock = file_lock(config_path.with_name(f"{config_path.name}.lock"))
+        with lock:
+            _CONFIG_FILE_LOCK_DEPTH += 1
+            try:
+                yield
+            finally:
+                _CONFIG_FILE_LOCK_DEPTH -= 1
+
+
+def _write_file_atomic(path: pathlib.Path, content: str) -> None:
+    """Write a file by replacing it with a fully written temporary file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("w") as out_f:
+            out_f.write(content)
+            out_f.flush()
+            os.fsync(out_f.fileno())
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextlib.contextmanager
+def _checked_config_file() -> Iterator[None]:
+    """Hold the configuration lock, and check the configuration file for changes once.
+
+    Within the context, ``_get_config()`` only checks whether the file has
+    changed on its first call. This lets the public functions, which call each
+    other and ``_get_config()`` several times, check the file once per call.
+    """
+    global _CONFIG_FILE_CHECKED
+    with _CONFIG_LOCK:
+        if _CONFIG_FILE_CHECKED:
+            yield
+            return
+        _get_config()
+        _CONFIG_FILE_CHECKED = True
+        try:
+            yield
+        finally:
+            _CONFIG_FILE_CHECKED = False
 
 
 def _get_config() -> dict[str, _ProductConfig]:
-    global _CONFIG
-    if _CONFIG is None:
-        _CONFIG = _load_config()
-    return _CONFIG.__root__
+    global _CONFIG, _CONFIG_FILE_STATE, _CONFIG_FILE_CONTENTS
+    with _CONFIG_LOCK:
+        if _CONFIG_FILE_CHECKED and _CONFIG is not None:
+            return _CONFIG.__root__
+        config_path = _get_config_path()
+        file_state = _get_config_file_state(config_path)
+        if _CONFIG is None or file_state != _CONFIG_FILE_STATE:
+            contents = _read_config_file(config_path) if file_state is not None else {}
+            _CONFIG = _update_config(_CONFIG, contents)
+            _CONFIG_FILE_STATE = file_state
+            _CONFIG_OBJECT_CACHE.clear()
+            _CONFIG_FILE_CONTENTS = contents
+        return _CONFIG.__root__
+
+
+def _get_config_file_state(config_path: pathlib.Path) -> tuple[pathlib.Path, int, int, int] | None:
+    """Get the path, inode, modification time, and size of the configuration file."""
+    try:
+        stat_result = config_path.stat()
+    except FileNotFoundError:
+        return None
+    return config_path, stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size
+
 
+def _read_config_file(config_path: pathlib.Path) -> dict[str, Any]:
+    try:
+        with config_path.open() as in_f:
+            return cast(dict[str, Any], json.load(in_f))
+    except FileNotFoundError:
+        return {}
 
-def _load_config() -> _LauncherConfiguration:
-    config_path = _get_config_path()
-    if not config_path.exists():
-        return _LauncherConfiguration(__root__={})
-    with config_path.open() as in_f:
-        return _LauncherConfiguration(__root__={key: _ProductConfig(**val) for key, val in json.load(in_f).items()})
+
+def _update_config(config: _LauncherConfiguration | None, contents: dict[str, Any]) -> _LauncherConfiguration:
+    """Update the configuration from the contents of the configuration file.
+
+    Only the products whose contents have changed are reloaded, and products
+    with unsaved in-memory changes are kept.
+    """
+    current = {} if config is None else config.__root__
+    updated: dict[str, _ProductConfig] = {}
+    for product_name, product_contents in contents.items():
+        if product_name in current and (
+            product_name in _MODIFIED_PRODUCTS or _CONFIG_FILE_CONTENTS.get(product_name) == product_contents
+        ):
+            updated[product_name] = current[product_name]
+        else:
+            updated[product_name] = _ProductConfig(
+                launch_mode=product_contents["launch_mode"], configs=dict(product_contents["configs"])
+            )
+    for product_name in _MODIFIED_PRODUCTS:
+        if product_name in current:
+            updated.setdefault(product_name, current[product_name])
+    return _LauncherConfiguration(__root__=updated)
 
 
 def _reset_config() -> None:
-    global _CONFIG
-    _CONFIG = None
+    global _CONFIG, _CONFIG_FILE_STATE, _CONFIG_FILE_CONTENTS
+    with _CONFIG_LOCK:
+        _CONFIG = None
+        _CONFIG_FILE_STATE = None
+        _CONFIG_FILE_CONTENTS = {}
+        _MODIFIED_PRODUCTS.clear()
+        _CONFIG_OBJECT_CACHE.clear()
 
 
 def _get_config_path() -> pathlib.Path:
-    if _CONFIG_PATH_ENV_VAR_NAME in os.environ:
-        config_path = pathlib.Path(os.environ[_CONFIG_PATH_ENV_VAR_NAME])
+    return _get_config_path_for(os.environ.get(_CONFIG_PATH_ENV_VAR_NAME))
+
+
+@functools.lru_cache
+def _get_config_path_for(config_path_env_value: str | None) -> pathlib.Path:
+    """Get the configuration file path for a value of the environment variable.
+
+    The path is checked for each value, and the configuration directory is
+    created, only once per process.
+    """
+    if config_path_env_value is not None:
+        config_path = pathlib.Path(config_path_env_value)
         if not config_path.parent.exists():
             raise FileNotFoundError(
                 f"The directory {config_path.parent} specified in the "
@@ -23,6 +23,7 @@
 """Defines options for connecting to a gRPC server."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass
 import enum
 from pathlib import Path
@@ -74,11 +75,24 @@ class TransportMode(StrEnum):
     INSECURE = "insecure"
 
 
+@dataclass(kw_only=True)
 class TransportOptionsBase(ABC):
     """Base class for transport options."""
 
     _MODE: ClassVar[TransportMode]
 
+    compression: str | None = None
+    """Compression algorithm for the messages sent to the server.
+
+    Options are ``"gzip"``, ``"deflate"`` and ``"none"``. By default,
+    messages are not compressed.
+    """
+    compression_threshold: int | None = None
+    """Minimum size in bytes of a request message for it to be compressed.
+
+    By default, all messages are compressed if ``compression`` is set.
+    """
+
     @property
     def mode(self) -> TransportMode:
         """Transport mode."""
@@ -119,7 +133,9 @@ class UDSOptions(TransportOptionsBase):
 
     uds_service: str
     uds_dir: str | Path | None = None
-    uds_id: str | None = None
+    uds_id: str | Sequence[str] | None = None
+    uds_abstract: bool = False
+    """Whether to use a Linux abstract-namespace socket instead of a socket file."""
 
     def _to_cyberchannel_kwargs(self) -> dict[str, Any]:
         return asdict(self) | {"transport_mode": self.mode.value}
@@ -131,7 +147,7 @@ class WNUAOptions(TransportOptionsBase):
 
     _MODE = TransportMode.WNUA
 
-    port: int
+    port: int | Sequence[int]
 
     def _to_cyberchannel_kwargs(self) -> dict[str, Any]:
         return asdict(self) | {"transport_mode": self.mode.value, "host": "localhost"}
@@ -145,7 +161,7 @@ class MTLSOptions(TransportOptionsBase):
 
     certs_dir: str | Path | None = None
     host: str = "localhost"
-    port: int
+    port: int | Sequence[int]
     allow_remote_host: bool = False
 
     def _to_cyberchannel_kwargs(self) -> dict[str, Any]:
@@ -164,7 +180,7 @@ class InsecureOptions(TransportOptionsBase):
     _MODE = TransportMode.INSECURE
 
     host: str = "localhost"
-    port: int
+    port: int | Sequence[int]
     allow_remote_host: bool = False
 
     def _to_cyberchannel_kwargs(self) -> dict[str, Any]:
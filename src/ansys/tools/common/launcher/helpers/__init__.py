@@ -22,6 +22,6 @@
 
 """Helper modules for implementing local product launcher plugins."""
 
-from . import grpc, ports
+from . import grpc, health, ports
 
-__all__ = ["grpc", "ports"]
+__all__ = ["grpc", "health", "ports"]
@@ -22,10 +22,17 @@
 
 """Helpers for interacting with gRPC servers."""
 
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+import time
+
 import grpc  # type: ignore[import-untyped]
 from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse  # type: ignore[import-untyped]
 from grpc_health.v1.health_pb2_grpc import HealthStub  # type: ignore[import-untyped]
 
+_MIN_POLL_INTERVAL = 0.01
+_MAX_POLL_INTERVAL = 1.0
+
 
 def check_grpc_health(channel: grpc.Channel, timeout: float | None = None) -> bool:
     """Check that a gRPC server is responding to health check requests.
@@ -52,3 +59,195 @@ def check_grpc_health(channel: grpc.Channel, timeout: float | None = None) -> bo
     except grpc.RpcError:
         pass
     return False
+
+
+def check_grpc_health_concurrently(channels: Iterable[grpc.Channel], timeout: float | None = None) -> list[bool]:
+    """Check that several gRPC servers are responding to health check requests.
+
+    The health check requests are sent to all servers at once, so the time
+    taken is the maximum, rather than the sum, of the time taken by each
+    server.
+
+    Parameters
+    ----------
+    channels :
+        Channels to the gRPC servers.
+    timeout :
+        Timeout in seconds for each gRPC health check request.
+
+    Returns
+    -------
+    list[bool]
+        For each channel, ``True`` if the health check succeeds, ``False`` otherwise.
+    """
+    futures = [HealthStub(channel).Check.future(request=HealthCheckRequest(), timeout=timeout) for channel in channels]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result().status == HealthCheckResponse.ServingStatus.SERVING)
+        except grpc.RpcError:
+            results.append(False)
+    return results
+
+
+def wait_for_grpc_health(channel: grpc.Channel, timeout: float | None = None) -> bool:
+    """Wait until a gRPC server reports that it is serving.
+
+    Instead of polling the server, this function waits for the channel to
+    become ready, and then subscribes to the ``Watch`` method of the gRPC
+    health service. It thus returns as soon as the server reports that it is
+    serving. If the server does not implement the ``Watch`` method, it falls
+    back to polling the ``Check`` method with an exponentially increasing
+    interval.
+
+    Parameters
+    ----------
+    channel :
+        Channel to the gRPC server.
+    timeout :
+        Time in seconds to wait for the server. By default, wait indefinitely.
+
+    Returns
+    -------
+    bool
+        ``True`` if the server is serving, ``False`` if the timeout is reached
+        or the server does not implement the gRPC health service.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    stub = HealthStub(channel)
+    for delay in _poll_intervals():
+        try:
+            # The ready future is driven by the connectivity state
+            # callbacks of the channel.
+            grpc.channel_ready_future(channel).result(timeout=_remaining(deadline))
+        except grpc.FutureTimeoutError:
+            return False
+        responses = stub.Watch(HealthCheckRequest(), timeout=_remaining(deadline), wait_for_ready=True)
+        try:
+            for response in responses:
+                if response.status == HealthCheckResponse.ServingStatus.SERVING:
+                    responses.cancel()
+                    return True
+        except grpc.RpcError as exc:
+            if exc.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return _poll(lambda: _check_serving(stub, deadline), deadline)
+            if exc.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                return False
+        # The stream was interrupted, for instance because the server
+        # restarted. Subscribe again after a short delay.
+        if not _sleep(delay, deadline):
+            return False
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+async def wait_for_grpc_health_async(channel: grpc.aio.Channel, timeout: float | None = None) -> bool:
+    """Wait until a gRPC server reports that it is serving, without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`wait_for_grpc_health`, for
+    ``grpc.aio`` channels.
+
+    Parameters
+    ----------
+    channel :
+        Asynchronous channel to the gRPC server.
+    timeout :
+        Time in seconds to wait for the server. By default, wait indefinitely.
+
+    Returns
+    -------
+    bool
+        ``True`` if the server is serving, ``False`` if the timeout is reached
+        or the server does not implement the gRPC health service.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    stub = HealthStub(channel)
+    for delay in _poll_intervals():
+        try:
+            await asyncio.wait_for(channel.channel_ready(), _remaining(deadline))
+        except asyncio.TimeoutError:
+            return False
+        call = stub.Watch(HealthCheckRequest(), timeout=_remaining(deadline), wait_for_ready=True)
+        try:
+            async for response in call:
+                if response.status == HealthCheckResponse.ServingStatus.SERVING:
+                    call.cancel()
+                    return True
+        except grpc.RpcError as exc:
+            if exc.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return await _poll_async(lambda: _check_serving_async(stub, deadline), deadline)
+            if exc.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                return False
+        if not await _sleep_async(delay, deadline):
+            return False
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _check_serving(stub: HealthStub, deadline: float | None) -> bool | None:
+    """Check the health of a server, returning ``None`` if the check is not implemented."""
+    try:
+        response = stub.Check(HealthCheckRequest(), timeout=_remaining(deadline))
+    except grpc.RpcError as exc:
+        return None if exc.code() == grpc.StatusCode.UNIMPLEMENTED else False
+    return bool(response.status == HealthCheckResponse.ServingStatus.SERVING)
+
+
+def _poll(check: Callable[[], bool | None], deadline: float | None) -> bool:
+    """Call ``check`` with an exponentially increasing interval until it does not return ``False``."""
+    for delay in _poll_intervals():
+        result = check()
+        if result is not False:
+            return bool(result)
+        if not _sleep(delay, deadline):
+            return False
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+async def _check_serving_async(stub: HealthStub, deadline: float | None) -> bool | None:
+    """Check the health of a server asynchronously, returning ``None`` if the check is not implemented."""
+    try:
+        response = await stub.Check(HealthCheckRequest(), timeout=_remaining(deadline))
+    except grpc.RpcError as exc:
+        return None if exc.code() == grpc.StatusCode.UNIMPLEMENTED else False
+    return bool(response.status == HealthCheckResponse.ServingStatus.SERVING)
+
+
+async def _poll_async(check: Callable[[], Awaitable[bool | None]], deadline: float | None) -> bool:
+    """Await ``check`` with an exponentially increasing interval until it does not return ``False``."""
+    for delay in _poll_intervals():
+        result = await check()
+        if result is not False:
+            return bool(result)
+        if not await _sleep_async(delay, deadline):
+            return False
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _poll_intervals() -> Iterator[float]:
+    """Yield exponentially increasing polling intervals."""
+    delay = _MIN_POLL_INTERVAL
+    while True:
+        yield delay
+        delay = min(2 * delay, _MAX_POLL_INTERVAL)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Get the time remaining until the deadline."""
+    return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+
+def _sleep(delay: float, deadline: float | None) -> bool:
+    """Sleep for ``delay`` seconds, or until the deadline. Return ``False`` if the deadline is reached."""
+    remaining = _remaining(deadline)
+    if remaining is not None and remaining <= 0:
+        return False
+    time.sleep(delay if remaining is None else min(delay, remaining))
+    return True
+
+
+async def _sleep_async(delay: float, deadline: float | None) -> bool:
+    """Sleep asynchronously for ``delay`` seconds, or until the deadline. Return ``False`` at the deadline."""
+    remaining = _remaining(deadline)
+    if remaining is not None and remaining <= 0:
+        return False
+    await asyncio.sleep(delay if remaining is None else min(delay, remaining))
+    return True
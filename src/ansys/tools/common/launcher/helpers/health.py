@@ -0,0 +1,252 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers for checking that the servers of a product instance are responding."""
+
+import asyncio
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import time
+from urllib.parse import urlsplit
+
+import grpc  # type: ignore[import-untyped]
+import requests
+
+from .grpc import (
+    _poll,
+    _poll_async,
+    _remaining,
+    check_grpc_health_concurrently,
+    wait_for_grpc_health,
+    wait_for_grpc_health_async,
+)
+
+__all__ = [
+    "check_servers",
+    "check_url",
+    "wait_for_servers",
+    "wait_for_servers_async",
+    "wait_for_url",
+    "wait_for_url_async",
+]
+
+_DEFAULT_URL_TIMEOUT = 10.0
+
+
+def check_url(url: str, timeout: float | None = None) -> bool:
+    """Check that a generic server is responding at a URL.
+
+    For ``http://`` and ``https://`` URLs, a ``GET`` request is sent, and any
+    HTTP response counts as success. For other URLs, such as ``host:port``,
+    a TCP connection is opened.
+
+    Parameters
+    ----------
+    url :
+        URL of the server.
+    timeout :
+        Timeout in seconds for the check. By default, ten seconds.
+
+    Returns
+    -------
+    bool
+        ``True`` if the server responds, ``False`` otherwise.
+    """
+    timeout = _DEFAULT_URL_TIMEOUT if timeout is None else timeout
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    if parts.scheme in ("http", "https"):
+        try:
+            requests.get(url, timeout=timeout)
+        except requests.RequestException:
+            return False
+        return True
+    if parts.hostname is None or parts.port is None:
+        raise ValueError(f"The URL '{url}' does not contain a host and a port.")
+    try:
+        with socket.create_connection((parts.hostname, parts.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def check_servers(
+    *,
+    channels: Mapping[str, grpc.Channel] | None = None,
+    urls: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> dict[str, bool]:
+    """Check several gRPC and generic servers concurrently.
+
+    The gRPC health checks are sent to all gRPC servers at once, while the
+    generic servers are probed in parallel threads. The time taken is thus
+    the maximum, rather than the sum, of the time taken by each server.
+
+    Parameters
+    ----------
+    channels :
+        Channels to the gRPC servers, by server key.
+    urls :
+        URLs of the generic servers, by server key. See :func:`check_url`.
+    timeout :
+        Timeout in seconds for each check.
+
+    Returns
+    -------
+    dict[str, bool]
+        For each server key, ``True`` if the server responds, ``False`` otherwise.
+    """
+    channels = dict(channels or {})
+    urls = dict(urls or {})
+    results: dict[str, bool] = {}
+    with ThreadPoolExecutor(max_workers=max(len(urls), 1)) as executor:
+        url_futures = {key: executor.submit(check_url, url, timeout) for key, url in urls.items()}
+        results.update(zip(channels, check_grpc_health_concurrently(channels.values(), timeout=timeout)))
+        results.update({key: future.result() for key, future in url_futures.items()})
+    return results
+
+
+def wait_for_url(url: str, timeout: float | None = None) -> bool:
+    """Wait until a generic server is responding at a URL.
+
+    The server is checked with :func:`check_url`, with an exponentially
+    increasing interval between the checks. The server is thus detected
+    quickly after it starts, without sending many requests to slow-starting
+    servers.
+
+    Parameters
+    ----------
+    url :
+        URL of the server.
+    timeout :
+        Time in seconds to wait for the server. By default, wait indefinitely.
+
+    Returns
+    -------
+    bool
+        ``True`` if the server responds, ``False`` if the timeout is reached.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    return _poll(lambda: _check_url_until(url, deadline), deadline)
+
+
+def _check_url_until(url: str, deadline: float | None) -> bool:
+    """Check a URL with the time remaining until the deadline as timeout."""
+    remaining = _remaining(deadline)
+    # A timeout of zero is rejected by 'requests', and would fail anyway.
+    if remaining is not None and remaining <= 0:
+        return False
+    return check_url(url, timeout=remaining)
+
+
+def wait_for_servers(
+    *,
+    channels: Mapping[str, grpc.Channel] | None = None,
+    urls: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> dict[str, bool]:
+    """Wait concurrently until several gRPC and generic servers are responding.
+
+    The gRPC servers are waited for with :func:`.wait_for_grpc_health`, and
+    the generic servers with :func:`wait_for_url`.
+
+    Parameters
+    ----------
+    channels :
+        Channels to the gRPC servers, by server key.
+    urls :
+        URLs of the generic servers, by server key.
+    timeout :
+        Time in seconds to wait for the servers. By default, wait indefinitely.
+
+    Returns
+    -------
+    dict[str, bool]
+        For each server key, ``True`` if the server responds, ``False`` otherwise.
+    """
+    channels = dict(channels or {})
+    urls = dict(urls or {})
+    with ThreadPoolExecutor(max_workers=max(len(channels) + len(urls), 1)) as executor:
+        futures = {key: executor.submit(wait_for_grpc_health, channel, timeout) for key, channel in channels.items()}
+        futures.update({key: executor.submit(wait_for_url, url, timeout) for key, url in urls.items()})
+        return {key: future.result() for key, future in futures.items()}
+
+
+async def wait_for_url_async(url: str, timeout: float | None = None) -> bool:
+    """Wait until a generic server is responding at a URL, without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`wait_for_url`. The checks
+    run in the default executor of the event loop.
+
+    Parameters
+    ----------
+    url :
+        URL of the server.
+    timeout :
+        Time in seconds to wait for the server. By default, wait indefinitely.
+
+    Returns
+    -------
+    bool
+        ``True`` if the server responds, ``False`` if the timeout is reached.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    async def _check() -> bool:
+        return await asyncio.to_thread(_check_url_until, url, deadline)
+
+    return await _poll_async(_check, deadline)
+
+
+async def wait_for_servers_async(
+    *,
+    channels: Mapping[str, grpc.aio.Channel] | None = None,
+    urls: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> dict[str, bool]:
+    """Wait concurrently until several gRPC and generic servers are responding, without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`wait_for_servers`, for
+    ``grpc.aio`` channels.
+
+    Parameters
+    ----------
+    channels :
+        Asynchronous channels to the gRPC servers, by server key.
+    urls :
+        URLs of the generic servers, by server key.
+    timeout :
+        Time in seconds to wait for the servers. By default, wait indefinitely.
+
+    Returns
+    -------
+    dict[str, bool]
+        For each server key, ``True`` if the server responds, ``False`` otherwise.
+    """
+    channels = dict(channels or {})
+    urls = dict(urls or {})
+    keys = [*channels, *urls]
+    results = await asyncio.gather(
+        *(wait_for_grpc_health_async(channel, timeout) for channel in channels.values()),
+        *(wait_for_url_async(url, timeout) for url in urls.values()),
+    )
+    return dict(zip(keys, results))
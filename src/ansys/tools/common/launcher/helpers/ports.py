@@ -20,30 +20,275 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Helpers for managing port assignment."""
+"""Helpers for managing port assignment.
 
-from contextlib import ExitStack, closing
+Ports returned by :func:`find_free_ports` are leased: a lock on a lease file,
+which is shared across processes, ensures that the same port is not handed out
+again until the lease is released. Leases taken while starting a
+:class:`.ProductInstance` are released when the instance is stopped. Other
+leases are released once many newer ports have been handed out, or when the
+process exits.
+
+By default, the ports are assigned by the operating system. To hand out ports
+from a fixed range instead, set the ``ANSYS_LAUNCHER_PORT_RANGE`` environment
+variable to the first and last port of the range, for example ``50000-50999``.
+The lease files are stored in the user cache directory, unless another directory
+is specified with the ``ANSYS_LAUNCHER_PORT_LEASE_DIR`` environment variable.
+They are deleted when the lease is released.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import ExitStack, closing, contextmanager
+from contextvars import ContextVar
+import os
+import pathlib
+import random
 import socket
+import sys
+import threading
+from typing import BinaryIO
+import weakref
+
+import platformdirs
+
+from .._file_lock import try_lock_file, unlock_file
+
+__all__ = ["PortLeases", "collect_port_leases", "find_free_ports"]
+
+_PORT_RANGE_ENV_VAR_NAME = "ANSYS_LAUNCHER_PORT_RANGE"
+_PORT_LEASE_DIR_ENV_VAR_NAME = "ANSYS_LAUNCHER_PORT_LEASE_DIR"
+
+# Ports recently returned by 'find_free_ports'. They are not returned again
+# until they drop out of this history, s.t. products launched concurrently
+# from this process do not get the same port.
+_RECENT_PORTS_MAXLEN = 1024
+_recent_ports: deque[int] = deque(maxlen=_RECENT_PORTS_MAXLEN)
+_recent_ports_lock = threading.Lock()
+
+# Leases on ports returned outside of 'collect_port_leases'. Since nothing
+# releases them explicitly, the oldest leases are released once this
+# history is full.
+_UNSCOPED_LEASES_MAXLEN = 64
+_unscoped_leases: deque["_PortLease"] = deque()
+
+# Position in the port range at which the next search starts. It is chosen
+# randomly, s.t. concurrent processes start their searches at different ports.
+_next_range_index: int | None = None
+
+_current_leases: ContextVar["PortLeases | None"] = ContextVar("_current_leases", default=None)
+
+
+class _PortLease:
+    """Lock on the lease file of a port."""
+
+    def __init__(self, port: int, lock_file: BinaryIO | None):
+        self.port = port
+        self._lock_file = lock_file
+        if lock_file is not None:
+            # Close the lock file if the lease is garbage collected without
+            # being released.
+            weakref.finalize(self, lock_file.close)
+
+    @classmethod
+    def acquire(cls, port: int) -> "_PortLease | None":
+        """Lease a port, or return ``None`` if it is leased by someone else.
+
+        If the lease directory cannot be used, the port is leased within this
+        process only.
+        """
+        try:
+            lease_dir = _get_lease_dir()
+            lease_dir.mkdir(parents=True, exist_ok=True)
+            lock_file = try_lock_file(lease_dir / f"{port}.lock")
+        except OSError:
+            return cls(port, None)
+        if lock_file is None:
+            return None
+        return cls(port, lock_file)
+
+    def release(self) -> None:
+        """Release the lease and delete its lease file. Releasing it again has no effect."""
+        if self._lock_file is not None:
+            unlock_file(self._lock_file, delete=True)
+
+
+class PortLeases:
+    """Leases on the ports returned by :func:`find_free_ports` within :func:`collect_port_leases`."""
+
+    def __init__(self) -> None:
+        self._leases: list[_PortLease] = []
+        self._lock = threading.Lock()
+
+    @property
+    def ports(self) -> list[int]:
+        """Leased ports."""
+        with self._lock:
+            return [lease.port for lease in self._leases]
+
+    def release(self) -> None:
+        """Release the leases, so that the ports can be handed out again."""
+        with self._lock:
+            leases, self._leases = self._leases, []
+        for lease in leases:
+            lease.release()
+
+    def _add(self, lease: _PortLease) -> None:
+        with self._lock:
+            self._leases.append(lease)
+
+
+@contextmanager
+def collect_port_leases() -> Iterator[PortLeases]:
+    """Collect the leases on the ports returned by :func:`find_free_ports` in this context.
+
+    The leases are held until they are released explicitly, so that the ports
+    are not handed out again while the product using them is running.
+
+    Examples
+    --------
+    Start a server on a free port, and release the port once it is stopped.
+
+    >>> from ansys.tools.common.launcher.helpers.ports import collect_port_leases, find_free_ports
+    >>> with collect_port_leases() as port_leases:
+    ...     port = find_free_ports()[0]
+    ...     start_server(port)
+    >>> stop_server()
+    >>> port_leases.release()
+    """
+    leases = PortLeases()
+    token = _current_leases.set(leases)
+    try:
+        yield leases
+    finally:
+        _current_leases.reset(token)
 
 
 def find_free_ports(num_ports: int = 1) -> list[int]:
     """Find free ports on the localhost.
 
+    The ports are leased, so that neither this process nor other processes
+    which use this function hand them out again until the lease is released.
+    Within :func:`collect_port_leases`, the leases are held until they are
+    released explicitly. Otherwise, they are released once many newer
+    ports have been handed out.
+
+    If the ``ANSYS_LAUNCHER_PORT_RANGE`` environment variable is set, the
+    ports are taken from that range. Otherwise, they are assigned by the
+    operating system.
+
     .. note::
 
         Because there is no way to reserve a port that would still allow
         a server to connect to it, there is no guarantee that the ports
-        are *still* free when eventually used.
+        are *still* free when eventually used by a process which does not
+        use this function.
 
     Parameters
     ----------
     num_ports :
         Number of free ports to obtain.
+
+    Raises
+    ------
+    RuntimeError
+        If the port range does not contain enough free ports.
     """
-    port_list = []
+    port_range = _get_port_range()
+    with _recent_ports_lock:
+        if port_range is None:
+            leases = _find_free_ports_from_os(num_ports)
+        else:
+            leases = _find_free_ports_in_range(num_ports, port_range)
+        current_leases = _current_leases.get()
+        for lease in leases:
+            if current_leases is not None:
+                current_leases._add(lease)
+            else:
+                _unscoped_leases.append(lease)
+        while len(_unscoped_leases) > _UNSCOPED_LEASES_MAXLEN:
+            _unscoped_leases.popleft().release()
+    return [lease.port for lease in leases]
+
+
+def _find_free_ports_from_os(num_ports: int) -> list[_PortLease]:
+    leases: list[_PortLease] = []
     with ExitStack() as context_stack:
-        for _ in range(num_ports):
+        while len(leases) < num_ports:
+            # The sockets are kept open until all ports are found, s.t. the
+            # operating system does not return the same port twice.
             sock = context_stack.enter_context(closing(socket.socket()))
             sock.bind(("", 0))
-            port_list.append(sock.getsockname()[1])
-    return port_list
+            port = sock.getsockname()[1]
+            if port in _recent_ports:
+                continue
+            lease = _PortLease.acquire(port)
+            if lease is not None:
+                leases.append(lease)
+    _recent_ports.extend(lease.port for lease in leases)
+    return leases
+
+
+def _find_free_ports_in_range(num_ports: int, port_range: range) -> list[_PortLease]:
+    global _next_range_index
+    if _next_range_index is None:
+        _next_range_index = random.randrange(len(port_range))
+    leases: list[_PortLease] = []
+    for offset in range(len(port_range)):
+        port = port_range[(_next_range_index + offset) % len(port_range)]
+        lease = _PortLease.acquire(port)
+        if lease is None:
+            continue
+        if not _can_bind(port):
+            lease.release()
+            continue
+        leases.append(lease)
+        if len(leases) == num_ports:
+            _next_range_index = (_next_range_index + offset + 1) % len(port_range)
+            return leases
+    for lease in leases:
+        lease.release()
+    raise RuntimeError(
+        f"Cannot find {num_ports} free port(s) in the range {port_range.start}-{port_range.stop - 1} "
+        f"specified in the {_PORT_RANGE_ENV_VAR_NAME} environment variable."
+    )
+
+
+def _can_bind(port: int) -> bool:
+    """Check if a server could bind to the port.
+
+    Where possible, ``SO_REUSEADDR`` is set, so that a port which was released
+    by a stopped server, but is still in the ``TIME_WAIT`` state, is handed out.
+    Servers usually set this option, so they can bind to such a port as well.
+    """
+    with closing(socket.socket()) as sock:
+        # On Windows, 'SO_REUSEADDR' allows binding to ports which are in use.
+        if sys.platform != "win32":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("", port))
+        except OSError:
+            return False
+    return True
+
+
+def _get_port_range() -> range | None:
+    value = os.environ.get(_PORT_RANGE_ENV_VAR_NAME)
+    if not value:
+        return None
+    try:
+        first, last = (int(part) for part in value.split("-"))
+    except ValueError as exc:
+        raise ValueError(
+            f"Invalid port range '{value}' in the {_PORT_RANGE_ENV_VAR_NAME} environment variable. "
+            "Expected the first and last port, for example '50000-50999'."
+        ) from exc
+    if not 0 < first <= last < 2**16:
+        raise ValueError(f"Invalid port range '{value}' in the {_PORT_RANGE_ENV_VAR_NAME} environment variable.")
+    return range(first, last + 1)
+
+
+def _get_lease_dir() -> pathlib.Path:
+    if _PORT_LEASE_DIR_ENV_VAR_NAME in os.environ:
+        return pathlib.Path(os.environ[_PORT_LEASE_DIR_ENV_VAR_NAME])
+    return pathlib.Path(platformdirs.user_cache_dir("ansys_tools_local_product_launcher")) / "port_leases"
@@ -20,16 +20,22 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Defines a function for launching Ansys products."""
+"""Defines functions for launching Ansys products."""
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import suppress
+import copy
 from typing import cast
 
+from ansys.tools.common.exceptions import ProductInstanceError
+
 from ._plugins import get_launcher
+from .async_product_instance import AsyncProductInstance
 from .config import get_config_for, get_launch_mode_for
 from .interface import LAUNCHER_CONFIG_T, LauncherProtocol
-from .product_instance import ProductInstance
+from .product_instance import ProductInstance, ProductInstanceCollection
 
 
 def launch_product(
@@ -63,6 +69,143 @@ def launch_product(
         If the type of the configuration object does not match the type
         requested by the launcher plugin.
     """
+    return ProductInstance(launcher=_make_launcher(product_name, launch_mode=launch_mode, config=config))
+
+
+async def alaunch_product(
+    product_name: str,
+    *,
+    launch_mode: str | None = None,
+    config: LAUNCHER_CONFIG_T | None = None,
+) -> AsyncProductInstance:
+    """Launch a product instance without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`launch_product`. Several
+    products can be launched concurrently, for instance with
+    :func:`asyncio.gather`.
+
+    Parameters
+    ----------
+    product_name : str
+        Name of the product to launch.
+    launch_mode : str, default: None
+        Launch mode to use. The default is ``None``, in which case
+        the default launched mode is used. Options available
+        depend on the launcher plugin.
+    config : LAUNCHER_CONFIG_T, default: None
+        Configuration to use for launching the product. The default is
+        ``None``, in which case the default configuration is used.
+
+    Returns
+    -------
+    AsyncProductInstance
+        Object that can be used to interact with the started product.
+
+    Raises
+    ------
+    TypeError
+        If the type of the configuration object does not match the type
+        requested by the launcher plugin.
+    """
+    instance = AsyncProductInstance(launcher=_make_launcher(product_name, launch_mode=launch_mode, config=config))
+    await instance.start()
+    return instance
+
+
+def launch_products(
+    num_instances: int,
+    product_name: str,
+    *,
+    launch_mode: str | None = None,
+    config: LAUNCHER_CONFIG_T | None = None,
+    wait_timeout: float | None = None,
+    max_workers: int | None = None,
+) -> ProductInstanceCollection:
+    """Launch several instances of a product concurrently.
+
+    Each instance is launched with its own copy of the configuration. If
+    launching, or waiting for, any of the instances fails, all instances
+    which were started are stopped before the error is raised.
+
+    Parameters
+    ----------
+    num_instances : int
+        Number of instances to launch.
+    product_name : str
+        Name of the product to launch.
+    launch_mode : str, default: None
+        Launch mode to use. The default is ``None``, in which case
+        the default launched mode is used. Options available
+        depend on the launcher plugin.
+    config : LAUNCHER_CONFIG_T, default: None
+        Configuration to use for launching the product. The default is
+        ``None``, in which case the default configuration is used.
+    wait_timeout : float, default: None
+        Time in seconds to wait for each instance to respond. The default is
+        ``None``, in which case the instances are not waited for.
+    max_workers : int, default: None
+        Maximum number of instances launched at the same time. The default
+        is ``None``, in which case all instances are launched at once.
+
+    Returns
+    -------
+    ProductInstanceCollection
+        Collection of the started product instances.
+
+    Raises
+    ------
+    TypeError
+        If the type of the configuration object does not match the type
+        requested by the launcher plugin.
+    ValueError
+        If the number of instances is not positive.
+    """
+    if num_instances < 1:
+        raise ValueError(f"The number of instances must be positive, got {num_instances}.")
+    # Resolve the configuration once, s.t. the configuration file is not
+    # read concurrently by each launch.
+    launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
+    if config is None:
+        config = get_config_for(product_name=product_name, launch_mode=launch_mode)  # type: ignore
+
+    def _launch() -> ProductInstance:
+        instance = launch_product(product_name, launch_mode=launch_mode, config=copy.deepcopy(config))
+        if wait_timeout is not None:
+            try:
+                instance.wait(wait_timeout)
+            except BaseException:
+                instance.stop()
+                raise
+        return instance
+
+    max_workers = max_workers or num_instances
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="launch_products") as executor:
+        futures = [executor.submit(_launch) for _ in range(num_instances)]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        failed = [future for future in futures if future in done and future.exception() is not None]
+        if failed:
+            # Do not launch the instances which are still queued.
+            for future in futures:
+                future.cancel()
+            wait(futures)
+    instances = [future.result() for future in futures if not future.cancelled() and future.exception() is None]
+    collection = ProductInstanceCollection(instances, max_workers=max_workers)
+    if failed:
+        # The launch error takes precedence over errors when stopping
+        # the other instances.
+        with suppress(ProductInstanceError):
+            collection.stop()
+        raise failed[0].exception()  # type: ignore[misc]
+    return collection
+
+
+def _make_launcher(
+    product_name: str,
+    *,
+    launch_mode: str | None,
+    config: LAUNCHER_CONFIG_T | None,
+) -> LauncherProtocol[LAUNCHER_CONFIG_T]:
+    """Create the launcher for a product, checking the type of its configuration."""
     launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
 
     # The type of the CONFIG_MODEL is checked below, so here we can cast
@@ -81,4 +224,4 @@ def launch_product(
         raise TypeError(
             f"Incompatible config of type '{type(config)} is supplied. It needs to be '{launcher_klass.CONFIG_MODEL}'."
         )
-    return ProductInstance(launcher=launcher_klass(config=config))
+    return launcher_klass(config=config)
@@ -0,0 +1,378 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a pool of pre-launched product instances."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import copy
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Any, Generic
+
+from ansys.tools.common.exceptions import ProductInstanceError
+
+from .interface import LAUNCHER_CONFIG_T
+from .launch import launch_product
+from .product_instance import ProductInstance
+
+__all__ = ["ProductInstancePool"]
+
+LOG = logging.getLogger(__name__)
+
+_MIN_RETRY_DELAY = 0.1
+_MAX_RETRY_DELAY = 10.0
+
+
+@dataclass
+class _PoolEntry:
+    """Product instance managed by a pool, with its usage statistics."""
+
+    instance: ProductInstance
+    created: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class ProductInstancePool(Generic[LAUNCHER_CONFIG_T]):
+    """Provides a pool of pre-launched product instances.
+
+    The pool keeps ``size`` instances of a product, launched with the same
+    launch mode and configuration. The instances are launched in the
+    background, and handed out with :meth:`acquire` only once they respond.
+    Acquiring an instance thus does not wait for the product to start, as
+    long as an idle instance is available.
+
+    Released instances are reused, unless they exceed the ``max_uses`` or
+    ``max_age`` policies, in which case they are stopped and replaced by a
+    newly launched instance. Before an instance is reused, the optional
+    ``reset()`` method of its launcher is called, and the instance is
+    checked. Instances failing either step are replaced.
+
+    The :class:`ProductInstancePool` class can be used as a context manager,
+    closing the pool when exiting the context.
+
+    Parameters
+    ----------
+    product_name : str
+        Name of the product to launch.
+    launch_mode : str, default: None
+        Launch mode to use. The default is ``None``, in which case
+        the default launched mode is used.
+    config : LAUNCHER_CONFIG_T, default: None
+        Configuration to use for launching the product. The default is
+        ``None``, in which case the default configuration is used. Each
+        instance is launched with its own copy of the configuration.
+    size : int, default: 1
+        Number of instances in the pool, including the instances in use.
+    max_uses : int, default: None
+        Number of times an instance can be acquired before it is replaced.
+        The default is ``None``, in which case instances are reused indefinitely.
+    max_age : float, default: None
+        Time in seconds after its launch after which an instance is replaced.
+        Instances in use are replaced when they are released. The default is
+        ``None``, in which case instances are never replaced because of their age.
+    wait_timeout : float, default: 60.0
+        Time in seconds to wait for a launched instance to respond.
+
+    Examples
+    --------
+    Run several jobs on two warm instances of a product.
+
+    >>> from ansys.tools.common.launcher.pool import ProductInstancePool
+    >>> with ProductInstancePool("ACP", size=2) as pool:
+    ...     for job in jobs:
+    ...         with pool.instance() as product:
+    ...             job.run(product)
+    """
+
+    def __init__(
+        self,
+        product_name: str,
+        *,
+        launch_mode: str | None = None,
+        config: LAUNCHER_CONFIG_T | None = None,
+        size: int = 1,
+        max_uses: int | None = None,
+        max_age: float | None = None,
+        wait_timeout: float = 60.0,
+    ):
+        if size < 1:
+            raise ValueError(f"The pool size must be positive, got {size}.")
+        if max_uses is not None and max_uses < 1:
+            raise ValueError(f"The maximum number of uses must be positive, got {max_uses}.")
+        self._product_name = product_name
+        self._launch_mode = launch_mode
+        self._config = config
+        self._size = size
+        self._max_uses = max_uses
+        self._max_age = max_age
+        self._wait_timeout = wait_timeout
+
+        self._condition = threading.Condition()
+        self._idle: deque[_PoolEntry] = deque()
+        self._in_use: dict[int, _PoolEntry] = dict()
+        self._starting = 0
+        self._failures = 0
+        self._last_error: Exception | None = None
+        self._closed = False
+
+        # Launching, resetting and stopping instances happen in the executor,
+        # while the maintainer thread decides when to launch or replace them.
+        self._executor = ThreadPoolExecutor(max_workers=2 * size, thread_name_prefix="ProductInstancePool")
+        self._maintainer = threading.Thread(target=self._maintain, name="ProductInstancePool", daemon=True)
+        self._maintainer.start()
+
+    def __enter__(self) -> ProductInstancePool[LAUNCHER_CONFIG_T]:
+        """Enter the context manager defined by the pool."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the pool when exiting a context manager."""
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """Number of instances in the pool, including the instances in use."""
+        return self._size
+
+    @property
+    def available(self) -> int:
+        """Number of idle instances, which can be acquired without waiting."""
+        with self._condition:
+            return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        """Flag indicating if the pool is closed."""
+        return self._closed
+
+    def acquire(self, timeout: float | None = None) -> ProductInstance:
+        """Acquire an instance from the pool.
+
+        The instance must be given back with :meth:`release` once it is no
+        longer used. Prefer the :meth:`instance` context manager, which does
+        so automatically.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for an idle instance. The default is
+            ``None``, in which case the wait is indefinite.
+
+        Returns
+        -------
+        ProductInstance
+            Running product instance.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the pool is closed, or no instance becomes available within
+            ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ProductInstanceError("The product instance pool is closed.")
+                self._retire_expired_locked()
+                if self._idle:
+                    entry = self._idle.popleft()
+                    entry.uses += 1
+                    self._in_use[id(entry.instance)] = entry
+                    return entry.instance
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise ProductInstanceError(
+                        f"No instance of '{self._product_name}' became available after {timeout}s."
+                    ) from self._last_error
+                self._condition.wait(remaining)
+
+    def release(self, instance: ProductInstance) -> None:
+        """Give an instance back to the pool.
+
+        The instance is reset and checked in the background before it can be
+        acquired again. It is stopped instead if it exceeds the reuse policy
+        of the pool, or if the pool is closed.
+
+        Parameters
+        ----------
+        instance : ProductInstance
+            Instance acquired from this pool.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance was not acquired from this pool.
+        """
+        with self._condition:
+            entry = self._in_use.get(id(instance))
+            if entry is None or entry.instance is not instance:
+                raise ProductInstanceError("The product instance was not acquired from this pool.")
+            if not self._closed and not instance.stopped and not self._is_expired(entry):
+                self._executor.submit(self._recycle, entry)
+                return
+            del self._in_use[id(instance)]
+            self._condition.notify_all()
+        _stop_instance(instance)
+
+    @contextmanager
+    def instance(self, timeout: float | None = None) -> Iterator[ProductInstance]:
+        """Acquire an instance for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for an idle instance. The default is
+            ``None``, in which case the wait is indefinite.
+
+        Yields
+        ------
+        ProductInstance
+            Running product instance, released when exiting the block.
+        """
+        instance = self.acquire(timeout=timeout)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def close(self) -> None:
+        """Close the pool, stopping its idle instances.
+
+        Instances which are in use are stopped when they are released.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        self._maintainer.join()
+        for entry in idle:
+            self._executor.submit(_stop_instance, entry.instance)
+        self._executor.shutdown(wait=True)
+
+    def _maintain(self) -> None:
+        """Launch instances until the pool is full, and replace the expired ones."""
+        with self._condition:
+            while not self._closed:
+                self._retire_expired_locked()
+                missing = self._size - len(self._idle) - len(self._in_use) - self._starting
+                for _ in range(missing):
+                    self._starting += 1
+                    self._executor.submit(self._launch)
+                self._condition.wait(self._time_to_next_expiry_locked())
+
+    def _launch(self) -> None:
+        """Launch an instance and add it to the idle instances once it responds."""
+        instance = None
+        try:
+            if not self._closed:
+                instance = launch_product(
+                    self._product_name, launch_mode=self._launch_mode, config=copy.deepcopy(self._config)
+                )
+                instance.wait(self._wait_timeout)
+        except Exception as exc:
+            LOG.warning(f"Failed to launch an instance of '{self._product_name}': {exc}")
+            if instance is not None and not instance.stopped:
+                _stop_instance(instance)
+            with self._condition:
+                self._failures += 1
+                self._last_error = exc
+                # Back off s.t. a product which fails to launch is not
+                # relaunched in a tight loop.
+                delay = min(_MIN_RETRY_DELAY * 2 ** (self._failures - 1), _MAX_RETRY_DELAY)
+                self._condition.wait_for(lambda: self._closed, timeout=delay)
+                self._starting -= 1
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            self._starting -= 1
+            if instance is not None and not self._closed:
+                self._failures = 0
+                self._idle.append(_PoolEntry(instance))
+                instance = None
+            self._condition.notify_all()
+        if instance is not None:
+            _stop_instance(instance)
+
+    def _recycle(self, entry: _PoolEntry) -> None:
+        """Reset and check a released instance, and make it available again."""
+        instance = entry.instance
+        try:
+            reset = getattr(instance._launcher, "reset", None)
+            if reset is not None:
+                reset()
+            healthy = instance.check(timeout=self._wait_timeout)
+        except Exception as exc:
+            LOG.warning(f"Failed to reset an instance of '{self._product_name}': {exc}")
+            healthy = False
+
+        with self._condition:
+            del self._in_use[id(instance)]
+            reuse = healthy and not self._closed
+            if reuse:
+                self._idle.append(entry)
+            self._condition.notify_all()
+        if not reuse:
+            _stop_instance(instance)
+
+    def _is_expired(self, entry: _PoolEntry) -> bool:
+        """Check if an instance exceeds the reuse policy of the pool."""
+        if self._max_uses is not None and entry.uses >= self._max_uses:
+            return True
+        return self._max_age is not None and time.monotonic() - entry.created >= self._max_age
+
+    def _retire_expired_locked(self) -> None:
+        """Stop the idle instances which exceed the reuse policy of the pool."""
+        expired = [entry for entry in self._idle if self._is_expired(entry)]
+        if not expired:
+            return
+        for entry in expired:
+            self._idle.remove(entry)
+            self._executor.submit(_stop_instance, entry.instance)
+        self._condition.notify_all()
+
+    def _time_to_next_expiry_locked(self) -> float | None:
+        """Get the time until the next idle instance exceeds its maximum age."""
+        if self._max_age is None or not self._idle:
+            return None
+        next_expiry = min(entry.created for entry in self._idle) + self._max_age
+        return max(next_expiry - time.monotonic(), 0.0)
+
+
+def _stop_instance(instance: ProductInstance) -> None:
+    """Stop an instance, logging instead of raising errors."""
+    try:
+        if not instance.stopped:
+            instance.stop()
+    except Exception as exc:
+        LOG.warning(f"Failed to stop a product instance: {exc}")
@@ -24,8 +24,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import time
-from typing import Any
+from typing import Any, overload
 import weakref
 
 import grpc
@@ -33,11 +36,30 @@ from typing_extensions import Self
 
 from ansys.tools.common.exceptions import ProductInstanceError
 
+from .helpers.health import wait_for_servers
+from .helpers.ports import PortLeases, collect_port_leases
 from .interface import LAUNCHER_CONFIG_T, LauncherProtocol, ServerType
 
-__all__ = ["ProductInstance"]
+__all__ = ["ProductInstance", "ProductInstanceCollection"]
+
+LOG = logging.getLogger(__name__)
 
 _GRPC_MAX_MESSAGE_LENGTH = 256 * 1024**2  # 256 MB
+_GRPC_INITIAL_RECONNECT_BACKOFF_MS = 50
+_GRPC_MAX_RECONNECT_BACKOFF_MS = 1000
+_GRPC_OPTIONS = [
+    ("grpc.max_receive_message_length", _GRPC_MAX_MESSAGE_LENGTH),
+    # The server is usually still starting up when the channel is created.
+    # Retry the connection quickly so that 'wait' returns soon after the
+    # server is ready.
+    ("grpc.initial_reconnect_backoff_ms", _GRPC_INITIAL_RECONNECT_BACKOFF_MS),
+    ("grpc.max_reconnect_backoff_ms", _GRPC_MAX_RECONNECT_BACKOFF_MS),
+    # Do not share the connection, and its backoff state, with channels
+    # to a previous instance of the product.
+    ("grpc.use_local_subchannel_pool", 1),
+]
+_MIN_POLL_INTERVAL = 0.01
+_MAX_POLL_INTERVAL = 1.0
 
 
 class ProductInstance:
@@ -53,6 +75,7 @@ class ProductInstance:
     def __init__(self, *, launcher: LauncherProtocol[LAUNCHER_CONFIG_T]):
         self._launcher = launcher
         self._finalizer: weakref.finalize[Any, Self]
+        self._port_leases: PortLeases
         self._urls: dict[str, str]
         self._channels: dict[str, grpc.Channel]
         self.start()
@@ -80,7 +103,13 @@ class ProductInstance:
             raise ProductInstanceError("Cannot start the server. It has already been started.")
 
         self._finalizer = weakref.finalize(self, self._launcher.stop, timeout=None)
-        self._launcher.start()
+        # The ports handed out to the launcher are leased until the instance is stopped.
+        with collect_port_leases() as self._port_leases:
+            try:
+                self._launcher.start()
+            except BaseException:
+                self._port_leases.release()
+                raise
         self._channels = dict()
         urls = self.urls
 
@@ -88,7 +117,7 @@ class ProductInstance:
         for key, server_type in self._launcher.SERVER_SPEC.items():
             if server_type == ServerType.GRPC:
                 self._channels[key] = transport_options_map[key].create_channel(
-                    grpc_options=[("grpc.max_receive_message_length", _GRPC_MAX_MESSAGE_LENGTH)],
+                    grpc_options=_GRPC_OPTIONS,
                 )
             elif server_type == ServerType.GENERIC:
                 if key not in urls:
@@ -117,6 +146,7 @@ class ProductInstance:
             raise ProductInstanceError("Cannot stop the server. It has already been stopped.")
         self._launcher.stop(timeout=timeout)
         self._finalizer.detach()
+        self._port_leases.release()
 
     def restart(self, stop_timeout: float | None = None) -> None:
         """Stop and then start the product instance.
@@ -148,11 +178,42 @@ class ProductInstance:
         """
         return self._launcher.check(timeout=timeout)
 
+    def check_servers(self, timeout: float | None = None) -> dict[str, bool]:
+        """Check if each server is responding to requests.
+
+        Unlike :meth:`check`, which relies on the launcher implementation,
+        this method checks the servers directly: a gRPC health check is sent
+        to each gRPC server, and each generic server is probed at its URL
+        (see :func:`.helpers.health.check_url`). All servers are checked
+        concurrently.
+
+        This method requires the ``grpcio-health-checking`` package.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Timeout in seconds for the check of each server.
+
+        Returns
+        -------
+        dict[str, bool]
+            For each server key, ``True`` if the server is responding, ``False`` otherwise.
+        """
+        from .helpers.health import check_servers
+
+        return check_servers(channels=self.channels, urls=self._generic_urls, timeout=timeout)
+
     def wait(self, timeout: float) -> None:
         """Wait for all servers to respond.
 
-        This method repeatedly checks if the servers are running, returning as soon
-        as they are all ready.
+        This method polls the servers with :meth:`check`, with an
+        exponentially increasing interval, until the check succeeds. Between
+        two checks, it waits for each server to become ready: gRPC servers
+        are watched through the ``Watch`` method of the gRPC health service,
+        and generic servers are checked with an exponentially increasing
+        interval. If all servers become ready before the end of the interval,
+        they are checked again right away. Once the check succeeds, this
+        method waits for the gRPC channels of the instance to connect.
 
         Parameters
         ----------
@@ -164,16 +225,47 @@ class ProductInstance:
         ProductInstanceError
             If the server still has not responded after ``timeout`` seconds.
         """
-        start_time = time.time()
-        while time.time() - start_time <= timeout:
+        deadline = time.monotonic() + timeout
+        delay = _MIN_POLL_INTERVAL
+        while True:
             if self.check(timeout=timeout / 3):
-                break
-            else:
-                # Try again until the timeout is reached. We add a small
-                # delay s.t. the server isn't bombarded with requests.
-                time.sleep(timeout / 100)
-        else:
-            raise ProductInstanceError(f"The product is not running after {timeout}s.")
+                # The launcher may check the servers through its own connections,
+                # while the channels of the instance are still waiting to reconnect.
+                if self._wait_for_channels(deadline):
+                    return
+                raise ProductInstanceError(f"The channels to the product are not connected after {timeout}s.")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ProductInstanceError(f"The product is not running after {timeout}s.")
+            # Try again until the timeout is reached. The delay increases
+            # s.t. the server isn't bombarded with requests.
+            interval = min(delay, remaining)
+            interval_end = time.monotonic() + interval
+            ready = wait_for_servers(channels=self.channels, urls=self._generic_urls, timeout=interval)
+            if not all(ready.values()):
+                # Some servers do not report that they are ready, for
+                # instance because they have no gRPC health service.
+                time.sleep(max(interval_end - time.monotonic(), 0))
+            delay = min(2 * delay, _MAX_POLL_INTERVAL)
+
+    def _wait_for_channels(self, deadline: float) -> bool:
+        """Wait until the gRPC channels are connected, or until the deadline."""
+        for channel in self.channels.values():
+            try:
+                grpc.channel_ready_future(channel).result(timeout=max(deadline - time.monotonic(), _MIN_POLL_INTERVAL))
+            except grpc.FutureTimeoutError:
+                return False
+        return True
+
+    @property
+    def _generic_urls(self) -> dict[str, str]:
+        """Mapping of server keys to the URLs of the generic servers."""
+        urls = self.urls
+        return {
+            key: urls[key]
+            for key, server_type in self._launcher.SERVER_SPEC.items()
+            if server_type == ServerType.GENERIC
+        }
 
     @property
     def urls(self) -> dict[str, str]:
@@ -198,3 +290,120 @@ class ProductInstance:
     def channels(self) -> dict[str, grpc.Channel]:
         """Read-only mapping of server keys to gRPC channels."""
         return self._channels
+
+
+class ProductInstanceCollection(Sequence[ProductInstance]):
+    """Provides a sequence of product instances, which are stopped and waited for concurrently.
+
+    The :class:`ProductInstanceCollection` class can be used as a context
+    manager, stopping all instances when exiting the context.
+
+    Parameters
+    ----------
+    instances : Iterable[ProductInstance]
+        Product instances in the collection.
+    max_workers : int, default: None
+        Maximum number of threads used to act on the instances concurrently.
+        The default is ``None``, in which case one thread per instance is used.
+    """
+
+    def __init__(self, instances: Iterable[ProductInstance], *, max_workers: int | None = None):
+        self._instances = list(instances)
+        self._max_workers = max_workers
+
+    @overload
+    def __getitem__(self, index: int) -> ProductInstance: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ProductInstance]: ...
+
+    def __getitem__(self, index: int | slice) -> ProductInstance | list[ProductInstance]:
+        """Get the instance, or instances, at the given index."""
+        return self._instances[index]
+
+    def __len__(self) -> int:
+        """Get the number of instances."""
+        return len(self._instances)
+
+    def __iter__(self) -> Iterator[ProductInstance]:
+        """Iterate over the instances."""
+        return iter(self._instances)
+
+    def __enter__(self) -> ProductInstanceCollection:
+        """Enter the context manager defined by the collection."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Stop all running instances when exiting a context manager."""
+        self.stop()
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        """Stop all running instances concurrently.
+
+        Instances which are already stopped are skipped. All instances are
+        stopped even if stopping one of them fails.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds after which each instance is forcefully stopped.
+            Not all launch methods implement this parameter. If the parameter
+            is not implemented, it is ignored.
+
+        Raises
+        ------
+        ProductInstanceError
+            If any instance fails to stop. The first error is chained.
+        """
+        running = [instance for instance in self._instances if not instance.stopped]
+        errors = [error for error in self._map(lambda instance: _try(instance.stop, timeout=timeout), running) if error]
+        if errors:
+            for error in errors[1:]:
+                LOG.warning(f"Failed to stop a product instance: {error}")
+            raise ProductInstanceError(
+                f"Failed to stop {len(errors)} of {len(running)} product instances."
+            ) from errors[0]
+
+    def wait(self, timeout: float) -> None:
+        """Wait concurrently for all servers of all instances to respond.
+
+        Parameters
+        ----------
+        timeout : float
+            Wait time in seconds before raising an exception.
+
+        Raises
+        ------
+        ProductInstanceError
+            If any instance still has not responded after ``timeout`` seconds.
+        """
+        for error in self._map(lambda instance: _try(instance.wait, timeout), self._instances):
+            if error is not None:
+                raise error
+
+    def check(self, timeout: float | None = None) -> bool:
+        """Check concurrently if all servers of all instances are responding to requests.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for the servers to respond. This parameter
+            is used as a hint to the launcher implementation.
+        """
+        return all(self._map(lambda instance: instance.check(timeout=timeout), self._instances))
+
+    def _map(self, function: Callable[[ProductInstance], Any], instances: list[ProductInstance]) -> list[Any]:
+        """Apply a function to the instances concurrently."""
+        if not instances:
+            return []
+        with ThreadPoolExecutor(max_workers=self._max_workers or len(instances)) as executor:
+            return list(executor.map(function, instances))
+
+
+def _try(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Exception | None:
+    """Call a function, returning the exception it raises, if any."""
+    try:
+        function(*args, **kwargs)
+    except Exception as exc:
+        return exc
+    return None
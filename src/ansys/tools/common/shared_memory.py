@@ -0,0 +1,320 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Shared-memory side channel for bulk data exchanged with same-host servers.
+
+Even over Unix Domain Sockets, large payloads are copied through the socket
+and through the message serialization. When the client and the server run on
+the same machine, large payloads can instead be written to a
+:class:`SharedMemoryRing`, and only a small :class:`SharedMemoryHandle` is
+sent over the gRPC channel. The server attaches to the ring with the name
+stored in the handle, reads the payload without copying it, and releases it.
+
+The ring buffer has a single producer and a single consumer: one side writes
+the payloads and the other side reads them and releases them, in the order in
+which they were written.
+
+Example
+-------
+
+.. code-block:: python
+
+    from ansys.tools.common.shared_memory import SharedMemoryHandle, SharedMemoryRing
+
+    # Client
+    with SharedMemoryRing(64 * 1024**2) as ring:
+        handle = ring.write(large_payload)
+        stub.Process(ProcessRequest(shared_memory_handle=handle.to_bytes()))
+
+    # Server
+    handle = SharedMemoryHandle.from_bytes(request.shared_memory_handle)
+    ring = SharedMemoryRing.attach(handle.name)  # Attach once per client
+    with ring.read(handle) as payload:
+        ...
+    ring.release(handle)
+"""
+
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+import struct
+import sys
+import time
+from typing import Any
+import uuid
+
+__all__ = [
+    "DEFAULT_RING_SIZE",
+    "SharedMemoryHandle",
+    "SharedMemoryRing",
+    "is_shared_memory_possible",
+]
+
+DEFAULT_RING_SIZE = 64 * 1024**2
+"""Default size of the data region of a ring buffer, in bytes."""
+
+# The header holds the write and release positions of the ring, as absolute
+# byte counters. Each counter is only ever written by one side of the ring.
+# It also holds the capacity of the ring, since the size of the shared memory
+# block may be rounded up to the page size on some platforms.
+_POSITION = struct.Struct("<Q")
+_WRITE_POSITION_OFFSET = 0
+_RELEASE_POSITION_OFFSET = 8
+_CAPACITY_OFFSET = 16
+_HEADER_SIZE = 64
+_HANDLE = struct.Struct("<QQH")
+
+# Bounds of the polling interval while waiting for the consumer to release space
+_WAIT_MIN_INTERVAL = 0.0001
+_WAIT_MAX_INTERVAL = 0.01
+
+# Names of the shared memory blocks created by this process
+_CREATED_NAMES: set[str] = set()
+
+
+def is_shared_memory_possible(transport_mode: str, host: str | None = None) -> bool:
+    """Check if a channel with the given transport mode connects to a server on the same host.
+
+    Shared memory can only be used with servers running on the same machine
+    as the client.
+
+    Parameters
+    ----------
+    transport_mode : str
+        Transport mode of the channel.
+    host : str | None
+        Host of the server, for the TCP-based transport modes.
+
+    Returns
+    -------
+    bool
+        True if the server is guaranteed to run on the same machine.
+    """
+    from ansys.tools.common.cyberchannel import LOOPBACK_HOSTS
+
+    match transport_mode.lower():
+        case "uds" | "wnua":
+            return True
+        case "insecure" | "mtls":
+            return host in LOOPBACK_HOSTS
+        case _:
+            return False
+
+
+@dataclass(frozen=True)
+class SharedMemoryHandle:
+    """Reference to a payload stored in a :class:`SharedMemoryRing`."""
+
+    name: str
+    """Name of the shared memory block of the ring."""
+
+    position: int
+    """Absolute position of the payload in the ring."""
+
+    size: int
+    """Size of the payload, in bytes."""
+
+    def to_bytes(self) -> bytes:
+        """Serialize the handle, to send it in a gRPC message."""
+        name = self.name.encode()
+        return _HANDLE.pack(self.position, self.size, len(name)) + name
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SharedMemoryHandle":
+        """Deserialize a handle created by :meth:`to_bytes`."""
+        position, size, name_length = _HANDLE.unpack_from(data)
+        name = bytes(data[_HANDLE.size : _HANDLE.size + name_length]).decode()
+        return cls(name=name, position=position, size=size)
+
+
+class SharedMemoryRing:
+    """Single-producer, single-consumer ring buffer in shared memory.
+
+    Payloads are stored contiguously, so that they can be read as a single
+    ``memoryview`` without copying. A payload which does not fit before the
+    end of the ring is written at its beginning instead.
+
+    Parameters
+    ----------
+    size : int
+        Size of the data region of the ring, in bytes. This is the largest
+        payload which can be written.
+    name : str | None
+        Name of the shared memory block. By default `None` and thus a unique
+        name is generated.
+    """
+
+    def __init__(self, size: int = DEFAULT_RING_SIZE, *, name: str | None = None) -> None:
+        if size <= 0:
+            raise ValueError("The size of the ring must be positive.")
+        if name is None:
+            name = f"ansys-ring-{uuid.uuid4().hex[:16]}"
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER_SIZE + size)
+        _CREATED_NAMES.add(self._shm.name)
+        self._shm.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        _POSITION.pack_into(self._shm.buf, _CAPACITY_OFFSET, size)
+        self._capacity = size
+        self._owner = True
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRing":
+        """Attach to a ring created by another process.
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared memory block of the ring.
+
+        Returns
+        -------
+        SharedMemoryRing
+            The ring. It is not unlinked when closed.
+        """
+        ring = cls.__new__(cls)
+        ring._shm = _attach_shared_memory(name)
+        (ring._capacity,) = _POSITION.unpack_from(ring._shm.buf, _CAPACITY_OFFSET)
+        ring._owner = False
+        return ring
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Size of the data region of the ring, in bytes."""
+        return self._capacity
+
+    def write(self, data: Any, timeout: float | None = None) -> SharedMemoryHandle:
+        """Copy a payload into the ring.
+
+        If the ring is full, wait until the consumer releases enough space.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Payload to write, any object supporting the buffer protocol.
+        timeout : float | None
+            Maximum time in seconds to wait for free space.
+            By default `None` and thus wait indefinitely.
+
+        Returns
+        -------
+        SharedMemoryHandle
+            Handle to send to the consumer.
+
+        Raises
+        ------
+        ValueError
+            If the payload is larger than the ring.
+        TimeoutError
+            If no space was released before the timeout.
+        """
+        payload = memoryview(data).cast("B")
+        size = payload.nbytes
+        if size > self._capacity:
+            raise ValueError(f"The payload of {size} bytes does not fit in the ring of {self._capacity} bytes.")
+
+        (position,) = _POSITION.unpack_from(self._shm.buf, _WRITE_POSITION_OFFSET)
+        offset = position % self._capacity
+        if offset + size > self._capacity:
+            # Skip the end of the ring, such that the payload is contiguous
+            position += self._capacity - offset
+            offset = 0
+        self._wait_for_space(position + size, timeout)
+
+        start = _HEADER_SIZE + offset
+        self._shm.buf[start : start + size] = payload
+        # Only the write position is updated, the release position belongs to the consumer
+        _POSITION.pack_into(self._shm.buf, _WRITE_POSITION_OFFSET, position + size)
+        return SharedMemoryHandle(name=self.name, position=position, size=size)
+
+    def read(self, handle: SharedMemoryHandle) -> memoryview:
+        """Get a view of a payload, without copying it.
+
+        The view must be released before the payload is released, and before
+        the ring is closed.
+
+        Parameters
+        ----------
+        handle : SharedMemoryHandle
+            Handle returned by :meth:`write`.
+
+        Returns
+        -------
+        memoryview
+            View of the payload in the shared memory.
+        """
+        if handle.name != self.name:
+            raise ValueError(f"The handle refers to the ring '{handle.name}', not to '{self.name}'.")
+        start = _HEADER_SIZE + handle.position % self._capacity
+        return self._shm.buf[start : start + handle.size]
+
+    def release(self, handle: SharedMemoryHandle) -> None:
+        """Release the space used by a payload, and by all payloads written before it.
+
+        Parameters
+        ----------
+        handle : SharedMemoryHandle
+            Handle returned by :meth:`write`.
+        """
+        _POSITION.pack_into(self._shm.buf, _RELEASE_POSITION_OFFSET, handle.position + handle.size)
+
+    def close(self) -> None:
+        """Close the ring, and remove it if it was created by this object."""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+            _CREATED_NAMES.discard(self._shm.name)
+
+    def __enter__(self) -> "SharedMemoryRing":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the ring."""
+        self.close()
+
+    def _released_position(self) -> int:
+        (position,) = _POSITION.unpack_from(self._shm.buf, _RELEASE_POSITION_OFFSET)
+        return position
+
+    def _wait_for_space(self, end_position: int, timeout: float | None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        poll_interval = _WAIT_MIN_INTERVAL
+        while end_position - self._released_position() > self._capacity:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError("Timed out waiting for the consumer to release space in the ring.")
+            time.sleep(poll_interval)
+            poll_interval = min(2 * poll_interval, _WAIT_MAX_INTERVAL)
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing shared memory block, without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if name not in _CREATED_NAMES:
+        # Before Python 3.13, attaching registers the block with the resource
+        # tracker, which would remove it when this process exits.
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
@@ -0,0 +1,189 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers for streaming large payloads in bounded chunks.
+
+Rather than raising ``grpc.max_receive_message_length`` to fit large payloads
+in a single message, payloads can be split into chunks sent over a
+client-streaming RPC, and server-streamed chunks can be reassembled into a
+single preallocated buffer.
+
+The chunks are produced lazily: gRPC only pulls the next request from the
+iterator once flow control allows more data to be sent. Only one chunk is
+therefore held in memory at a time on top of the payload itself, and no
+intermediate copy of the whole payload is made on either side.
+
+Example
+-------
+
+.. code-block:: python
+
+    import numpy as np
+
+    from ansys.tools.common.streaming import assemble_chunks, iter_messages
+
+    # Upload an array in chunks
+    stub.Upload(iter_messages(array, lambda chunk: UploadRequest(data=bytes(chunk))))
+
+    # Download an array of known shape and type in chunks
+    result = np.empty(shape, dtype=np.float64)
+    assemble_chunks(stub.Download(request), out=result, get_data=lambda response: response.data)
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "assemble_chunks", "iter_chunks", "iter_messages"]
+
+DEFAULT_CHUNK_SIZE = 1024**2
+"""Default size of the chunks, in bytes.
+
+This is well below gRPC's default maximum message size of 4 MiB.
+"""
+
+_MessageT = TypeVar("_MessageT")
+
+
+def _as_byte_view(data: Any, *, writable: bool = False) -> memoryview:
+    """Get a flat byte view of an object supporting the buffer protocol."""
+    view = memoryview(data)
+    if not view.c_contiguous:
+        raise ValueError("The buffer must be C-contiguous.")
+    if writable and view.readonly:
+        raise ValueError("The output buffer must be writable.")
+    return view.cast("B")
+
+
+def iter_chunks(data: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Split a buffer into chunks, without copying it.
+
+    Parameters
+    ----------
+    data : bytes-like
+        Payload to split: ``bytes``, ``bytearray``, ``memoryview``, a C-contiguous
+        NumPy array, or any other object supporting the buffer protocol.
+    chunk_size : int
+        Maximum size of each chunk, in bytes.
+
+    Yields
+    ------
+    memoryview
+        Views of consecutive parts of the payload. An empty payload yields no chunk.
+    """
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be positive.")
+    view = _as_byte_view(data)
+    for start in range(0, view.nbytes, chunk_size):
+        yield view[start : start + chunk_size]
+
+
+def iter_messages(
+    data: Any,
+    make_message: Callable[[memoryview], _MessageT],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[_MessageT]:
+    """Create the request messages of a client-streaming RPC from a payload.
+
+    The messages are created one at a time, as gRPC consumes the iterator.
+
+    Parameters
+    ----------
+    data : bytes-like
+        Payload to send, any object supporting the buffer protocol.
+    make_message : Callable[[memoryview], Any]
+        Function creating a request message from a chunk of the payload, for
+        instance ``lambda chunk: Request(data=bytes(chunk))``.
+    chunk_size : int
+        Maximum size of the payload in each message, in bytes.
+
+    Yields
+    ------
+    Any
+        The request messages.
+    """
+    for chunk in iter_chunks(data, chunk_size):
+        yield make_message(chunk)
+
+
+def assemble_chunks(
+    chunks: Iterable[Any],
+    *,
+    total_size: int | None = None,
+    out: Any = None,
+    get_data: Callable[[Any], Any] | None = None,
+) -> Any:
+    """Reassemble streamed chunks into a single buffer.
+
+    The chunks are copied into the output buffer as they are received, so
+    that only one chunk is held in memory at a time.
+
+    Parameters
+    ----------
+    chunks : Iterable[Any]
+        Chunks to assemble, for instance the response iterator of a
+        server-streaming RPC.
+    total_size : int | None
+        Total size of the payload in bytes, if known in advance. A buffer
+        of this size is then allocated once.
+    out : bytes-like | None
+        Writable, C-contiguous buffer receiving the payload, for instance an
+        empty NumPy array. By default `None` and thus a ``bytearray`` is used.
+    get_data : Callable[[Any], Any] | None
+        Function returning the payload of a chunk, for instance
+        ``lambda response: response.data``. By default `None` and thus the
+        chunks are used as they are.
+
+    Returns
+    -------
+    Any
+        The output buffer: ``out`` if given, otherwise a ``bytearray``.
+
+    Raises
+    ------
+    ValueError
+        If the size of the payload does not match the size of the output
+        buffer, or ``total_size``.
+    """
+    if out is None and total_size is None:
+        # The size is unknown, so the buffer grows as chunks are received.
+        result = bytearray()
+        for chunk in chunks:
+            result += chunk if get_data is None else get_data(chunk)
+        return result
+
+    if out is None:
+        out = bytearray(total_size)  # type: ignore[arg-type]
+    view = _as_byte_view(out, writable=True)
+    if total_size is not None and total_size != view.nbytes:
+        raise ValueError(f"The output buffer has {view.nbytes} bytes, but the payload has {total_size} bytes.")
+
+    position = 0
+    for chunk in chunks:
+        data = _as_byte_view(chunk if get_data is None else get_data(chunk))
+        end = position + data.nbytes
+        if end > view.nbytes:
+            raise ValueError(f"The payload is larger than the output buffer of {view.nbytes} bytes.")
+        view[position:end] = data
+        position = end
+    if position != view.nbytes:
+        raise ValueError(f"The payload has {position} bytes, but the output buffer has {view.nbytes} bytes.")
+    return out
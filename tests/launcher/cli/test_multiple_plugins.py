@@ -23,7 +23,9 @@
 """Module for multiple plugins test."""
 
 from dataclasses import dataclass
+from unittest.mock import Mock
 
+import click
 from click.testing import CliRunner
 import pytest
 
@@ -97,15 +99,30 @@ def test_cli_structure():
     command = _cli.build_cli(_plugins.get_all_plugins())
     assert "configure" in command.commands
     configure_group = command.commands["configure"]
+    ctx = click.Context(configure_group)
 
-    assert TEST_PRODUCT_A in configure_group.commands
-    assert TEST_PRODUCT_B in configure_group.commands
+    assert configure_group.list_commands(ctx) == [TEST_PRODUCT_A, TEST_PRODUCT_B]
+    product_a_group = configure_group.get_command(ctx, TEST_PRODUCT_A)
+    product_b_group = configure_group.get_command(ctx, TEST_PRODUCT_B)
+    assert configure_group.get_command(ctx, "PRODUCT_C") is None
 
-    assert TEST_LAUNCH_MODE_A1 in configure_group.commands[TEST_PRODUCT_A].commands
-    assert TEST_LAUNCH_MODE_A2 in configure_group.commands[TEST_PRODUCT_A].commands
-    assert TEST_LAUNCH_MODE_B1 in configure_group.commands[TEST_PRODUCT_B].commands
+    assert TEST_LAUNCH_MODE_A1 in product_a_group.commands
+    assert TEST_LAUNCH_MODE_A2 in product_a_group.commands
+    assert TEST_LAUNCH_MODE_B1 in product_b_group.commands
 
-    assert configure_group.commands[TEST_PRODUCT_A].commands[TEST_LAUNCH_MODE_A1].params[0].name == "field_a1"
+    assert product_a_group.commands[TEST_LAUNCH_MODE_A1].params[0].name == "field_a1"
+
+
+def test_build_cli_does_not_discover_plugins(monkeypatch):
+    """Test that the plugins are only discovered when the CLI is invoked."""
+    get_entry_points = Mock(wraps=_plugins._get_entry_points)
+    monkeypatch.setattr(_plugins, "_get_entry_points", get_entry_points)
+    cli_command = _cli.build_cli(_cli._DiscoveredPlugins())
+    get_entry_points.assert_not_called()
+
+    result = CliRunner().invoke(cli_command, ["configure", TEST_PRODUCT_B, "--help"])
+    assert result.exit_code == 0
+    assert TEST_LAUNCH_MODE_B1 in result.output
 
 
 def test_configure_single_product_launcher(temp_config_file):
@@ -219,3 +236,53 @@ def test_configure_two_products(temp_config_file):
         },
     }
     check_result_config(temp_config_file, expected_config)
+
+
+def test_cli_does_not_import_plugins(monkeypatch):
+    """Test that listing plugins and launch modes does not import the plugins."""
+    entry_points = tuple(_plugins._get_entry_points())
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: entry_points)
+    cli_command = _cli.build_cli(_plugins.get_plugin_descriptors())
+    runner = CliRunner()
+
+    result = runner.invoke(cli_command, ["list-plugins"])
+    assert result.exit_code == 0
+    assert TEST_LAUNCH_MODE_B1 in result.output
+    result = runner.invoke(cli_command, ["configure", TEST_PRODUCT_A, "--help"])
+    assert result.exit_code == 0
+    assert TEST_LAUNCH_MODE_A2 in result.output
+    assert all(entry_point.load.call_count == 0 for entry_point in entry_points)
+
+    result = runner.invoke(cli_command, ["configure", TEST_PRODUCT_A, TEST_LAUNCH_MODE_A1, "--help"])
+    assert result.exit_code == 0
+    assert "--field_a1" in result.output
+    assert [entry_point.load.call_count for entry_point in entry_points] == [1, 0, 0]
+
+
+def test_configure_broken_plugin(monkeypatch):
+    """Test that configuring a plugin which cannot be imported fails with a clear message."""
+    entry_points = tuple(_plugins._get_entry_points())
+    entry_points[0].load.side_effect = ImportError("No module named 'product_a'")
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: entry_points)
+    cli_command = _cli.build_cli(_plugins.get_plugin_descriptors())
+
+    result = CliRunner().invoke(cli_command, ["configure", TEST_PRODUCT_A, TEST_LAUNCH_MODE_A1, "--field_a1=1"])
+    assert result.exit_code != 0
+    assert "Cannot load the plugin" in result.output
+
+
+def test_show_config_broken_plugin(monkeypatch):
+    """Test that plugins which cannot be imported are skipped when showing the configuration."""
+    entry_points = tuple(_plugins._get_entry_points())
+    entry_points[0].load.side_effect = ImportError("No module named 'product_a'")
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: entry_points)
+    cli_command = _cli.build_cli(_plugins.get_plugin_descriptors())
+    result = CliRunner().invoke(cli_command, ["configure", TEST_PRODUCT_A, TEST_LAUNCH_MODE_A2, "--field_a2=2"])
+    assert result.exit_code == 0, result.output
+
+    with pytest.warns(UserWarning, match=f"Skipping broken plugin '{TEST_PRODUCT_A}.{TEST_LAUNCH_MODE_A1}'"):
+        result = CliRunner().invoke(cli_command, ["show-config"])
+    assert result.exit_code == 0, result.output
+    assert TEST_LAUNCH_MODE_A1 not in result.output
+    assert f"{TEST_LAUNCH_MODE_A2} (default)" in result.output
+    assert "field_a2: 2" in result.output
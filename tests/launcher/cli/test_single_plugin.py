@@ -24,6 +24,7 @@
 
 from dataclasses import dataclass, field
 
+import click
 from click.testing import CliRunner
 import pytest
 
@@ -88,11 +89,11 @@ def test_cli_mock_plugin(mock_plugins):
     command = _cli.build_cli(mock_plugins)
     assert "configure" in command.commands
     configure_group = command.commands["configure"]
+    ctx = click.Context(configure_group)
 
-    assert len(configure_group.commands) == 1
-    assert TEST_PRODUCT in configure_group.commands
+    assert configure_group.list_commands(ctx) == [TEST_PRODUCT]
 
-    product_group = configure_group.commands[TEST_PRODUCT]
+    product_group = configure_group.get_command(ctx, TEST_PRODUCT)
     assert TEST_LAUNCH_MODE in product_group.commands
 
     launcher_command = product_group.commands[TEST_LAUNCH_MODE]
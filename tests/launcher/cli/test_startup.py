@@ -0,0 +1,90 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for testing the startup time of the CLI."""
+
+import subprocess
+import sys
+
+import pytest
+
+from ansys.tools.common.launcher import _plugins
+
+# Generous upper bound on the time spent executing the ``_cli`` module itself,
+# excluding its dependencies. Discovering the plugins at import would exceed it
+# on systems with many installed distributions.
+IMPORT_TIME_BUDGET_US = 100_000
+
+CHECK_IMPORT_SCRIPT = """
+from ansys.tools.common.launcher import _cli, _plugins
+
+print(_plugins._get_entry_points.cache_info().currsize)
+"""
+
+
+def _get_self_import_time_us(importtime_output: str, module_name: str) -> int:
+    """Get the self time of a module from the output of ``-X importtime``."""
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module_name:
+            return int(self_us)
+    raise ValueError(f"Module '{module_name}' was not imported.")
+
+
+def test_import_does_not_discover_plugins():
+    """Test that importing the CLI neither discovers the plugins nor exceeds the import time budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK_IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "0"
+    assert _get_self_import_time_us(result.stderr, "ansys.tools.common.launcher._cli") < IMPORT_TIME_BUDGET_US
+
+
+def test_configure_help_loads_single_plugin():
+    """Test that showing the help of a launch mode only loads the plugin of that launch mode."""
+    product_launch_modes = [
+        entry_point.name.split(".", 1)
+        for entry_point in _plugins._scan_entry_points()
+        if not entry_point.name.endswith(f".{_plugins.FALLBACK_LAUNCH_MODE_NAME}")
+    ]
+    if not product_launch_modes:
+        pytest.skip("No launcher plugins are installed.")
+    product_name, launch_mode = product_launch_modes[0]
+    script = f"""
+import sys
+from ansys.tools.common.launcher import _cli, _plugins
+
+sys.argv = ["ansys-launcher", "configure", {product_name!r}, {launch_mode!r}, "--help"]
+try:
+    _cli.cli()
+except SystemExit:
+    pass
+print(len(_plugins._get_index()._classes))
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert "--help" in result.stdout
+    assert result.stdout.splitlines()[-1] == "1"
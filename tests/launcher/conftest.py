@@ -30,6 +30,7 @@ import warnings
 import pytest
 
 from ansys.tools.common.launcher import _plugins, config
+from ansys.tools.common.launcher.helpers import ports
 from ansys.tools.common.launcher.interface import LAUNCHER_CONFIG_T, LauncherProtocol
 
 
@@ -46,6 +47,22 @@ def pytest_configure(config):
         )
 
 
+@pytest.fixture(autouse=True)
+def plugin_cache_path(monkeypatch, tmp_path):
+    """Keep the plugin discovery cache of the tests out of the user cache directory."""
+    cache_path = tmp_path / "plugin_cache" / "entry_points.json"
+    monkeypatch.setenv(_plugins._PLUGIN_CACHE_PATH_ENV_VAR_NAME, str(cache_path))
+    return cache_path
+
+
+@pytest.fixture(autouse=True)
+def port_lease_dir(monkeypatch, tmp_path):
+    """Keep the port lease files of the tests out of the user cache directory."""
+    lease_dir = tmp_path / "port_leases"
+    monkeypatch.setenv(ports._PORT_LEASE_DIR_ENV_VAR_NAME, str(lease_dir))
+    return lease_dir
+
+
 @pytest.fixture(autouse=True)
 def reset_config():
     """Reset the configuration at the start of each test."""
@@ -61,6 +78,8 @@ def get_mock_entrypoints_from_plugins(
         for launch_mode, launcher_kls in launchers.items():
             mock_entrypoint = Mock(spec=importlib.metadata.EntryPoint)
             mock_entrypoint.name = f"{product_name}.{launch_mode}"
+            mock_entrypoint.value = f"{launcher_kls.__module__}:{launcher_kls.__qualname__}"
+            mock_entrypoint.group = _plugins.LAUNCHER_ENTRY_POINT
             mock_entrypoint.load = Mock(return_value=launcher_kls)
             res.append(mock_entrypoint)
     return res
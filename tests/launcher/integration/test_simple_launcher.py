@@ -22,12 +22,15 @@
 
 """Test module for launcher."""
 
+import asyncio
 from dataclasses import dataclass
 import pathlib
 
 import pytest
 
-from ansys.tools.common.launcher import config, launch_product
+from ansys.tools.common.launcher import alaunch_product, config, launch_product
+from ansys.tools.common.launcher.async_product_instance import AsyncProductInstance
+from ansys.tools.common.launcher.grpc_transport import UDSOptions
 
 from .simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
 
@@ -48,6 +51,23 @@ def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
     monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {"direct": SimpleLauncher}})
 
 
+def isolated_config(uds_dir: pathlib.Path) -> SimpleLauncherConfig:
+    """Create a configuration whose server uses its own UDS directory."""
+    uds_dir.mkdir(parents=True)
+    launcher_config = SimpleLauncherConfig()
+    launcher_config.transport_options = UDSOptions(uds_service="simple_test_service", uds_dir=str(uds_dir))
+    return launcher_config
+
+
+class AsyncCheckLauncher(SimpleLauncher):
+    """Simple launcher with an asynchronous check."""
+
+    async def check_async(self, *, timeout=None):
+        """Check if the server is responding to requests, without blocking the event loop."""
+        self.async_checks = getattr(self, "async_checks", 0) + 1
+        return await asyncio.to_thread(self.check, timeout=timeout)
+
+
 def check_uds_file_removed(server):
     """Check that the UDS file has been removed after stopping the server."""
     uds_file = pathlib.Path(server._launcher.transport_options["main"].uds_dir) / "simple_test_service.sock"
@@ -99,5 +119,59 @@ def test_contextmanager():
     with launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig()) as server:
         server.wait(timeout=10)
         assert server.check()
+        assert server.check_servers(timeout=5) == {"main": True}
     assert not server.check()
     check_uds_file_removed(server)
+
+
+def test_async_contextmanager(tmp_path):
+    """Test that the server can be launched and stopped asynchronously."""
+
+    async def main():
+        server = await alaunch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=isolated_config(tmp_path / "uds"))
+        async with server:
+            await server.wait(timeout=10)
+            assert await server.check()
+        assert server.stopped
+        assert not await server.check()
+        return server
+
+    server = asyncio.run(main())
+    check_uds_file_removed(server)
+
+
+def test_async_launcher_methods(tmp_path):
+    """Test that the asynchronous methods of a launcher are used if they exist."""
+
+    async def main():
+        launcher = AsyncCheckLauncher(config=isolated_config(tmp_path / "uds"))
+        server = AsyncProductInstance(launcher=launcher)
+        assert server.stopped
+        await server.start()
+        await server.wait(timeout=10)
+        assert launcher.async_checks >= 1
+        await server.restart()
+        await server.wait(timeout=10)
+        await server.stop()
+
+    asyncio.run(main())
+
+
+def test_async_launch_concurrently(tmp_path):
+    """Test that several servers can be launched and stopped concurrently from one event loop."""
+
+    async def main():
+        servers = await asyncio.gather(
+            *(
+                alaunch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=isolated_config(tmp_path / f"uds{i}"))
+                for i in range(5)
+            )
+        )
+        await asyncio.gather(*(server.wait(timeout=10) for server in servers))
+        assert all(await asyncio.gather(*(server.check() for server in servers)))
+        await asyncio.gather(*(server.stop() for server in servers))
+        return servers
+
+    for server in asyncio.run(main()):
+        assert server.stopped
+        check_uds_file_removed(server)
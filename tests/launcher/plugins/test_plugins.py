@@ -23,6 +23,8 @@
 """Tests for the 'plugins' module."""
 
 from dataclasses import dataclass
+import json
+import sys
 
 import pytest
 
@@ -125,3 +127,139 @@ def test_get_launcher_inexistent():
     with pytest.raises(KeyError) as exc:
         _plugins.get_launcher(product_name="does_not_exist", launch_mode="does_not_exist")
     assert "No plugin found" in str(exc.value)
+
+
+def test_launcher_classes_are_memoized(monkeypatch, monkeypatch_entrypoints):
+    """Test that each plugin is loaded only once, until the entry points change."""
+    make_entry_points = _plugins._get_entry_points
+    # Freeze the mock entry points, as the cache of '_get_entry_points' does.
+    entry_points = tuple(make_entry_points())
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: entry_points)
+    for _ in range(3):
+        assert _plugins.get_launcher(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE_A1) == MockLauncherA1
+    assert _plugins.get_all_plugins() == PLUGINS
+    assert [entry_point.load.call_count for entry_point in entry_points] == [1, 1, 1]
+
+    new_entry_points = tuple(make_entry_points())
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: new_entry_points)
+    assert _plugins.get_launcher(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE_A1) == MockLauncherA1
+    assert new_entry_points[0].load.call_count == 1
+
+
+def test_has_fallback(monkeypatch_entrypoints_from_plugins):
+    """Test detecting and getting fallback launchers."""
+    monkeypatch_entrypoints_from_plugins(
+        {TEST_PRODUCT_A: {interface.FALLBACK_LAUNCH_MODE_NAME: MockLauncherA1}, TEST_PRODUCT_B: PLUGINS[TEST_PRODUCT_B]}
+    )
+    assert _plugins.has_fallback(TEST_PRODUCT_A)
+    assert not _plugins.has_fallback(TEST_PRODUCT_B)
+    assert not _plugins.has_fallback("does_not_exist")
+    assert _plugins.get_fallback_launcher(TEST_PRODUCT_A) == MockLauncherA1
+    with pytest.raises(KeyError, match="No plugin found"):
+        _plugins.get_fallback_launcher(TEST_PRODUCT_B)
+
+
+def test_get_plugin_descriptors(monkeypatch, monkeypatch_entrypoints):
+    """Test that plugin descriptors are listed without importing the plugins."""
+    entry_points = tuple(_plugins._get_entry_points())
+    entry_points[0].dist.name = "pkg-a"
+    entry_points[0].dist.version = "1.2.3"
+    entry_points[1].dist = None
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: entry_points)
+
+    descriptors = _plugins.get_plugin_descriptors()
+    assert {product: set(modes) for product, modes in descriptors.items()} == {
+        product: set(modes) for product, modes in PLUGINS.items()
+    }
+    assert all(entry_point.load.call_count == 0 for entry_point in entry_points)
+
+    descriptor = descriptors[TEST_PRODUCT_A][TEST_LAUNCH_MODE_A1]
+    assert descriptor.name == f"{TEST_PRODUCT_A}.{TEST_LAUNCH_MODE_A1}"
+    assert (descriptor.distribution_name, descriptor.distribution_version) == ("pkg-a", "1.2.3")
+    assert descriptors[TEST_PRODUCT_A][TEST_LAUNCH_MODE_A2].distribution_name is None
+
+    assert descriptor.CONFIG_MODEL is MockConfigA1
+    assert descriptor.SERVER_SPEC == {}
+    assert descriptor.load() is MockLauncherA1
+    assert [entry_point.load.call_count for entry_point in entry_points] == [1, 0, 0]
+
+
+@pytest.fixture
+def clear_entry_points_cache():
+    """Clear the in-process cache of the entry points before and after the test."""
+    _plugins._get_entry_points.cache_clear()
+    yield
+    _plugins._get_entry_points.cache_clear()
+
+
+def _entry_point_tuples(entry_points):
+    return [(entry_point.name, entry_point.value, entry_point.group) for entry_point in entry_points]
+
+
+def test_plugin_cache(monkeypatch, plugin_cache_path, clear_entry_points_cache):
+    """Test that the entry points are read from the discovery cache while the distributions do not change."""
+    scanned = _plugins._get_entry_points()
+    assert plugin_cache_path.exists()
+    assert _entry_point_tuples(scanned) == _entry_point_tuples(_plugins._scan_entry_points())
+
+    def fail_scan():
+        raise AssertionError("The entry points should be read from the cache.")
+
+    monkeypatch.setattr(_plugins, "_scan_entry_points", fail_scan)
+    _plugins._get_entry_points.cache_clear()
+    cached = _plugins._get_entry_points()
+    assert _entry_point_tuples(cached) == _entry_point_tuples(scanned)
+    for cached_entry_point, entry_point in zip(cached, scanned):
+        cached_descriptor = _plugins.PluginDescriptor(product_name="", launch_mode="", entry_point=cached_entry_point)
+        descriptor = _plugins.PluginDescriptor(product_name="", launch_mode="", entry_point=entry_point)
+        assert (cached_descriptor.distribution_name, cached_descriptor.distribution_version) == (
+            descriptor.distribution_name,
+            descriptor.distribution_version,
+        )
+
+
+def test_plugin_cache_path(monkeypatch, tmp_path):
+    """Test that each Python environment has its own discovery cache file, independent of the working directory."""
+    monkeypatch.delenv(_plugins._PLUGIN_CACHE_PATH_ENV_VAR_NAME)
+    cache_path = _plugins._get_plugin_cache_path()
+    fingerprint = _plugins._get_distributions_fingerprint()
+    monkeypatch.chdir(tmp_path)
+    assert _plugins._get_distributions_fingerprint() == fingerprint
+
+    monkeypatch.setattr(sys, "prefix", str(tmp_path / "venv"))
+    assert _plugins._get_plugin_cache_path() != cache_path
+    assert _plugins._get_plugin_cache_path().parent == cache_path.parent
+
+
+def test_plugin_cache_invalidated(monkeypatch, tmp_path, plugin_cache_path, clear_entry_points_cache):
+    """Test that installing a distribution invalidates the discovery cache."""
+    _plugins._get_entry_points()
+    fingerprint = json.loads(plugin_cache_path.read_text())["fingerprint"]
+    assert fingerprint == _plugins._get_distributions_fingerprint()
+
+    site_dir = tmp_path / "site"
+    (site_dir / "new_plugin-1.0.dist-info").mkdir(parents=True)
+    (site_dir / "new_plugin-1.0.dist-info" / "entry_points.txt").write_text(
+        f"[{_plugins.LAUNCHER_ENTRY_POINT}]\nnew_plugin.direct = new_plugin:Launcher\n"
+    )
+    monkeypatch.syspath_prepend(str(site_dir))
+    assert _plugins._get_distributions_fingerprint() != fingerprint
+
+    _plugins._get_entry_points.cache_clear()
+    assert "new_plugin.direct" in [entry_point.name for entry_point in _plugins._get_entry_points()]
+    assert json.loads(plugin_cache_path.read_text())["fingerprint"] == _plugins._get_distributions_fingerprint()
+
+
+def test_plugin_cache_corrupted(plugin_cache_path, clear_entry_points_cache):
+    """Test that a corrupted discovery cache is ignored and rewritten."""
+    plugin_cache_path.parent.mkdir(parents=True)
+    plugin_cache_path.write_text("{not json")
+    assert _entry_point_tuples(_plugins._get_entry_points()) == _entry_point_tuples(_plugins._scan_entry_points())
+    assert json.loads(plugin_cache_path.read_text())["fingerprint"] == _plugins._get_distributions_fingerprint()
+
+
+def test_plugin_cache_disabled(monkeypatch, plugin_cache_path, clear_entry_points_cache):
+    """Test that the discovery cache can be disabled with the environment variable."""
+    monkeypatch.setenv(_plugins._PLUGIN_CACHE_PATH_ENV_VAR_NAME, "")
+    _plugins._get_entry_points()
+    assert not plugin_cache_path.exists()
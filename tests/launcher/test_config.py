@@ -0,0 +1,325 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'config' module."""
+
+from dataclasses import dataclass
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import timeit
+from unittest.mock import Mock
+
+import pytest
+
+from ansys.tools.common.launcher import config, interface
+
+TEST_PRODUCT_A = "PRODUCT_A"
+TEST_PRODUCT_B = "PRODUCT_B"
+TEST_LAUNCH_MODE = "LAUNCH_MODE"
+
+
+@dataclass
+class MockConfig:
+    """Config mock."""
+
+    value: int = 0
+
+
+class MockLauncher(interface.LauncherProtocol[MockConfig]):
+    """Launcher mock."""
+
+    CONFIG_MODEL = MockConfig
+
+
+PLUGINS = {
+    TEST_PRODUCT_A: {TEST_LAUNCH_MODE: MockLauncher},
+    TEST_PRODUCT_B: {TEST_LAUNCH_MODE: MockLauncher},
+}
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    """Mock entrypoints for the plugins."""
+    monkeypatch_entrypoints_from_plugins(PLUGINS)
+
+
+@pytest.fixture
+def config_path(monkeypatch, tmp_path):
+    """Use a temporary configuration file."""
+    path = tmp_path / "config.json"
+    monkeypatch.setenv(config._CONFIG_PATH_ENV_VAR_NAME, str(path))
+    return path
+
+
+def write_config(path, values):
+    """Write a configuration file with the given value for each product."""
+    contents = {
+        product_name: {"launch_mode": TEST_LAUNCH_MODE, "configs": {TEST_LAUNCH_MODE: {"value": value}}}
+        for product_name, value in values.items()
+    }
+    path.write_text(json.dumps(contents))
+
+
+def get_value(product_name):
+    """Get the configured value for a product."""
+    return config.get_config_for(product_name=product_name, launch_mode=TEST_LAUNCH_MODE).value
+
+
+def test_reload_on_change(config_path):
+    """Test that changes to the configuration file are picked up."""
+    assert not config.is_configured(product_name=TEST_PRODUCT_A)
+
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+    assert get_value(TEST_PRODUCT_A) == 1
+
+    write_config(config_path, {TEST_PRODUCT_A: 22})
+    assert get_value(TEST_PRODUCT_A) == 22
+
+    config_path.unlink()
+    assert not config.is_configured(product_name=TEST_PRODUCT_A)
+
+
+def test_unchanged_products_are_kept(config_path):
+    """Test that only the products whose configuration changed are reloaded."""
+    write_config(config_path, {TEST_PRODUCT_A: 1, TEST_PRODUCT_B: 1})
+    assert get_value(TEST_PRODUCT_B) == 1
+    product_config_b = config._get_config()[TEST_PRODUCT_B]
+
+    write_config(config_path, {TEST_PRODUCT_A: 22, TEST_PRODUCT_B: 1})
+    assert get_value(TEST_PRODUCT_A) == 22
+    assert config._get_config()[TEST_PRODUCT_B] is product_config_b
+
+
+def test_unsaved_changes_take_precedence(config_path):
+    """Test that in-memory changes are not discarded when the file changes."""
+    write_config(config_path, {TEST_PRODUCT_A: 1, TEST_PRODUCT_B: 1})
+    config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=3))
+
+    write_config(config_path, {TEST_PRODUCT_A: 22, TEST_PRODUCT_B: 22})
+    assert get_value(TEST_PRODUCT_A) == 3
+    assert get_value(TEST_PRODUCT_B) == 22
+
+    config.save_config()
+    assert json.loads(config_path.read_text())[TEST_PRODUCT_A]["configs"][TEST_LAUNCH_MODE] == {"value": 3}
+
+
+def test_save_config_failure_keeps_file(monkeypatch, config_path):
+    """Test that a failed save neither modifies the file nor leaves a temporary file."""
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+    config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=3))
+
+    def fail(fd):
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(os, "fsync", fail)
+    with pytest.raises(OSError, match="Disk full"):
+        config.save_config()
+    assert json.loads(config_path.read_text())[TEST_PRODUCT_A]["configs"][TEST_LAUNCH_MODE] == {"value": 1}
+    assert list(config_path.parent.glob("*.tmp")) == []
+
+
+def test_concurrent_save_and_read(config_path):
+    """Test that readers never see a partially written configuration file."""
+    config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=1))
+    config.save_config()
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                json.loads(config_path.read_text())
+            except Exception as exc:
+                errors.append(exc)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for value in range(200):
+            config.set_config_for(
+                product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=value)
+            )
+            config.save_config()
+    finally:
+        done.set()
+        reader.join()
+    assert errors == []
+    assert get_value(TEST_PRODUCT_A) == 199
+
+
+def test_save_config_merges_products(config_path):
+    """Test that saving keeps the products which were changed by other processes."""
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+    config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=3))
+
+    write_config(config_path, {TEST_PRODUCT_A: 1, TEST_PRODUCT_B: 22})
+    config.save_config()
+    contents = json.loads(config_path.read_text())
+    assert contents[TEST_PRODUCT_A]["configs"][TEST_LAUNCH_MODE] == {"value": 3}
+    assert contents[TEST_PRODUCT_B]["configs"][TEST_LAUNCH_MODE] == {"value": 22}
+
+
+def test_transaction(config_path):
+    """Test that a transaction saves its changes, unless it fails."""
+    with config.transaction():
+        config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=1))
+        assert not config_path.exists()
+    assert json.loads(config_path.read_text())[TEST_PRODUCT_A]["configs"][TEST_LAUNCH_MODE] == {"value": 1}
+
+    with pytest.raises(ValueError):
+        with config.transaction():
+            config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=2))
+            raise ValueError()
+    assert get_value(TEST_PRODUCT_A) == 2
+    assert json.loads(config_path.read_text())[TEST_PRODUCT_A]["configs"][TEST_LAUNCH_MODE] == {"value": 1}
+
+
+def test_transaction_excludes_other_processes(config_path):
+    """Test that other processes cannot save the configuration during a transaction."""
+    script = textwrap.dedent(
+        f"""
+        from dataclasses import dataclass
+
+        from ansys.tools.common.launcher import config
+
+        @dataclass
+        class MockConfig:
+            value: int
+
+        config.set_config_for(
+            product_name={TEST_PRODUCT_B!r}, launch_mode={TEST_LAUNCH_MODE!r}, config=MockConfig(value=22)
+        )
+        config.save_config()
+        """
+    )
+    with config.transaction():
+        config.set_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=1))
+        process = subprocess.Popen([sys.executable, "-c", script])
+        with pytest.raises(subprocess.TimeoutExpired):
+            process.wait(timeout=1)
+        assert not config_path.exists()
+    assert process.wait(timeout=30) == 0
+
+    config._reset_config()
+    assert get_value(TEST_PRODUCT_A) == 1
+    assert get_value(TEST_PRODUCT_B) == 22
+
+
+def test_concurrent_processes_do_not_lose_updates(config_path):
+    """Test that processes saving different products concurrently do not overwrite each other."""
+    script = textwrap.dedent(
+        """
+        from dataclasses import dataclass
+        import sys
+
+        from ansys.tools.common.launcher import config
+
+        @dataclass
+        class MockConfig:
+            value: int
+
+        product_name = sys.argv[1]
+        for value in range(10):
+            with config.transaction():
+                config.set_config_for(product_name=product_name, launch_mode="LAUNCH_MODE", config=MockConfig(value))
+        """
+    )
+    product_names = [f"PRODUCT_{i}" for i in range(4)]
+    processes = [subprocess.Popen([sys.executable, "-c", script, product_name]) for product_name in product_names]
+    assert [process.wait(timeout=60) for process in processes] == [0] * len(processes)
+
+    contents = json.loads(config_path.read_text())
+    assert sorted(contents) == product_names
+    assert all(contents[product_name]["configs"]["LAUNCH_MODE"] == {"value": 9} for product_name in product_names)
+
+
+def test_config_objects_are_cached(monkeypatch, config_path):
+    """Test that configuration objects are cached until the configuration changes."""
+    get_config_model = Mock(wraps=config.get_config_model)
+    monkeypatch.setattr(config, "get_config_model", get_config_model)
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+
+    config_a = config.get_config_for(product_name=TEST_PRODUCT_A, launch_mode=None)
+    assert config.get_config_for(product_name=TEST_PRODUCT_A, launch_mode=None) == config_a
+    default_config_b = config.get_config_for(product_name=TEST_PRODUCT_B, launch_mode=TEST_LAUNCH_MODE)
+    assert config.get_config_for(product_name=TEST_PRODUCT_B, launch_mode=TEST_LAUNCH_MODE) == default_config_b
+    assert get_config_model.call_count == 2
+
+    config.set_config_for(product_name=TEST_PRODUCT_B, launch_mode=TEST_LAUNCH_MODE, config=MockConfig(value=3))
+    assert get_value(TEST_PRODUCT_B) == 3
+
+    write_config(config_path, {TEST_PRODUCT_A: 22})
+    assert get_value(TEST_PRODUCT_A) == 22
+
+    config._reset_config()
+    config_path.unlink()
+    assert config.get_config_for(product_name=TEST_PRODUCT_A, launch_mode=TEST_LAUNCH_MODE) == MockConfig()
+    assert get_config_model.call_count == 5
+
+
+def test_config_file_checked_once_per_call(monkeypatch, config_path):
+    """Test that the configuration file is checked for changes once per call."""
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+    assert get_value(TEST_PRODUCT_A) == 1
+    get_config_file_state = Mock(wraps=config._get_config_file_state)
+    monkeypatch.setattr(config, "_get_config_file_state", get_config_file_state)
+
+    assert config.get_config_for(product_name=TEST_PRODUCT_A, launch_mode=None) == MockConfig(value=1)
+    assert get_config_file_state.call_count == 1
+    assert config.is_configured(product_name=TEST_PRODUCT_A)
+    assert get_config_file_state.call_count == 2
+
+    config._reset_config()
+    get_config_file_state.reset_mock()
+    assert get_value(TEST_PRODUCT_A) == 1
+    assert get_config_file_state.call_count == 1
+
+
+@pytest.mark.parametrize("product_name", [TEST_PRODUCT_A, TEST_PRODUCT_B])
+def test_config_objects_are_copies(config_path, product_name):
+    """Test that modifying a returned configuration object does not affect later calls."""
+    # Product A is configured, while product B uses the default configuration
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+    first = config.get_config_for(product_name=product_name, launch_mode=TEST_LAUNCH_MODE)
+    expected_value = first.value
+    first.value = 42
+    assert get_value(product_name) == expected_value
+
+
+def test_cached_config_objects_are_faster(config_path):
+    """Test that getting a cached configuration object is not slower than creating it."""
+    write_config(config_path, {TEST_PRODUCT_A: 1})
+
+    def get_cached():
+        config.get_config_for(product_name=TEST_PRODUCT_A, launch_mode=None)
+
+    def get_uncached():
+        with config._checked_config_file():
+            config._get_config_for_uncached(product_name=TEST_PRODUCT_A, launch_mode=None)
+
+    cached_time = min(timeit.repeat(get_cached, number=200, repeat=5))
+    uncached_time = min(timeit.repeat(get_uncached, number=200, repeat=5))
+    assert cached_time <= uncached_time
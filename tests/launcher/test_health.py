@@ -0,0 +1,249 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the health check helpers."""
+
+import asyncio
+from concurrent import futures
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+import socket
+import threading
+import time
+import warnings
+
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+import pytest
+
+from ansys.tools.common.launcher.async_product_instance import AsyncProductInstance
+from ansys.tools.common.launcher.grpc_transport import InsecureOptions
+from ansys.tools.common.launcher.helpers.grpc import check_grpc_health_concurrently, wait_for_grpc_health
+from ansys.tools.common.launcher.helpers.health import (
+    check_servers,
+    check_url,
+    wait_for_servers,
+    wait_for_url,
+    wait_for_url_async,
+)
+from ansys.tools.common.launcher.helpers.ports import find_free_ports
+from ansys.tools.common.launcher.interface import LauncherProtocol, ServerType
+from ansys.tools.common.launcher.product_instance import ProductInstance
+from benchmarks.echo import EchoServer
+
+
+@pytest.fixture
+def echo_servers():
+    """Start two gRPC servers with a health service."""
+    with EchoServer("insecure") as first, EchoServer("insecure") as second:
+        channels = [first.create_channel(), second.create_channel()]
+        yield channels
+        for channel in channels:
+            channel.close()
+
+
+@pytest.fixture
+def health_server():
+    """Start a gRPC server which is not serving yet."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    servicer = health.HealthServicer()
+    servicer.set("", health_pb2.HealthCheckResponse.ServingStatus.NOT_SERVING)
+    health_pb2_grpc.add_HealthServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    with grpc.insecure_channel(f"localhost:{port}") as channel:
+        yield servicer, channel
+    server.stop(None)
+
+
+@pytest.fixture
+def http_url():
+    """Start an HTTP server, and return its URL."""
+    server = HTTPServer(("localhost", 0), SimpleHTTPRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_grpc_health_concurrently(echo_servers):
+    """Test checking the health of several gRPC servers at once."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        unreachable = grpc.insecure_channel(f"localhost:{find_free_ports()[0]}")
+    assert check_grpc_health_concurrently([*echo_servers, unreachable], timeout=1) == [True, True, False]
+    unreachable.close()
+
+
+def test_check_url(http_url):
+    """Test probing generic servers."""
+    assert check_url(http_url, timeout=5)
+    with socket.create_server(("localhost", 0)) as sock:
+        assert check_url(f"localhost:{sock.getsockname()[1]}", timeout=5)
+    port = find_free_ports()[0]
+    assert not check_url(f"localhost:{port}", timeout=1)
+    assert not check_url(f"http://localhost:{port}", timeout=1)
+    with pytest.raises(ValueError, match="does not contain a host and a port"):
+        check_url("localhost")
+
+
+def test_check_servers(echo_servers, http_url):
+    """Test checking gRPC and generic servers together."""
+    results = check_servers(
+        channels={"first": echo_servers[0], "second": echo_servers[1]},
+        urls={"http": http_url, "closed": f"localhost:{find_free_ports()[0]}"},
+        timeout=1,
+    )
+    assert results == {"first": True, "second": True, "http": True, "closed": False}
+    assert check_servers() == {}
+
+
+def test_wait_for_grpc_health(health_server):
+    """Test that waiting for a gRPC server returns as soon as it is serving."""
+    servicer, channel = health_server
+    assert not wait_for_grpc_health(channel, timeout=0.2)
+
+    timer = threading.Timer(0.2, servicer.set, ("", health_pb2.HealthCheckResponse.ServingStatus.SERVING))
+    timer.start()
+    start = time.monotonic()
+    assert wait_for_grpc_health(channel, timeout=10)
+    assert time.monotonic() - start < 5
+    timer.join()
+
+
+def test_wait_for_grpc_health_unimplemented():
+    """Test waiting for a gRPC server without health service."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    with grpc.insecure_channel(f"localhost:{port}") as channel:
+        assert not wait_for_grpc_health(channel, timeout=10)
+    server.stop(None)
+
+
+def test_wait_for_url():
+    """Test waiting for a generic server which starts later."""
+    port = find_free_ports()[0]
+    assert not wait_for_url(f"localhost:{port}", timeout=0.2)
+
+    sockets = []
+    timer = threading.Timer(0.2, lambda: sockets.append(socket.create_server(("localhost", port))))
+    timer.start()
+    try:
+        assert wait_for_url(f"localhost:{port}", timeout=10)
+    finally:
+        timer.join()
+        for sock in sockets:
+            sock.close()
+
+
+def test_wait_for_url_timeout():
+    """Test that waiting for an unreachable URL returns when the timeout is reached."""
+    start = time.monotonic()
+    assert not wait_for_url("http://127.0.0.1:1/", timeout=0.3)
+    assert time.monotonic() - start < 5
+
+
+def test_wait_for_url_async_timeout():
+    """Test that waiting asynchronously for an unreachable URL returns when the timeout is reached."""
+    assert not asyncio.run(wait_for_url_async("http://127.0.0.1:1/", timeout=0.3))
+
+
+def test_wait_for_servers(echo_servers, http_url):
+    """Test waiting for gRPC and generic servers together."""
+    results = wait_for_servers(
+        channels={"first": echo_servers[0], "second": echo_servers[1]},
+        urls={"http": http_url, "closed": f"localhost:{find_free_ports()[0]}"},
+        timeout=0.5,
+    )
+    assert results == {"first": True, "second": True, "http": True, "closed": False}
+
+
+class NotServingLauncher(LauncherProtocol[None]):
+    """Launcher for a running server whose health service reports that it is not serving."""
+
+    CONFIG_MODEL = None
+    SERVER_SPEC = {"main": ServerType.GRPC}
+
+    def __init__(self, *, port: int, ready_after: float):
+        self._port = port
+        self._ready_after = ready_after
+        self._started = 0.0
+
+    def start(self):
+        """Record the start time."""
+        self._started = time.monotonic()
+
+    def stop(self, *, timeout=None):
+        """Do nothing, the server is stopped by the test."""
+
+    def check(self, *, timeout=None):
+        """Report that the product is running after a delay."""
+        return time.monotonic() - self._started > self._ready_after
+
+    @property
+    def urls(self):
+        """URLs of the generic servers."""
+        return {}
+
+    @property
+    def transport_options(self):
+        """Transport options of the gRPC server."""
+        return {"main": InsecureOptions(port=self._port)}
+
+
+@pytest.fixture
+def not_serving_port():
+    """Start a gRPC server whose health service never reports that it is serving."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    servicer = health.HealthServicer()
+    servicer.set("", health_pb2.HealthCheckResponse.ServingStatus.NOT_SERVING)
+    health_pb2_grpc.add_HealthServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield port
+    server.stop(None)
+
+
+def test_product_instance_wait_not_serving(not_serving_port):
+    """Test that waiting for an instance relies on the launcher check when the server is not serving."""
+    instance = ProductInstance(launcher=NotServingLauncher(port=not_serving_port, ready_after=0.2))
+    try:
+        start = time.monotonic()
+        instance.wait(timeout=10)
+        assert time.monotonic() - start < 3
+    finally:
+        instance.stop()
+
+
+def test_async_product_instance_wait_not_serving(not_serving_port):
+    """Test that waiting asynchronously for an instance relies on the launcher check when the server is not serving."""
+
+    async def main():
+        instance = AsyncProductInstance(launcher=NotServingLauncher(port=not_serving_port, ready_after=0.2))
+        await instance.start()
+        async with instance:
+            start = time.monotonic()
+            await instance.wait(timeout=10)
+            assert time.monotonic() - start < 3
+
+    asyncio.run(main())
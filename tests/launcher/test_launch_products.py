@@ -0,0 +1,147 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for launching several product instances at once."""
+
+from dataclasses import dataclass, field
+import threading
+import time
+
+import pytest
+
+from ansys.tools.common.exceptions import ProductInstanceError
+from ansys.tools.common.launcher import launch_products
+from ansys.tools.common.launcher.helpers.ports import find_free_ports
+from ansys.tools.common.launcher.interface import LauncherProtocol
+from ansys.tools.common.launcher.product_instance import ProductInstanceCollection
+
+PRODUCT_NAME = "ParallelProduct"
+
+
+@dataclass
+class ParallelConfig:
+    """Configuration of the parallel launcher."""
+
+    start_delay: float = 0.0
+    failing_start: int | None = None
+    launched: list = field(default_factory=list)
+
+
+class ParallelLauncher(LauncherProtocol[ParallelConfig]):
+    """Launcher which records the ports of its instances, without starting any process."""
+
+    CONFIG_MODEL = ParallelConfig
+    SERVER_SPEC = {}
+    lock = threading.Lock()
+    starts = 0
+    running: set[int] = set()
+    ports: list[int] = []
+
+    def __init__(self, *, config: ParallelConfig):
+        self._config = config
+        self._port: int | None = None
+
+    def start(self):
+        """Start the instance."""
+        cls = type(self)
+        with cls.lock:
+            cls.starts += 1
+            start_index = cls.starts
+        time.sleep(self._config.start_delay)
+        if start_index == self._config.failing_start:
+            raise RuntimeError("Cannot start the product.")
+        self._port = find_free_ports()[0]
+        with cls.lock:
+            cls.ports.append(self._port)
+            cls.running.add(self._port)
+
+    def stop(self, *, timeout=None):
+        """Stop the instance."""
+        with type(self).lock:
+            type(self).running.discard(self._port)
+
+    def check(self, *, timeout=None):
+        """Check the instance."""
+        return self._port in type(self).running
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    """Mock the entry points for the launcher plugins."""
+    ParallelLauncher.starts = 0
+    ParallelLauncher.running = set()
+    ParallelLauncher.ports = []
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {"direct": ParallelLauncher}})
+
+
+def test_launch_products():
+    """Test that the instances are launched concurrently, with distinct ports."""
+    start = time.monotonic()
+    with launch_products(20, PRODUCT_NAME, launch_mode="direct", config=ParallelConfig(start_delay=0.2)) as products:
+        assert time.monotonic() - start < 2
+        assert isinstance(products, ProductInstanceCollection)
+        assert len(products) == 20
+        assert len(set(ParallelLauncher.ports)) == 20
+        assert products.check()
+        products.wait(timeout=1)
+        assert not products[0].stopped
+    assert all(product.stopped for product in products)
+    assert not ParallelLauncher.running
+
+
+def test_launch_products_copies_config():
+    """Test that each instance gets its own copy of the configuration."""
+    config = ParallelConfig()
+    with launch_products(3, PRODUCT_NAME, launch_mode="direct", config=config, wait_timeout=1) as products:
+        configs = [product._launcher._config for product in products]
+    assert len({id(launcher_config) for launcher_config in configs}) == 3
+    assert all(launcher_config is not config for launcher_config in configs)
+
+
+def test_launch_products_failure():
+    """Test that all started instances are stopped if one launch fails."""
+    config = ParallelConfig(start_delay=0.05, failing_start=3)
+    with pytest.raises(RuntimeError, match="Cannot start the product"):
+        launch_products(10, PRODUCT_NAME, launch_mode="direct", config=config, max_workers=2)
+    assert ParallelLauncher.starts < 10
+    assert ParallelLauncher.ports
+    assert not ParallelLauncher.running
+
+
+def test_launch_products_invalid_number():
+    """Test that the number of instances must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        launch_products(0, PRODUCT_NAME, launch_mode="direct")
+
+
+def test_collection_stop_error():
+    """Test that all instances are stopped even if one of them fails to stop."""
+    products = launch_products(3, PRODUCT_NAME, launch_mode="direct", config=ParallelConfig())
+    products[1]._launcher.stop = lambda *, timeout=None: (_ for _ in ()).throw(RuntimeError("Cannot stop."))
+    with pytest.raises(ProductInstanceError, match="Failed to stop 1 of 3") as exc_info:
+        products.stop()
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+    assert products[0].stopped and products[2].stopped
+    assert not products[1].stopped
+    del products[1]._launcher.stop
+    products.stop()
+    assert not ParallelLauncher.running
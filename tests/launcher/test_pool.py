@@ -0,0 +1,192 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the pool of product instances."""
+
+from dataclasses import dataclass
+import time
+
+import pytest
+
+from ansys.tools.common.exceptions import ProductInstanceError
+from ansys.tools.common.launcher import launch_product
+from ansys.tools.common.launcher.interface import LauncherProtocol
+from ansys.tools.common.launcher.pool import ProductInstancePool
+
+PRODUCT_NAME = "PooledProduct"
+
+
+@dataclass
+class PooledConfig:
+    """Configuration of the pooled launcher."""
+
+    fail_start: bool = False
+
+
+class PooledLauncher(LauncherProtocol[PooledConfig]):
+    """Launcher which keeps track of its instances, without starting any process."""
+
+    CONFIG_MODEL = PooledConfig
+    SERVER_SPEC = {}
+    launchers: list["PooledLauncher"] = []
+
+    def __init__(self, *, config: PooledConfig):
+        self._config = config
+        self.running = False
+        self.healthy = True
+        self.resets = 0
+        self.launchers.append(self)
+
+    def start(self):
+        """Start the instance."""
+        if self._config.fail_start:
+            raise RuntimeError("Cannot start the product.")
+        self.running = True
+
+    def stop(self, *, timeout=None):
+        """Stop the instance."""
+        self.running = False
+
+    def check(self, *, timeout=None):
+        """Check the instance."""
+        return self.running and self.healthy
+
+    def reset(self):
+        """Reset the instance between uses."""
+        self.resets += 1
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    """Mock the entry points for the launcher plugins."""
+    PooledLauncher.launchers.clear()
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {"direct": PooledLauncher}})
+
+
+def wait_until(predicate, timeout=5.0):
+    """Wait until the predicate is true."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Condition not reached in time."
+        time.sleep(0.01)
+
+
+def make_pool(**kwargs):
+    """Create a pool of the pooled product."""
+    return ProductInstancePool(PRODUCT_NAME, launch_mode="direct", config=PooledConfig(), **kwargs)
+
+
+def test_acquire_release():
+    """Test that released instances are reset and reused."""
+    with make_pool(size=2) as pool:
+        wait_until(lambda: pool.available == 2)
+        first = pool.acquire(timeout=5)
+        assert not first.stopped
+        assert pool.available == 1
+        pool.release(first)
+        wait_until(lambda: pool.available == 2)
+        assert first._launcher.resets == 1
+        with pool.instance(timeout=5) as second, pool.instance(timeout=5) as third:
+            assert first in (second, third)
+            assert pool.available == 0
+        assert len(PooledLauncher.launchers) == 2
+    assert all(not launcher.running for launcher in PooledLauncher.launchers)
+
+
+def test_acquire_timeout():
+    """Test that acquiring from an exhausted pool times out."""
+    with make_pool(size=1) as pool:
+        with pool.instance(timeout=5):
+            with pytest.raises(ProductInstanceError, match="became available"):
+                pool.acquire(timeout=0.1)
+
+
+def test_max_uses():
+    """Test that instances are replaced after the maximum number of uses."""
+    with make_pool(max_uses=1) as pool:
+        with pool.instance(timeout=5) as first:
+            pass
+        assert first.stopped
+        with pool.instance(timeout=5) as second:
+            assert second is not first
+    assert len(PooledLauncher.launchers) == 2
+
+
+def test_max_age():
+    """Test that idle instances are replaced after their maximum age."""
+    with make_pool(max_age=0.2) as pool:
+        first = pool.acquire(timeout=5)
+        pool.release(first)
+        wait_until(lambda: len(PooledLauncher.launchers) >= 2)
+        assert first.stopped
+        with pool.instance(timeout=5) as second:
+            assert second is not first
+
+
+def test_unhealthy_instance_replaced():
+    """Test that instances failing the check after release are replaced."""
+    with make_pool() as pool:
+        with pool.instance(timeout=5) as first:
+            first._launcher.healthy = False
+        wait_until(lambda: pool.available == 1)
+        assert first.stopped
+        with pool.instance(timeout=5) as second:
+            assert second is not first
+
+
+def test_launch_failure():
+    """Test that launch failures are reported when acquiring times out."""
+    with ProductInstancePool(PRODUCT_NAME, launch_mode="direct", config=PooledConfig(fail_start=True)) as pool:
+        with pytest.raises(ProductInstanceError, match="became available") as exc_info:
+            pool.acquire(timeout=0.5)
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+
+def test_close():
+    """Test that closing the pool stops its instances."""
+    pool = make_pool(size=2)
+    instance = pool.acquire(timeout=5)
+    wait_until(lambda: pool.available == 1)
+    pool.close()
+    assert pool.closed
+    assert not instance.stopped
+    pool.release(instance)
+    assert instance.stopped
+    assert all(not launcher.running for launcher in PooledLauncher.launchers)
+    with pytest.raises(ProductInstanceError, match="closed"):
+        pool.acquire()
+    pool.close()
+
+
+def test_release_foreign_instance():
+    """Test that only instances acquired from the pool can be released."""
+    with make_pool() as pool:
+        instance = launch_product(PRODUCT_NAME, launch_mode="direct", config=PooledConfig())
+        with pytest.raises(ProductInstanceError, match="not acquired from this pool"):
+            pool.release(instance)
+        instance.stop()
+
+
+def test_invalid_size():
+    """Test that the pool size must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        ProductInstancePool(PRODUCT_NAME, size=0)
@@ -0,0 +1,199 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'ports' helper module."""
+
+import asyncio
+from contextlib import closing
+from dataclasses import dataclass
+import json
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from ansys.tools.common.launcher import _file_lock, alaunch_product, launch_product
+from ansys.tools.common.launcher.helpers import ports
+from ansys.tools.common.launcher.interface import LauncherProtocol
+
+PRODUCT_NAME = "PortProduct"
+
+
+@pytest.fixture
+def port_range(monkeypatch):
+    """Hand out ports from a small range, which is not used by the other tests."""
+    with closing(socket.socket()) as sock:
+        sock.bind(("", 0))
+        first_port = sock.getsockname()[1]
+    first_port = min(first_port, 2**16 - 10)
+    monkeypatch.setenv(ports._PORT_RANGE_ENV_VAR_NAME, f"{first_port}-{first_port + 3}")
+    return range(first_port, first_port + 4)
+
+
+@dataclass
+class PortConfig:
+    """Configuration of the port launcher."""
+
+    num_ports: int = 1
+    failing_start: bool = False
+
+
+class PortLauncher(LauncherProtocol[PortConfig]):
+    """Launcher which only reserves ports, without starting any process."""
+
+    CONFIG_MODEL = PortConfig
+    SERVER_SPEC = {}
+
+    def __init__(self, *, config: PortConfig):
+        self._config = config
+        self.ports: list[int] = []
+
+    def start(self):
+        """Start the instance."""
+        self.ports = ports.find_free_ports(self._config.num_ports)
+        if self._config.failing_start:
+            raise RuntimeError("Cannot start the product.")
+
+    def stop(self, *, timeout=None):
+        """Stop the instance."""
+
+    def check(self, *, timeout=None):
+        """Check the instance."""
+        return True
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    """Mock the entry points for the launcher plugins."""
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {"direct": PortLauncher}})
+
+
+def test_ports_are_distinct():
+    """Test that ports assigned by the operating system are not handed out twice."""
+    with ports.collect_port_leases() as port_leases:
+        port_list = ports.find_free_ports(5) + ports.find_free_ports(5)
+    assert len(set(port_list)) == 10
+    assert sorted(port_leases.ports) == sorted(port_list)
+    port_leases.release()
+    assert port_leases.ports == []
+
+
+def test_port_range(port_range):
+    """Test that ports are handed out from the range until it is exhausted."""
+    with ports.collect_port_leases() as port_leases:
+        port_list = ports.find_free_ports(3)
+        assert len(set(port_list)) == 3
+        assert all(port in port_range for port in port_list)
+        assert ports.find_free_ports() == sorted(set(port_range) - set(port_list))
+        with pytest.raises(RuntimeError, match="Cannot find 1 free port"):
+            ports.find_free_ports()
+    port_leases.release()
+    with ports.collect_port_leases() as port_leases:
+        assert len(ports.find_free_ports(4)) == 4
+    port_leases.release()
+
+
+def test_port_range_skips_ports_in_use(port_range):
+    """Test that ports which a server is listening on are not handed out."""
+    with closing(socket.socket()) as server:
+        server.bind(("", port_range[0]))
+        server.listen()
+        with ports.collect_port_leases() as port_leases:
+            assert port_range[0] not in ports.find_free_ports(3)
+        port_leases.release()
+
+
+def test_port_range_leases_are_shared_across_processes(port_range):
+    """Test that ports leased by one process are not handed out by another process."""
+    script = "from ansys.tools.common.launcher.helpers import ports; print(ports.find_free_ports(2))"
+    with ports.collect_port_leases() as port_leases:
+        port_list = ports.find_free_ports(2)
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert sorted(port_list + json.loads(result.stdout)) == list(port_range)
+    port_leases.release()
+
+
+@pytest.mark.parametrize("value", ["50000", "a-b", "50010-50000", "0-10"])
+def test_invalid_port_range(monkeypatch, value):
+    """Test that invalid port ranges are rejected."""
+    monkeypatch.setenv(ports._PORT_RANGE_ENV_VAR_NAME, value)
+    with pytest.raises(ValueError, match="Invalid port range"):
+        ports.find_free_ports()
+
+
+def test_product_instance_releases_ports(port_range):
+    """Test that the ports of a product instance are handed out again once it is stopped."""
+    product = launch_product(PRODUCT_NAME, launch_mode="direct", config=PortConfig(num_ports=4))
+    assert sorted(product._launcher.ports) == list(port_range)
+    with pytest.raises(RuntimeError):
+        ports.find_free_ports()
+
+    product.stop()
+    product.start()
+    assert sorted(product._launcher.ports) == list(port_range)
+    product.stop()
+
+
+def test_failed_start_releases_ports(port_range):
+    """Test that the ports of a product instance are handed out again if it fails to start."""
+    with pytest.raises(RuntimeError, match="Cannot start"):
+        launch_product(PRODUCT_NAME, launch_mode="direct", config=PortConfig(num_ports=4, failing_start=True))
+    with pytest.raises(RuntimeError, match="Cannot start"):
+        asyncio.run(
+            alaunch_product(PRODUCT_NAME, launch_mode="direct", config=PortConfig(num_ports=4, failing_start=True))
+        )
+    with ports.collect_port_leases() as port_leases:
+        assert sorted(ports.find_free_ports(4)) == list(port_range)
+    port_leases.release()
+
+
+def test_released_lease_files_are_deleted(port_lease_dir):
+    """Test that the lease files are deleted when the leases are released."""
+    with ports.collect_port_leases() as port_leases:
+        port_list = ports.find_free_ports(3)
+    assert sorted(path.name for path in port_lease_dir.iterdir()) == sorted(f"{port}.lock" for port in port_list)
+    port_leases.release()
+    assert list(port_lease_dir.iterdir()) == []
+
+
+def test_lock_file_deleted_while_locking(monkeypatch, tmp_path):
+    """Test that a lock file deleted by its previous holder before it is locked is not used."""
+    path = tmp_path / "port.lock"
+    lock = _file_lock._lock
+    deleted = []
+
+    def lock_after_delete(fd, *, blocking):
+        # Simulate the previous holder releasing the lock and deleting the file.
+        if not deleted:
+            deleted.append(fd)
+            path.unlink()
+        return lock(fd, blocking=blocking)
+
+    monkeypatch.setattr(_file_lock, "_lock", lock_after_delete)
+    lock_file = _file_lock.try_lock_file(path)
+    assert lock_file is not None
+    assert deleted
+    assert path.exists()
+    assert _file_lock._is_same_file(lock_file, path)
+    _file_lock.unlock_file(lock_file, delete=True)
+    assert not path.exists()
@@ -0,0 +1,138 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the benchmarks."""
+
+from click.testing import CliRunner
+import pytest
+
+from benchmarks import LatencyResult, format_results, run_transport_benchmark
+from benchmarks.__main__ import cli
+from benchmarks.compression import (
+    PAYLOAD_KINDS,
+    compression_ratio,
+    make_payload,
+    run_compression_benchmark,
+)
+from benchmarks.connection import available_connection_cases, run_connection_benchmark
+from benchmarks.echo import available_transport_modes
+from benchmarks.plugins import run_plugins_benchmark
+from benchmarks.shared_memory import run_shared_memory_benchmark
+
+
+def test_latency_result_statistics():
+    """Test the statistics computed from a sequence of latencies."""
+    result = LatencyResult.from_latencies(
+        name="case", rpc_type="unary", message_size=10, latencies=[i / 1000 for i in range(1, 101)]
+    )
+    assert result.iterations == 100
+    assert result.p50 == pytest.approx(0.0505)
+    assert result.p99 == pytest.approx(0.09901)
+    assert result.mean == pytest.approx(0.0505)
+    assert result.bytes_per_second == pytest.approx(10 * result.messages_per_second)
+
+
+@pytest.mark.parametrize("transport_mode", available_transport_modes())
+def test_run_transport_benchmark(transport_mode):
+    """Test running the transport benchmark with a small number of iterations."""
+    results = run_transport_benchmark([transport_mode], [16, 2048], iterations=3, warmup=1)
+    assert [(result.rpc_type, result.message_size) for result in results] == [
+        ("unary", 16),
+        ("stream", 16),
+        ("unary", 2048),
+        ("stream", 2048),
+    ]
+    assert all(result.name == transport_mode for result in results)
+    assert all(result.p50 > 0 for result in results)
+    assert transport_mode in format_results(results)
+
+
+def test_run_connection_benchmark():
+    """Test running the connection benchmark with a small number of iterations."""
+    cases = available_connection_cases()
+    results = run_connection_benchmark(cases, iterations=2, warmup=0)
+    assert [result.name for result in results] == cases
+    assert all(result.rpc_type == "connect" and result.p50 > 0 for result in results)
+
+    with pytest.raises(ValueError, match="Unknown connection case"):
+        run_connection_benchmark(["tcp"])
+
+
+def test_run_shared_memory_benchmark():
+    """Test running the shared-memory benchmark with a small number of iterations."""
+    transport_mode = "uds" if "uds" in available_transport_modes() else "insecure"
+    results = run_shared_memory_benchmark([1024], transport_mode=transport_mode, iterations=3, warmup=1)
+    assert [result.name for result in results] == [f"{transport_mode}/stream", f"{transport_mode}/shared-memory"]
+
+
+def test_run_plugins_benchmark():
+    """Test running the plugins benchmark with a small number of iterations."""
+    results = run_plugins_benchmark([5, 50], iterations=3, warmup=1)
+    assert [result.name for result in results] == ["linear/5", "index/5", "linear/50", "index/50"]
+    assert all(result.rpc_type == "lookup" for result in results)
+
+
+@pytest.mark.parametrize("payload_kind", PAYLOAD_KINDS)
+def test_make_payload(payload_kind):
+    """Test creating the payloads of the compression benchmark."""
+    payload = make_payload(payload_kind, 10_000)
+    assert len(payload) == 10_000
+    if payload_kind == "mesh":
+        assert compression_ratio(payload) > 2
+
+
+def test_run_compression_benchmark():
+    """Test running the compression benchmark with a small number of iterations."""
+    results = run_compression_benchmark(["none", "gzip"], ["mesh"], [4096], iterations=3, warmup=1)
+    assert [result.name for result in results] == ["none/mesh", "gzip/mesh"]
+
+
+def test_cli():
+    """Test running the transport benchmark from the command line."""
+    result = CliRunner().invoke(
+        cli, ["transport", "--transport-mode", "insecure", "--size", "32", "--iterations", "2", "--warmup", "0"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "insecure" in result.output
+
+
+def test_cli_compression():
+    """Test running the compression benchmark from the command line."""
+    result = CliRunner().invoke(
+        cli, ["compression", "--compression", "gzip", "--payload", "field", "--size", "64", "--iterations", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "gzip/field" in result.output
+
+
+def test_cli_connection():
+    """Test running the connection benchmark from the command line."""
+    result = CliRunner().invoke(cli, ["connection", "--case", "insecure", "--iterations", "2", "--warmup", "0"])
+    assert result.exit_code == 0, result.output
+    assert "connect" in result.output
+
+
+def test_cli_plugins():
+    """Test running the plugins benchmark from the command line."""
+    result = CliRunner().invoke(cli, ["plugins", "--entry-points", "20", "--iterations", "2", "--warmup", "0"])
+    assert result.exit_code == 0, result.output
+    assert "index/20" in result.output
@@ -22,11 +22,21 @@
 
 """Module for testing gRPC connection abstraction."""
 
+import asyncio
+from concurrent import futures
+import queue
+import time
 from unittest.mock import MagicMock
+import warnings
 
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 import pytest
 
-from ansys.tools.common.abstractions.connection import AbstractGRPCConnection
+from ansys.tools.common.abstractions.connection import AbstractAsyncGRPCConnection, AbstractGRPCConnection
+from ansys.tools.common.cyberchannel import is_uds_supported
+from ansys.tools.common.launcher.grpc_transport import UDSOptions
+from benchmarks.echo import ECHO_STREAM_METHOD, ECHO_UNARY_METHOD, EchoServer
 
 
 class MockGRPCConnection(AbstractGRPCConnection):
@@ -87,3 +97,236 @@ def test_service_property(mock_connection):
 def test_is_closed_property(mock_connection):
     """Test the is_closed property."""
     assert mock_connection.is_closed
+
+
+class ChannelConnection(MockGRPCConnection):
+    """Connection using the channel and health monitor of AbstractGRPCConnection."""
+
+    def __init__(self, host: str, port: str) -> None:
+        """Initialize the connection."""
+        super().__init__(host, port)
+        self.reconnections = 0
+
+    def connect(self) -> None:
+        """Connect to the server and start monitoring its health."""
+        self._start_health_monitor(interval=0.05, timeout=0.5)
+
+    def close(self) -> None:
+        """Close the channel."""
+        self._close_channel()
+
+    def _on_reconnect(self) -> None:
+        self.reconnections += 1
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for the condition."
+        time.sleep(0.01)
+
+
+def test_cached_channel():
+    """Test that the channel is created once and its state is tracked."""
+    with EchoServer("insecure") as server:
+        connection = ChannelConnection("localhost", str(server._channel_kwargs["port"]))
+        assert connection.is_closed
+        channel = connection._channel
+        assert connection._channel is channel
+        _wait_for(lambda: not connection.is_closed)
+
+        connection.connect()
+        _wait_for(lambda: connection._is_healthy)
+        assert connection._channel is channel
+        assert connection.reconnections == 0
+
+        connection.close()
+        assert connection.is_closed
+        assert connection._is_healthy is None
+
+
+def test_health_monitor_reconnects():
+    """Test that the channel is replaced while the server is unreachable."""
+    with EchoServer("insecure") as server:
+        port = server._channel_kwargs["port"]
+    connection = ChannelConnection("localhost", str(port))
+    channel = connection._channel
+    connection.connect()
+    try:
+        _wait_for(lambda: connection.reconnections > 0)
+        assert connection._is_healthy is False
+        assert connection._channel is not channel
+        assert connection.is_closed
+    finally:
+        connection.close()
+
+
+def test_health_monitor_without_health_service():
+    """Test that a server without the health checking service is checked through the channel connectivity."""
+    requests = queue.Queue()
+    with EchoServer("insecure", health_service=False) as server:
+        connection = ChannelConnection("localhost", str(server._channel_kwargs["port"]))
+        connection._channel_close_grace = 0.1
+        responses = connection._channel.stream_stream(ECHO_STREAM_METHOD)(iter(requests.get, None))
+        connection.connect()
+        try:
+            _wait_for(lambda: connection._is_healthy)
+            # Calls in progress outlive many health checks.
+            time.sleep(0.5)
+            requests.put(b"payload")
+            assert next(responses) == b"payload"
+            assert connection._is_healthy
+            assert connection.reconnections == 0
+        finally:
+            requests.put(None)
+            connection.close()
+
+
+def test_health_monitor_not_serving():
+    """Test that the channel is kept while the server is reachable but not serving."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    servicer = health.HealthServicer()
+    servicer.set("", health_pb2.HealthCheckResponse.NOT_SERVING)
+    health_pb2_grpc.add_HealthServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    connection = ChannelConnection("localhost", str(port))
+    channel = connection._channel
+    connection.connect()
+    try:
+        _wait_for(lambda: connection._is_healthy is False)
+        time.sleep(0.5)
+        assert connection._is_healthy is False
+        assert connection.reconnections == 0
+        assert connection._channel is channel
+
+        servicer.set("", health_pb2.HealthCheckResponse.SERVING)
+        _wait_for(lambda: connection._is_healthy)
+    finally:
+        connection.close()
+        server.stop(grace=None)
+
+
+def test_reconnect_drains_previous_channel():
+    """Test that calls on the previous channel complete before it is closed."""
+    requests = queue.Queue()
+    with EchoServer("insecure") as server:
+        connection = ChannelConnection("localhost", str(server._channel_kwargs["port"]))
+        connection._channel_close_grace = 0.5
+        channel = connection._channel
+        responses = channel.stream_stream(ECHO_STREAM_METHOD)(iter(requests.get, None))
+        requests.put(b"first")
+        assert next(responses) == b"first"
+
+        connection._reconnect()
+        assert connection._channel is not channel
+        requests.put(b"second")
+        assert next(responses) == b"second"
+
+        # Once the grace period has elapsed, the previous channel is closed
+        # and the call is cancelled.
+        with pytest.raises(grpc.RpcError) as exc_info:
+            next(responses)
+        assert exc_info.value.code() == grpc.StatusCode.CANCELLED
+        requests.put(None)
+        connection.close()
+
+
+class AsyncEchoConnection(AbstractAsyncGRPCConnection):
+    """Asynchronous connection to the echo server."""
+
+    def __init__(self, host: str, port: str) -> None:
+        """Initialize the connection."""
+        self._host = host
+        self._port = port
+
+    async def connect(self) -> None:
+        """Wait until the channel is connected."""
+        await self._wait_for_channel_ready(timeout=10)
+
+    async def close(self) -> None:
+        """Close the channel."""
+        await self._close_channel()
+
+    @property
+    def service(self):
+        """Echo method."""
+        return self._channel.unary_unary(ECHO_UNARY_METHOD)
+
+
+def test_async_connection():
+    """Test concurrent asynchronous connections on one event loop."""
+
+    async def use_connection(port):
+        async with AsyncEchoConnection("localhost", str(port)) as connection:
+            assert not connection.is_closed
+            assert connection._channel is connection._channel
+            assert await connection.service(b"payload") == b"payload"
+        assert connection.is_closed
+
+    async def main(port):
+        await asyncio.gather(*(use_connection(port) for _ in range(10)))
+
+    with EchoServer("insecure") as server:
+        asyncio.run(main(server._channel_kwargs["port"]))
+
+
+def test_async_connection_cancelled_close():
+    """Test that the channel is closed even if closing is cancelled."""
+
+    async def main(port):
+        connection = AsyncEchoConnection("localhost", str(port))
+        await connection.connect()
+        channel = connection._channel
+        close_task = asyncio.create_task(connection.close())
+        await asyncio.sleep(0)
+        close_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await close_task
+        assert connection.is_closed
+        await asyncio.sleep(0.1)
+        with pytest.raises(grpc.aio.UsageError):
+            await channel.unary_unary(ECHO_UNARY_METHOD)(b"")
+
+    with EchoServer("insecure") as server:
+        asyncio.run(main(server._channel_kwargs["port"]))
+
+
+def test_async_connection_timeout():
+    """Test waiting for a server which is not running."""
+
+    async def main(port):
+        connection = AsyncEchoConnection("localhost", str(port))
+        with pytest.raises(TimeoutError, match="Could not connect"):
+            await connection._wait_for_channel_ready(timeout=0.1)
+        await connection.close()
+
+    with EchoServer("insecure") as server:
+        port = server._channel_kwargs["port"]
+    asyncio.run(main(port))
+
+
+@pytest.mark.skipif(not is_uds_supported(), reason="UDS is not supported.")
+def test_channel_transport_options():
+    """Test creating the channel from transport options, and preferring UDS for local servers."""
+    with EchoServer("uds") as server:
+        uds_file = server._channel_kwargs["uds_full_path"]
+        uds_options = UDSOptions(uds_service=uds_file.stem, uds_dir=uds_file.parent)
+
+        connection = ChannelConnection("remote-host", "50051")
+        connection._transport_options = uds_options
+        assert connection._channel._channel.target().decode() == f"unix:{uds_file}"
+        assert connection._channel.unary_unary(ECHO_UNARY_METHOD)(b"payload") == b"payload"
+        connection.close()
+
+        connection = ChannelConnection("localhost", "50051")
+        connection._uds_service = uds_options.uds_service
+        connection._uds_dir = uds_options.uds_dir
+        assert connection._channel._channel.target().decode() == f"unix:{uds_file}"
+        connection.close()
+
+        connection._uds_id = "missing"
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert connection._channel._channel.target().decode() == "dns:///localhost:50051"
+        connection.close()
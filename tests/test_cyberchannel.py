@@ -22,13 +22,23 @@
 
 """Tests for cyberchannel."""
 
+import asyncio
+from concurrent import futures
+import dataclasses
 import os
 from pathlib import Path
+import socket
 import tempfile
+import threading
+import time
+import uuid
 
+import grpc
 import pytest
 
 from ansys.tools.common import cyberchannel
+from ansys.tools.common.launcher.grpc_transport import InsecureOptions, UDSOptions
+from benchmarks.echo import ECHO_UNARY_METHOD, EchoServer
 
 
 def test_version_tuple():
@@ -68,6 +78,19 @@ def test_cyberchannel_functions():
         cyberchannel.verify_transport_mode(transport_mode="invalid_mode", mode="mode1")
 
 
+def test_get_transport_capabilities():
+    """Test the cached transport capabilities."""
+    capabilities = cyberchannel.get_transport_capabilities()
+    assert capabilities is cyberchannel.get_transport_capabilities()
+    assert capabilities.grpc_version == cyberchannel.version_tuple(grpc.__version__)
+    assert capabilities.grpc_version_ok == cyberchannel.check_grpc_version()
+    assert capabilities.uds == cyberchannel.is_uds_supported()
+    assert capabilities.wnua == (os.name == "nt")
+    assert capabilities.aio
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        capabilities.uds = False
+
+
 def test_cyberchannel_insecure():
     """Test cyberchannel insecure."""
     ch = cyberchannel.create_insecure_channel(host="localhost", port=12345)
@@ -99,3 +122,235 @@ def test_cyberchannel_uds():
     assert ch is not None
     assert ch._channel.target().decode() == f"unix:{cyberchannel.determine_uds_folder() / 'service_name.sock'}"
     assert not ch.close()
+
+
+@pytest.mark.skipif(
+    not cyberchannel.get_transport_capabilities().abstract_uds, reason="Abstract-namespace UDS requires Linux."
+)
+def test_cyberchannel_uds_abstract():
+    """Test cyberchannel with Linux abstract-namespace UDS sockets."""
+    ch = cyberchannel.create_uds_channel("service_name", uds_id="1", uds_abstract=True)
+    assert ch._channel.target().decode() == "unix-abstract:service_name-1"
+    assert not ch.close()
+
+    with pytest.raises(ValueError, match="cannot be used with abstract-namespace sockets"):
+        cyberchannel.create_uds_channel(uds_full_path="/tmp/service.sock", uds_abstract=True)
+
+    with EchoServer("uds", uds_abstract=True) as server:
+        uds_service = server._channel_kwargs["uds_service"]
+        assert cyberchannel.verify_uds_socket(uds_service, uds_abstract=True)
+        assert not cyberchannel.verify_uds_socket(uds_service, uds_id="other", uds_abstract=True)
+
+        channel = cyberchannel.create_channel(
+            **UDSOptions(uds_service=uds_service, uds_abstract=True)._to_cyberchannel_kwargs()
+        )
+        try:
+            assert channel.unary_unary(ECHO_UNARY_METHOD)(b"payload") == b"payload"
+        finally:
+            channel.close()
+
+
+def _listen_on_uds_later(uds_file: Path | str, delay: float) -> threading.Thread:
+    """Start listening on a UDS socket after a delay, in a background thread."""
+
+    def _listen():
+        time.sleep(delay)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(uds_file))
+        sock.listen()
+        stop_listening.wait()
+        sock.close()
+
+    stop_listening = threading.Event()
+    thread = threading.Thread(target=_listen, daemon=True)
+    thread.stop_listening = stop_listening  # type: ignore[attr-defined]
+    thread.start()
+    return thread
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX sockets are not available.")
+def test_wait_for_uds_socket(tmp_path):
+    """Test waiting for a UDS socket on which a server starts listening later."""
+    thread = _listen_on_uds_later(tmp_path / "service-1.sock", delay=0.2)
+    try:
+        assert not cyberchannel.verify_uds_socket("service", tmp_path, "1")
+        assert cyberchannel.wait_for_uds_socket("service", tmp_path, "1", timeout=10)
+        assert cyberchannel.verify_uds_socket("service", tmp_path, "1", check_listening=True)
+    finally:
+        thread.stop_listening.set()
+        thread.join()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX sockets are not available.")
+def test_wait_for_uds_socket_async(tmp_path):
+    """Test waiting for a UDS socket from a coroutine."""
+    thread = _listen_on_uds_later(tmp_path / "service.sock", delay=0.2)
+    try:
+        assert asyncio.run(cyberchannel.wait_for_uds_socket_async(uds_full_path=tmp_path / "service.sock", timeout=10))
+    finally:
+        thread.stop_listening.set()
+        thread.join()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX sockets are not available.")
+def test_wait_for_uds_socket_stale(tmp_path):
+    """Test that a socket file without a listening server is not considered ready."""
+    uds_file = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(uds_file))
+    assert uds_file.exists()
+    assert cyberchannel.verify_uds_socket(uds_full_path=uds_file)
+    assert not cyberchannel.verify_uds_socket(uds_full_path=uds_file, check_listening=True)
+    assert not cyberchannel.wait_for_uds_socket(uds_full_path=uds_file, timeout=0.2)
+    assert not asyncio.run(cyberchannel.wait_for_uds_socket_async(uds_full_path=uds_file, timeout=0.2))
+
+
+@pytest.mark.skipif(
+    not cyberchannel.get_transport_capabilities().abstract_uds, reason="Abstract-namespace UDS requires Linux."
+)
+def test_wait_for_uds_socket_abstract():
+    """Test waiting for a Linux abstract-namespace UDS socket."""
+    uds_service = f"wait-{uuid.uuid4().hex}"
+    thread = _listen_on_uds_later("\0" + uds_service + "-1", delay=0.2)
+    try:
+        assert not cyberchannel.wait_for_uds_socket(uds_service, uds_id="other", timeout=0.3, uds_abstract=True)
+        assert cyberchannel.wait_for_uds_socket(uds_service, uds_id="1", timeout=10, uds_abstract=True)
+        assert asyncio.run(
+            cyberchannel.wait_for_uds_socket_async(uds_service, uds_id="1", timeout=10, uds_abstract=True)
+        )
+    finally:
+        thread.stop_listening.set()
+        thread.join()
+
+    with pytest.raises(ValueError, match="cannot be used with abstract-namespace sockets"):
+        cyberchannel.wait_for_uds_socket(uds_full_path="/tmp/service.sock", uds_abstract=True)
+
+
+def test_parse_compression():
+    """Test converting the compression argument to a gRPC compression algorithm."""
+    assert cyberchannel._parse_compression(None) is None
+    assert cyberchannel._parse_compression("none") is None
+    assert cyberchannel._parse_compression("GZIP") == grpc.Compression.Gzip
+    assert cyberchannel._parse_compression(grpc.Compression.Deflate) == grpc.Compression.Deflate
+    with pytest.raises(ValueError, match="Unknown compression"):
+        cyberchannel._parse_compression("zstd")
+
+
+def test_compression_threshold_interceptor():
+    """Test that only requests above the threshold are compressed."""
+    interceptor = cyberchannel._CompressionThresholdInterceptor(grpc.Compression.Gzip, threshold=100)
+    call_details = cyberchannel._ClientCallDetails("/a.B/C", None, None, None, None, None)
+
+    def continuation(details, request):
+        return details.compression
+
+    assert interceptor.intercept_unary_unary(continuation, call_details, b"x" * 10) == grpc.Compression.NoCompression
+    assert interceptor.intercept_unary_unary(continuation, call_details, b"x" * 100) == grpc.Compression.Gzip
+    assert interceptor.intercept_stream_unary(continuation, call_details, iter([])) == grpc.Compression.Gzip
+    explicit_details = call_details._replace(compression=grpc.Compression.Deflate)
+    assert interceptor.intercept_unary_unary(continuation, explicit_details, b"x") == grpc.Compression.Deflate
+
+
+@pytest.mark.parametrize("compression_threshold", [None, 1024])
+def test_create_channel_compression(compression_threshold):
+    """Test creating a channel with message compression."""
+    with EchoServer("insecure", compression="gzip") as server:
+        channel = server.create_channel(compression="gzip", compression_threshold=compression_threshold)
+        try:
+            for payload in (b"small", b"large" * 1000):
+                assert channel.unary_unary(ECHO_UNARY_METHOD)(payload) == payload
+        finally:
+            channel.close()
+
+    with pytest.raises(ValueError, match="no 'compression' algorithm"):
+        cyberchannel.create_channel("insecure", host="localhost", port=12345, compression_threshold=10)
+
+
+def test_create_aio_channel():
+    """Test creating a grpc.aio channel."""
+
+    async def call(server):
+        # grpc.aio channels are bound to the event loop in which they are created
+        channel = server.create_channel(aio=True, compression="gzip")
+        assert isinstance(channel, grpc.aio.Channel)
+        try:
+            return await channel.unary_unary(ECHO_UNARY_METHOD)(b"payload")
+        finally:
+            await channel.close()
+
+    for transport_mode in ("insecure", "uds"):
+        with EchoServer(transport_mode) as server:
+            assert asyncio.run(call(server)) == b"payload"
+
+    with pytest.raises(ValueError, match="not supported for grpc.aio channels"):
+        cyberchannel.create_channel(
+            "insecure", host="localhost", port=12345, compression="gzip", compression_threshold=10, aio=True
+        )
+
+
+def test_transport_options_compression():
+    """Test that the compression options are passed from the transport options to cyberchannel."""
+    options = UDSOptions(uds_service="service_name", compression="deflate", compression_threshold=10)
+    assert options._to_cyberchannel_kwargs()["compression"] == "deflate"
+    assert options._to_cyberchannel_kwargs()["compression_threshold"] == 10
+    assert InsecureOptions(port=12345)._to_cyberchannel_kwargs()["compression"] is None
+
+
+def test_cyberchannel_multiple_targets(tmp_path):
+    """Test the targets of channels balancing the calls across several servers."""
+    ch = cyberchannel.create_insecure_channel(host="localhost", port=[12345, 12346])
+    assert ch._channel.target().decode() == "ipv4:127.0.0.1:12345,127.0.0.1:12346"
+    assert not ch.close()
+
+    ch = cyberchannel.create_insecure_channel(host="::1", port=[12345, 12346])
+    assert ch._channel.target().decode() == "ipv6:[::1]:12345,[::1]:12346"
+    assert not ch.close()
+
+    ch = cyberchannel.create_uds_channel("service_name", uds_dir=tmp_path, uds_id=["1", "2"])
+    assert (
+        ch._channel.target().decode() == f"unix:{tmp_path / 'service_name-1.sock'},{tmp_path / 'service_name-2.sock'}"
+    )
+    assert not ch.close()
+
+    with pytest.raises(ValueError, match="At least one port"):
+        cyberchannel.create_insecure_channel(host="localhost", port=[])
+
+
+def _start_named_server(name: str, address: str) -> grpc.Server:
+    """Start a server which replies to all calls with its name."""
+    handler = grpc.method_handlers_generic_handler(
+        "test.Named", {"Name": grpc.unary_unary_rpc_method_handler(lambda request, context: name.encode())}
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2), handlers=[handler])
+    server.add_insecure_port(address)
+    server.start()
+    return server
+
+
+@pytest.mark.skipif(not cyberchannel.is_uds_supported(), reason="UDS is not supported.")
+def test_create_channel_load_balancing(tmp_path):
+    """Test that the calls of a channel are distributed across all servers."""
+    servers = {name: _start_named_server(name, f"unix:{tmp_path / f'service-{name}.sock'}") for name in "abc"}
+    try:
+        channel = cyberchannel.create_channel("uds", uds_service="service", uds_dir=tmp_path, uds_id=list(servers))
+        grpc.channel_ready_future(channel).result(timeout=10)
+        call = channel.unary_unary("/test.Named/Name")
+
+        # Wait until the channel is connected to all servers
+        deadline = time.monotonic() + 10
+        replies = set()
+        while replies != {b"a", b"b", b"c"} and time.monotonic() < deadline:
+            replies.add(call(b"", wait_for_ready=True, timeout=10))
+        assert replies == {b"a", b"b", b"c"}
+        assert {call(b"", timeout=10) for _ in range(6)} == replies
+
+        # Stopped servers are skipped
+        servers.pop("b").stop(None).wait()
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and b"b" in {call(b"", timeout=10) for _ in range(3)}:
+            time.sleep(0.05)
+        assert {call(b"", timeout=10) for _ in range(10)} == {b"a", b"c"}
+        channel.close()
+    finally:
+        for server in servers.values():
+            server.stop(None)
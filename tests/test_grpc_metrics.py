@@ -0,0 +1,204 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the gRPC client metrics."""
+
+import asyncio
+import gc
+import time
+
+import grpc
+import pytest
+
+from ansys.tools.common.grpc_metrics import (
+    MetricsInterceptor,
+    MetricsRegistry,
+    create_aio_metrics_interceptors,
+    instrument_channel,
+)
+from benchmarks.echo import CONCAT_STREAM_METHOD, ECHO_STREAM_METHOD, ECHO_UNARY_METHOD, EchoServer
+
+
+@pytest.fixture(scope="module")
+def echo_server():
+    """Echo server listening on an insecure local port."""
+    with EchoServer("insecure") as server:
+        yield server
+
+
+def test_registry_record():
+    """Test recording metrics directly in the registry."""
+    registry = MetricsRegistry(latency_buckets=[0.1, 1.0])
+    registry.record("/a.B/C", latency=0.05, status_code=grpc.StatusCode.OK, request_bytes=3, response_bytes=4)
+    registry.record("/a.B/C", latency=0.5, status_code=grpc.StatusCode.UNAVAILABLE, request_bytes=3)
+    metrics = registry.snapshot()["/a.B/C"]
+    assert metrics.calls == 2
+    assert metrics.status_codes == {"OK": 1, "UNAVAILABLE": 1}
+    assert metrics.latency_buckets == ((0.1, 1), (1.0, 2), (float("inf"), 2))
+    assert metrics.latency_sum == pytest.approx(0.55)
+    assert metrics.request_bytes == 6
+    assert metrics.response_bytes == 4
+
+    text = registry.to_openmetrics()
+    assert 'grpc_client_calls_total{method="/a.B/C",code="UNAVAILABLE"} 1' in text
+    assert 'grpc_client_latency_seconds_bucket{method="/a.B/C",le="+Inf"} 2' in text
+    assert 'grpc_client_request_bytes_total{method="/a.B/C"} 6' in text
+    assert text.endswith("# EOF\n")
+
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_sync_interceptor(echo_server):
+    """Test the metrics recorded for unary and streaming calls on a channel."""
+    registry = MetricsRegistry()
+    channel = echo_server.create_channel(interceptors=[MetricsInterceptor(registry)])
+    try:
+        assert channel.unary_unary(ECHO_UNARY_METHOD)(b"x" * 10) == b"x" * 10
+        assert channel.unary_unary(ECHO_UNARY_METHOD).future(b"y" * 5).result() == b"y" * 5
+        responses = list(channel.stream_stream(ECHO_STREAM_METHOD)(iter([b"a" * 3, b"b" * 4])))
+        assert responses == [b"aaa", b"bbbb"]
+        with pytest.raises(grpc.RpcError):
+            channel.unary_unary("/does.not/Exist")(b"")
+    finally:
+        channel.close()
+
+    snapshot = registry.snapshot()
+    unary = snapshot[ECHO_UNARY_METHOD]
+    assert unary.calls == 2
+    assert unary.status_codes == {"OK": 2}
+    assert unary.request_bytes == unary.response_bytes == 15
+    stream = snapshot[ECHO_STREAM_METHOD]
+    assert stream.calls == 1
+    assert stream.request_bytes == stream.response_bytes == 7
+    assert snapshot["/does.not/Exist"].status_codes == {"UNIMPLEMENTED": 1}
+
+
+def test_instrument_channel(echo_server):
+    """Test instrumenting an existing channel."""
+    registry = MetricsRegistry()
+    channel = instrument_channel(echo_server.create_channel(), registry)
+    try:
+        channel.unary_unary(ECHO_UNARY_METHOD)(b"z")
+    finally:
+        channel.close()
+    assert registry.snapshot()[ECHO_UNARY_METHOD].calls == 1
+
+
+def test_aio_interceptor(echo_server):
+    """Test the metrics recorded for calls on a grpc.aio channel."""
+    registry = MetricsRegistry()
+
+    async def make_calls():
+        target = f"localhost:{echo_server._channel_kwargs['port']}"
+        async with grpc.aio.insecure_channel(target, interceptors=create_aio_metrics_interceptors(registry)) as channel:
+            assert await channel.unary_unary(ECHO_UNARY_METHOD)(b"x" * 10) == b"x" * 10
+
+            async def requests():
+                for request in (b"a" * 3, b"b" * 4):
+                    yield request
+
+            responses = [response async for response in channel.stream_stream(ECHO_STREAM_METHOD)(requests())]
+            assert responses == [b"aaa", b"bbbb"]
+            with pytest.raises(grpc.aio.AioRpcError):
+                await channel.unary_unary("/does.not/Exist")(b"")
+
+    asyncio.run(make_calls())
+    snapshot = registry.snapshot()
+    assert snapshot[ECHO_UNARY_METHOD].response_bytes == 10
+    assert snapshot[ECHO_STREAM_METHOD].request_bytes == snapshot[ECHO_STREAM_METHOD].response_bytes == 7
+    assert snapshot[ECHO_STREAM_METHOD].status_codes == {"OK": 1}
+    assert snapshot["/does.not/Exist"].status_codes == {"UNIMPLEMENTED": 1}
+
+
+def test_stream_stopped_early(echo_server):
+    """Test that streaming calls are recorded when the responses are not all consumed."""
+    registry = MetricsRegistry()
+    channel = echo_server.create_channel(interceptors=[MetricsInterceptor(registry)])
+    try:
+        call = channel.stream_stream(ECHO_STREAM_METHOD)(iter([b"a" * 3, b"b" * 4]))
+        assert next(call) == b"aaa"
+        call.cancel()
+
+        call = channel.stream_stream(ECHO_STREAM_METHOD)(iter([b"c" * 3, b"d" * 4]))
+        assert next(call) == b"ccc"
+        del call
+        gc.collect()
+        assert registry.snapshot()[ECHO_STREAM_METHOD].status_codes == {"CANCELLED": 2}
+    finally:
+        channel.close()
+
+
+def test_stream_done_but_not_consumed(echo_server):
+    """Test that a finished streaming call is recorded with its status when the end of the stream is not read."""
+    registry = MetricsRegistry()
+    channel = echo_server.create_channel(interceptors=[MetricsInterceptor(registry)])
+    try:
+        call = channel.stream_stream(ECHO_STREAM_METHOD)(iter([b"a" * 3, b"b" * 4]))
+        assert [next(call), next(call)] == [b"aaa", b"bbbb"]
+        deadline = time.monotonic() + 5
+        while not call.done() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        del call
+        gc.collect()
+        metrics = registry.snapshot()[ECHO_STREAM_METHOD]
+        assert metrics.status_codes == {"OK": 1}
+        assert metrics.response_bytes == 7
+    finally:
+        channel.close()
+
+
+def test_aio_stream_stopped_early(echo_server):
+    """Test that streaming calls on a grpc.aio channel are recorded when the responses are not all consumed."""
+    registry = MetricsRegistry()
+
+    async def make_calls():
+        target = f"localhost:{echo_server._channel_kwargs['port']}"
+        async with grpc.aio.insecure_channel(target, interceptors=create_aio_metrics_interceptors(registry)) as channel:
+            call = channel.stream_stream(ECHO_STREAM_METHOD)(iter([b"a" * 3, b"b" * 4]))
+            async for response in call:
+                assert response == b"aaa"
+                break
+            call.cancel()
+            await asyncio.sleep(0.1)
+            assert registry.snapshot()[ECHO_STREAM_METHOD].status_codes == {"CANCELLED": 1}
+
+    asyncio.run(make_calls())
+
+
+def test_aio_interceptor_write_requests(echo_server):
+    """Test that requests can be written to an instrumented grpc.aio stream-unary call."""
+    registry = MetricsRegistry()
+
+    async def make_call():
+        target = f"localhost:{echo_server._channel_kwargs['port']}"
+        async with grpc.aio.insecure_channel(target, interceptors=create_aio_metrics_interceptors(registry)) as channel:
+            call = channel.stream_unary(CONCAT_STREAM_METHOD)()
+            await asyncio.wait_for(call.write(b"a" * 3), timeout=5)
+            await asyncio.wait_for(call.write(b"b" * 4), timeout=5)
+            await asyncio.wait_for(call.done_writing(), timeout=5)
+            assert await asyncio.wait_for(call, timeout=5) == b"aaabbbb"
+
+    asyncio.run(make_call())
+    metrics = registry.snapshot()[CONCAT_STREAM_METHOD]
+    assert metrics.status_codes == {"OK": 1}
+    assert metrics.request_bytes == metrics.response_bytes == 7
@@ -0,0 +1,99 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the shared-memory side channel."""
+
+from multiprocessing import shared_memory
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from ansys.tools.common.shared_memory import SharedMemoryHandle, SharedMemoryRing, is_shared_memory_possible
+
+
+def test_shared_memory_handle_to_bytes():
+    """Test serializing a shared memory handle."""
+    handle = SharedMemoryHandle(name="ring", position=2**40, size=123)
+    assert SharedMemoryHandle.from_bytes(handle.to_bytes()) == handle
+
+
+def test_shared_memory_ring():
+    """Test writing, reading and releasing payloads in a ring attached by name."""
+    with SharedMemoryRing(100) as ring, SharedMemoryRing.attach(ring.name) as consumer:
+        assert consumer.capacity == 100
+
+        first = ring.write(b"a" * 60)
+        with consumer.read(SharedMemoryHandle.from_bytes(first.to_bytes())) as payload:
+            assert payload == b"a" * 60
+        consumer.release(first)
+
+        # The payload does not fit before the end of the ring, so it is written at its beginning
+        second = ring.write(bytearray(b"b" * 60))
+        assert second.position % ring.capacity == 0
+        with consumer.read(second) as payload:
+            assert payload == b"b" * 60
+
+        with pytest.raises(TimeoutError):
+            ring.write(b"c" * 50, timeout=0.01)
+        consumer.release(second)
+        third = ring.write(memoryview(b"c" * 50), timeout=0.01)
+        with consumer.read(third) as payload:
+            assert payload == b"c" * 50
+
+
+def test_shared_memory_ring_rounded_size():
+    """Test attaching to a ring whose shared memory block is rounded up to the page size."""
+    with SharedMemoryRing(1000) as ring:
+        # On macOS and Windows, the size of the attached block is a multiple of the page size
+        with patch.object(shared_memory.SharedMemory, "size", new_callable=PropertyMock, return_value=4096):
+            consumer = SharedMemoryRing.attach(ring.name)
+        with consumer:
+            assert consumer.capacity == ring.capacity == 1000
+            for i in range(5):
+                handle = ring.write(bytes([i]) * 300)
+                with consumer.read(handle) as payload:
+                    assert payload == bytes([i]) * 300
+                consumer.release(handle)
+
+
+def test_shared_memory_ring_errors():
+    """Test writing payloads which do not fit, and reading foreign handles."""
+    with SharedMemoryRing(10) as ring:
+        with pytest.raises(ValueError, match="does not fit"):
+            ring.write(b"x" * 11)
+        with pytest.raises(ValueError, match="refers to the ring"):
+            ring.read(SharedMemoryHandle(name="other", position=0, size=1))
+    with pytest.raises(ValueError, match="must be positive"):
+        SharedMemoryRing(0)
+
+
+@pytest.mark.parametrize(
+    "transport_mode, host, expected",
+    [
+        ("uds", None, True),
+        ("insecure", "localhost", True),
+        ("mtls", "remote-host", False),
+    ],
+)
+def test_is_shared_memory_possible(transport_mode, host, expected):
+    """Test checking if a server runs on the same host."""
+    assert is_shared_memory_possible(transport_mode, host) is expected
@@ -0,0 +1,93 @@
+# Copyright (C) 2025 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the streaming helpers."""
+
+from array import array
+import os
+
+import pytest
+
+from ansys.tools.common.streaming import assemble_chunks, iter_chunks, iter_messages
+from benchmarks.echo import ECHO_STREAM_METHOD, EchoServer
+
+
+def test_iter_chunks():
+    """Test splitting buffers into chunks without copying them."""
+    payload = bytearray(b"0123456789")
+    chunks = list(iter_chunks(payload, chunk_size=4))
+    assert [bytes(chunk) for chunk in chunks] == [b"0123", b"4567", b"89"]
+    payload[0:1] = b"x"
+    assert bytes(chunks[0]) == b"x123"
+
+    values = array("d", range(10))
+    assert sum(chunk.nbytes for chunk in iter_chunks(values, chunk_size=16)) == 80
+    assert list(iter_chunks(b"")) == []
+
+    with pytest.raises(ValueError, match="must be positive"):
+        next(iter_chunks(payload, chunk_size=0))
+    with pytest.raises(ValueError, match="C-contiguous"):
+        next(iter_chunks(memoryview(payload)[::2]))
+
+
+def test_iter_messages_is_lazy():
+    """Test that the messages are only created as the iterator is consumed."""
+    created = []
+    messages = iter_messages(b"x" * 10, lambda chunk: created.append(bytes(chunk)) or len(created), chunk_size=3)
+    assert created == []
+    assert next(messages) == 1
+    assert created == [b"xxx"]
+    assert list(messages) == [2, 3, 4]
+
+
+def test_assemble_chunks():
+    """Test reassembling chunks into a single buffer."""
+    chunks = [b"0123", b"4567", b"89"]
+    assert assemble_chunks(chunks) == bytearray(b"0123456789")
+    assert assemble_chunks(iter(chunks), total_size=10) == bytearray(b"0123456789")
+
+    values = array("d", range(10))
+    out = array("d", bytes(80))
+    assert assemble_chunks(iter_chunks(values, chunk_size=24), out=out) is out
+    assert out == values
+
+    wrapped = [type("Response", (), {"data": chunk})() for chunk in chunks]
+    assert assemble_chunks(wrapped, total_size=10, get_data=lambda response: response.data) == b"0123456789"
+
+    with pytest.raises(ValueError, match="larger than the output buffer"):
+        assemble_chunks(chunks, total_size=8)
+    with pytest.raises(ValueError, match="payload has 10 bytes"):
+        assemble_chunks(chunks, total_size=12)
+    with pytest.raises(ValueError, match="writable"):
+        assemble_chunks(chunks, out=b"x" * 10)
+
+
+def test_stream_chunks():
+    """Test streaming a payload in chunks to an echo server and reassembling the response."""
+    payload = os.urandom(5 * 1024**2 + 3)
+    with EchoServer("insecure") as server:
+        channel = server.create_channel(grpc_options=[("grpc.max_receive_message_length", 1024**2)])
+        try:
+            responses = channel.stream_stream(ECHO_STREAM_METHOD)(iter_messages(payload, bytes))
+            assert assemble_chunks(responses, total_size=len(payload)) == payload
+        finally:
+            channel.close()